@@ -0,0 +1,614 @@
+#######################################
+# BYTECODE
+#######################################
+from enum import IntEnum
+
+from TechZen.token_ import TokenType, Keywords
+from TechZen.types.number_ import Number
+from TechZen.types.string_ import String
+from TechZen import nodes_
+
+
+class OpCode(IntEnum):
+    LOAD_CONST = 1
+    LOAD_NULL = 2
+    LOAD_NAME = 3
+    STORE_NAME = 4
+    STORE_ATTR = 5
+    ENTER_MEMBER = 6
+    EXIT_MEMBER = 7
+    POP_TOP = 8
+    BUILD_LIST = 9
+    BUILD_DICT = 10
+    LIST_APPEND = 11
+    BINARY_ADD = 12
+    BINARY_SUB = 13
+    BINARY_MUL = 14
+    BINARY_DIV = 15
+    BINARY_FLOOR_DIV = 16
+    BINARY_POW = 17
+    BINARY_MOD = 18
+    COMPARE_EQ = 19
+    COMPARE_NE = 20
+    COMPARE_LT = 21
+    COMPARE_GT = 22
+    COMPARE_LTE = 23
+    COMPARE_GTE = 24
+    BINARY_AND = 25
+    BINARY_OR = 26
+    UNARY_NEGATIVE = 27
+    UNARY_NOT = 28
+    JUMP = 29
+    POP_JUMP_IF_FALSE = 30
+    FOR_PREP = 31
+    FOR_ITER = 32
+    SETUP_LOOP = 33
+    SETUP_TRY = 34
+    POP_BLOCK = 35
+    BREAK_LOOP = 36
+    CONTINUE_LOOP = 37
+    MAKE_FUNCTION = 38
+    MAKE_CLASS = 39
+    CALL = 40
+    RETURN_VALUE = 41
+    END = 42
+    INCLUDE = 43
+    LOAD_LOCAL = 44
+    STORE_LOCAL = 45
+    LOAD_GLOBAL = 46
+    TAIL_CALL = 47
+
+    def __str__(self):
+        return self.name
+
+
+BINARY_OPCODES = {
+    TokenType.TT_PLUS: OpCode.BINARY_ADD,
+    TokenType.TT_MINUS: OpCode.BINARY_SUB,
+    TokenType.TT_MUL: OpCode.BINARY_MUL,
+    TokenType.TT_DIV: OpCode.BINARY_DIV,
+    TokenType.TT_DFL: OpCode.BINARY_FLOOR_DIV,
+    TokenType.TT_POW: OpCode.BINARY_POW,
+    TokenType.TT_MOD: OpCode.BINARY_MOD,
+    TokenType.TT_EE: OpCode.COMPARE_EQ,
+    TokenType.TT_NE: OpCode.COMPARE_NE,
+    TokenType.TT_LT: OpCode.COMPARE_LT,
+    TokenType.TT_GT: OpCode.COMPARE_GT,
+    TokenType.TT_LTE: OpCode.COMPARE_LTE,
+    TokenType.TT_GTE: OpCode.COMPARE_GTE,
+    Keywords.KW_AND.value: OpCode.BINARY_AND,
+    Keywords.KW_OR.value: OpCode.BINARY_OR,
+}
+
+# The Value method every binary opcode calls.
+BINARY_METHODS = {
+    OpCode.BINARY_ADD: "added_to",
+    OpCode.BINARY_SUB: "subbed_by",
+    OpCode.BINARY_MUL: "multed_by",
+    OpCode.BINARY_DIV: "dived_by",
+    OpCode.BINARY_FLOOR_DIV: "floor_of",
+    OpCode.BINARY_POW: "pow_of",
+    OpCode.BINARY_MOD: "mod_by",
+    OpCode.COMPARE_EQ: "get_comparison_eq",
+    OpCode.COMPARE_NE: "get_comparison_ne",
+    OpCode.COMPARE_LT: "get_comparison_lt",
+    OpCode.COMPARE_GT: "get_comparison_gt",
+    OpCode.COMPARE_LTE: "get_comparison_lte",
+    OpCode.COMPARE_GTE: "get_comparison_gte",
+    OpCode.BINARY_AND: "anded_by",
+    OpCode.BINARY_OR: "ored_by",
+}
+
+# Opcodes whose argument is a jump target.
+JUMP_OPCODES = (
+    OpCode.JUMP,
+    OpCode.POP_JUMP_IF_FALSE,
+    OpCode.FOR_ITER,
+    OpCode.SETUP_LOOP,
+    OpCode.SETUP_TRY,
+    OpCode.ENTER_MEMBER,
+)
+
+
+class Code:
+    def __init__(self, name):
+        """
+        A compiled piece of TechZen code (a program, a function body or a class body).
+        The instructions are a flat list of opcode and argument pairs, so instruction n starts at index 2 * n.
+        :param name: Name of the program, function or class
+        """
+        self.name = name
+        self.instructions = []
+        self.constants = []
+        self.names = []
+        self.local_names = []
+        self.nodes = []
+
+    def emit(self, op, arg=0, node=None):
+        """
+        Add an instruction.
+        :param op: OpCode
+        :param arg: Argument of the instruction
+        :param node: Node the instruction belongs to, used for error messages
+        :return: Index of the instruction in the instructions list
+        """
+        self.instructions.append(int(op))
+        self.instructions.append(arg)
+        self.nodes.append(node)
+        return len(self.instructions) - 2
+
+    def patch(self, index, target=None):
+        """
+        Set the argument of a jump instruction.
+        :param index: Index of the instruction
+        :param target: Jump target, by default the next instruction to be emitted
+        :return: nothing
+        """
+        self.instructions[index + 1] = (
+            len(self.instructions) if target is None else target
+        )
+
+    def add_constant(self, value):
+        """
+        Add a constant.
+        :param value: Constant value
+        :return: Index of the constant
+        """
+        self.constants.append(value)
+        return len(self.constants) - 1
+
+    def add_name(self, name):
+        """
+        Add a variable name, names are shared by all instructions in the code.
+        :param name: Variable name
+        :return: Index of the name
+        """
+        if name in self.names:
+            return self.names.index(name)
+        self.names.append(name)
+        return len(self.names) - 1
+
+    def disassemble(self):
+        """
+        Makes a readable listing of the instructions.
+        :return: Listing
+        """
+        lines = []
+        for index in range(0, len(self.instructions), 2):
+            op, arg = OpCode(self.instructions[index]), self.instructions[index + 1]
+            if op in (OpCode.LOAD_NAME, OpCode.STORE_NAME, OpCode.LOAD_GLOBAL):
+                detail = f"{arg} ({self.names[arg]})"
+            elif op in (OpCode.LOAD_LOCAL, OpCode.STORE_LOCAL):
+                detail = f"{arg} ({self.local_names[arg]})"
+            elif op == OpCode.LOAD_CONST:
+                detail = f"{arg} ({self.constants[arg]!r})"
+            elif op in JUMP_OPCODES:
+                detail = f"-> {arg}"
+            else:
+                detail = str(arg)
+            lines.append(f"{index:>6} {op.name:<18} {detail}")
+        return "\n".join(lines)
+
+    def __repr__(self):
+        return f"<code {self.name}>"
+
+
+class FunctionTemplate:
+    def __init__(
+        self, name, arg_names, should_auto_return, body_node, code, slot_index=None
+    ):
+        """
+        Everything MAKE_FUNCTION needs to create a function value.
+        :param name: Function name
+        :param arg_names: Function arguments
+        :param should_auto_return: True or False
+        :param body_node: Function code as node
+        :param code: Function code as bytecode
+        :param slot_index: Slots of the arguments and local variables, given by the Resolver
+        """
+        self.name = name
+        self.arg_names = arg_names
+        self.should_auto_return = should_auto_return
+        self.body_node = body_node
+        self.code = code
+        self.slot_index = slot_index
+
+    def __repr__(self):
+        return f"<function template {self.name or '<anonymous>'}>"
+
+
+class BytecodeCompiler:
+    def __init__(self, code):
+        """
+        Compiles nodes into the instructions of one Code object.
+        :param code: Code to add the instructions to
+        """
+        self.code = code
+
+    @classmethod
+    def compile_program(cls, node, name="<program>"):
+        """
+        Compiles a whole program. Its result is the list of the values of all statements, like in the interpreter.
+        :param node: Parsed node
+        :param name: Name of the program
+        :return: Code
+        """
+        compiler = cls(Code(name))
+        compiler.compile(node)
+        compiler.code.emit(OpCode.END, node=node)
+        return compiler.code
+
+    @classmethod
+    def compile_function(cls, name, body_node, should_auto_return, slot_index, node):
+        """
+        Compiles the body of a function into the code of its frames.
+        :param name: Function name
+        :param body_node: Function code as node
+        :param should_auto_return: True or False
+        :param slot_index: Slots of the arguments and local variables, given by the Resolver
+        :param node: Node the end of the function is at
+        :return: Code
+        """
+        body = cls(Code(name or "<anonymous>"))
+        body.code.local_names = list(slot_index or ())
+        if should_auto_return:
+            body.compile(body_node)
+        else:
+            body.compile_statements(body_node)
+            body.code.emit(OpCode.LOAD_NULL)
+        body.code.emit(OpCode.END, 0, node)
+        return body.code
+
+    def compile(self, node):
+        """
+        Compiles a node into instructions that push exactly one value onto the stack.
+        :param node: Parsed node
+        :return: nothing
+        """
+        self.dispatch_table.get(type(node), BytecodeCompiler.no_compile_method)(
+            self, node
+        )
+
+    def compile_statements(self, node):
+        """
+        Compiles a block of statements whose values are not used, so nothing is pushed onto the stack.
+        :param node: ListNode with statements
+        :return: nothing
+        """
+        if isinstance(node, nodes_.ListNode):
+            for statement in node.element_nodes:
+                self.compile(statement)
+                self.code.emit(OpCode.POP_TOP)
+        else:
+            self.compile(node)
+            self.code.emit(OpCode.POP_TOP)
+
+    def no_compile_method(self, node):
+        """
+        This is the method it returns when the node requested doesn't exist.
+        :param node: Parsed node
+        :return: error
+        """
+        raise Exception(f"No compile_{type(node).__name__} method defined")
+
+    def compile_NumberNode(self, node):
+        """
+        NumberNode method
+        :param node: Parsed node
+        :return: nothing
+        """
+        self.code.emit(OpCode.LOAD_CONST, self.code.add_constant(node.constant), node)
+
+    def compile_StringNode(self, node):
+        """
+        StringNode method
+        :param node: Parsed node
+        :return: nothing
+        """
+        value = String(node.token.value).set_pos(node.pos_start, node.pos_end)
+        self.code.emit(OpCode.LOAD_CONST, self.code.add_constant(value), node)
+
+    def compile_ListNode(self, node):
+        """
+        ListNode method
+        :param node: Parsed node
+        :return: nothing
+        """
+        for element_node in node.element_nodes:
+            self.compile(element_node)
+        self.code.emit(OpCode.BUILD_LIST, len(node.element_nodes), node)
+
+    def compile_DictNode(self, node):
+        """
+        DictNode method
+        :param node: Parsed node
+        :return: nothing
+        """
+        for key, value in node.element_nodes.items():
+            self.compile(key)
+            self.compile(value)
+        self.code.emit(OpCode.BUILD_DICT, len(node.element_nodes), node)
+
+    def compile_VarAccessNode(self, node):
+        """
+        VarAccessNode method
+        :param node: Parsed node
+        :return: nothing
+        """
+        if node.slot is not None:
+            self.code.emit(OpCode.LOAD_LOCAL, node.slot, node)
+        elif node.is_global:
+            self.code.emit(
+                OpCode.LOAD_GLOBAL, self.code.add_name(node.var_name_token.value), node
+            )
+        else:
+            self.code.emit(
+                OpCode.LOAD_NAME, self.code.add_name(node.var_name_token.value), node
+            )
+        if node.child:
+            # ENTER_MEMBER jumps past EXIT_MEMBER when it reads the members itself (see Instance.get_attribute)
+            enter_member = self.code.emit(OpCode.ENTER_MEMBER, 0, node)
+            self.compile(node.child)
+            self.code.emit(OpCode.EXIT_MEMBER, 0, node)
+            self.code.patch(enter_member)
+
+    def compile_VarAssignNode(self, node):
+        """
+        VarAssignNode method
+        :param node: Parsed node
+        :return: nothing
+        """
+        self.compile(node.value_node)
+        if node.extra_names:
+            self.code.emit(OpCode.STORE_ATTR, 0, node)
+        elif node.slot is not None:
+            self.code.emit(OpCode.STORE_LOCAL, node.slot, node)
+        else:
+            self.code.emit(
+                OpCode.STORE_NAME, self.code.add_name(node.var_name_token.value), node
+            )
+
+    def compile_BinOpNode(self, node):
+        """
+        BinOpNode method
+        :param node: Parsed node
+        :return: nothing
+        """
+        op_token = node.op_token
+        opcode = BINARY_OPCODES.get(
+            op_token.value.upper()
+            if op_token.type == TokenType.TT_KEYWORD
+            else op_token.type
+        )
+        self.compile(node.left_node)
+        self.compile(node.right_node)
+        self.code.emit(opcode, 0, node)
+
+    def compile_UnaryOpNode(self, node):
+        """
+        UnaryOpNode method
+        :param node: Parsed node
+        :return: nothing
+        """
+        self.compile(node.node)
+        if node.op_token.type == TokenType.TT_MINUS:
+            self.code.emit(OpCode.UNARY_NEGATIVE, 0, node)
+        elif node.op_token.matches(TokenType.TT_KEYWORD, Keywords.KW_NOT.value):
+            self.code.emit(OpCode.UNARY_NOT, 0, node)
+
+    def compile_body(self, node, should_return_null):
+        """
+        Compiles the body of an if case, which pushes NULL when it is a block of statements.
+        :param node: Parsed node
+        :param should_return_null: True or False
+        :return: nothing
+        """
+        if should_return_null:
+            self.compile_statements(node)
+            self.code.emit(OpCode.LOAD_NULL)
+        else:
+            self.compile(node)
+
+    def compile_IfNode(self, node):
+        """
+        IfNode method
+        :param node: Parsed node
+        :return: nothing
+        """
+        end_jumps = []
+        for condition, expr, should_return_null in node.cases:
+            self.compile(condition)
+            next_case = self.code.emit(OpCode.POP_JUMP_IF_FALSE, 0, condition)
+            self.compile_body(expr, should_return_null)
+            end_jumps.append(self.code.emit(OpCode.JUMP))
+            self.code.patch(next_case)
+
+        if node.else_case:
+            expr, should_return_null = node.else_case
+            self.compile_body(expr, should_return_null)
+        else:
+            self.code.emit(OpCode.LOAD_NULL)
+
+        for end_jump in end_jumps:
+            self.code.patch(end_jump)
+
+    def compile_loop_body(self, node, should_return_null, list_depth):
+        """
+        Compiles the body of a for or while loop. Its value is added to the list of results, unless the loop returns
+        NULL anyway.
+        :param node: Parsed node
+        :param should_return_null: True or False
+        :param list_depth: Position of the list of results on the stack, counted from the top
+        :return: nothing
+        """
+        if should_return_null:
+            self.compile_statements(node)
+        else:
+            self.compile(node)
+            self.code.emit(OpCode.LIST_APPEND, list_depth)
+
+    def compile_ForNode(self, node):
+        """
+        ForNode method
+        :param node: Parsed node
+        :return: nothing
+        """
+        if not node.should_return_null:
+            self.code.emit(OpCode.BUILD_LIST, 0, node)
+        self.compile(node.start_value_node)
+        self.compile(node.end_value_node)
+        if node.step_value_node:
+            self.compile(node.step_value_node)
+        else:
+            self.code.emit(OpCode.LOAD_CONST, self.code.add_constant(Number.of(1)))
+        self.code.emit(OpCode.FOR_PREP, 0, node)
+
+        setup = self.code.emit(OpCode.SETUP_LOOP, 0, node)
+        loop_top = self.code.emit(OpCode.FOR_ITER, 0, node)
+        if node.slot is not None:
+            self.code.emit(OpCode.STORE_LOCAL, node.slot, node)
+        else:
+            self.code.emit(
+                OpCode.STORE_NAME, self.code.add_name(node.var_name_token.value), node
+            )
+        self.code.emit(OpCode.POP_TOP)
+        self.compile_loop_body(node.body_node, node.should_return_null, 2)
+        self.code.emit(OpCode.JUMP, loop_top)
+
+        self.code.patch(loop_top)
+        self.code.emit(OpCode.POP_BLOCK)
+        self.code.patch(setup)
+        self.code.emit(OpCode.POP_TOP)
+        if node.should_return_null:
+            self.code.emit(OpCode.LOAD_NULL)
+
+    def compile_WhileNode(self, node):
+        """
+        WhileNode method
+        :param node: Parsed node
+        :return: nothing
+        """
+        if not node.should_return_null:
+            self.code.emit(OpCode.BUILD_LIST, 0, node)
+
+        setup = self.code.emit(OpCode.SETUP_LOOP, 0, node)
+        loop_top = len(self.code.instructions)
+        self.compile(node.condition_node)
+        exit_jump = self.code.emit(OpCode.POP_JUMP_IF_FALSE, 0, node)
+        self.compile_loop_body(node.body_node, node.should_return_null, 1)
+        self.code.emit(OpCode.JUMP, loop_top)
+
+        self.code.patch(exit_jump)
+        self.code.emit(OpCode.POP_BLOCK)
+        self.code.patch(setup)
+        if node.should_return_null:
+            self.code.emit(OpCode.LOAD_NULL)
+
+    def compile_FuncDefNode(self, node):
+        """
+        FuncDefNode method
+        :param node: Parsed node
+        :return: nothing
+        """
+        func_name = node.var_name_token.value if node.var_name_token else None
+        template = FunctionTemplate(
+            func_name,
+            [arg_name.value for arg_name in node.arg_name_tokens],
+            node.should_auto_return,
+            node.body_node,
+            self.compile_function(
+                func_name,
+                node.body_node,
+                node.should_auto_return,
+                node.slot_index,
+                node,
+            ),
+            node.slot_index,
+        )
+        self.code.emit(OpCode.MAKE_FUNCTION, self.code.add_constant(template), node)
+        if func_name:
+            self.code.emit(OpCode.STORE_NAME, self.code.add_name(func_name), node)
+
+    def compile_CallNode(self, node):
+        """
+        CallNode method. A tail call of the function to itself runs in the frame of the call that makes it.
+        :param node: Parsed node
+        :return: nothing
+        """
+        self.compile(node.node_to_call)
+        for arg_node in node.arg_nodes:
+            self.compile(arg_node)
+        op = OpCode.CALL if node.tail_body is None else OpCode.TAIL_CALL
+        self.code.emit(op, len(node.arg_nodes), node)
+
+    def compile_ReturnNode(self, node):
+        """
+        ReturnNode method
+        :param node: Parsed node
+        :return: nothing
+        """
+        if node.node_to_return:
+            self.compile(node.node_to_return)
+        else:
+            self.code.emit(OpCode.LOAD_NULL)
+        self.code.emit(OpCode.RETURN_VALUE, 0, node)
+
+    def compile_ContinueNode(self, node):
+        """
+        ContinueNode method
+        :param node: Parsed node
+        :return: nothing
+        """
+        self.code.emit(OpCode.CONTINUE_LOOP, 0, node)
+        self.code.emit(OpCode.LOAD_NULL)
+
+    def compile_BreakNode(self, node):
+        """
+        BreakNode method
+        :param node: Parsed node
+        :return: nothing
+        """
+        self.code.emit(OpCode.BREAK_LOOP, 0, node)
+        self.code.emit(OpCode.LOAD_NULL)
+
+    def compile_ClassNode(self, node):
+        """
+        ClassNode method
+        :param node: Parsed node
+        :return: nothing
+        """
+        body = BytecodeCompiler(Code(node.class_name_token.value))
+        body.compile_statements(node.body_nodes)
+        body.code.emit(OpCode.LOAD_NULL)
+        body.code.emit(OpCode.END, 0, node)
+        self.code.emit(OpCode.MAKE_CLASS, self.code.add_constant(body.code), node)
+
+    def compile_TryNode(self, node):
+        """
+        TryNode method
+        :param node: Parsed node
+        :return: nothing
+        """
+        setup = self.code.emit(OpCode.SETUP_TRY, 0, node)
+        self.compile_statements(node.try_statements)
+        self.code.emit(OpCode.POP_BLOCK)
+        end_jump = self.code.emit(OpCode.JUMP)
+        self.code.patch(setup)
+        self.compile_statements(node.except_statements)
+        self.code.patch(end_jump)
+        self.code.emit(OpCode.LOAD_NULL)
+
+    def compile_IncludeNode(self, node):
+        """
+        IncludeNode method
+        :param node: Parsed node
+        :return: nothing
+        """
+        self.code.emit(OpCode.INCLUDE, 0, node)
+
+
+BytecodeCompiler.dispatch_table = {
+    node_class: getattr(BytecodeCompiler, f"compile_{name}")
+    for name, node_class in vars(nodes_).items()
+    if isinstance(node_class, type) and hasattr(BytecodeCompiler, f"compile_{name}")
+}
@@ -0,0 +1,380 @@
+#######################################
+# COMPILED MODULE CACHE
+#######################################
+import gc
+import hashlib
+import mmap
+import os
+import pickle
+import sys
+import zlib
+
+import TechZen
+
+CACHE_DIR = "__tzcache__"
+CACHE_SUFFIX = ".tzc"
+# Changes when the layout of .tzc files changes. A change of the nodes does not need a new MAGIC, see NODE_MODULES
+MAGIC = b"TZC\x0a"
+
+# The modules that make the parsed nodes or define the objects in them, relative to the package. The hash of their code
+# is part of the key of every cache file, so a cache of nodes from another version of them (like other __slots__) is
+# never read.
+NODE_MODULES = (
+    "nodes_.py",
+    "token_.py",
+    "position_.py",
+    "lexer_.py",
+    "parser_.py",
+    "operations_.py",
+    os.path.join("types", "value_.py"),
+    os.path.join("types", "number_.py"),
+)
+
+# Set to False to always lex and parse, without reading or writing .tzc files.
+enabled = True
+
+# Worker processes that preload parses included files in, before the program runs. 0 (the default) or 1 turns
+# preloading off, include then parses each file when it runs. Only the shell sets it, to pool_workers(). Where worker
+# processes are spawned (macOS, Windows), they import the __main__ module, so a script that sets it must call Runner.run
+# under `if __name__ == "__main__":`.
+preload_workers = 0
+
+# Fewest files a program must include for preload to start a process pool, fewer are parsed faster by include.
+PRELOAD_POOL_FILES = 4
+
+# Most worker processes pool_workers suggests, more make little difference for the files of a program.
+MAX_PRELOAD_WORKERS = 4
+
+# Parsed nodes of included files that preload loaded before the program ran, by file name, with their cache key.
+# Runner.run removes the ones include did not use when the program ends.
+preloaded = {}
+
+
+def node_code_hash(directory=None):
+    """
+    Hashes the code of NODE_MODULES.
+    :param directory: Directory of the package, None for this one
+    :return: Hash (32 bytes)
+    """
+    directory = directory or os.path.dirname(os.path.abspath(__file__))
+    key = hashlib.sha256()
+    for name in NODE_MODULES:
+        with open(os.path.join(directory, name), "rb") as f:
+            key.update(f.read())
+        key.update(b"\0")
+    return key.digest()
+
+
+NODE_CODE_HASH = node_code_hash()
+
+
+def pool_workers():
+    """
+    The number of worker processes for a script that wants to parse included files in a process pool (see
+    preload_workers): the CPUs this process may use, at most MAX_PRELOAD_WORKERS.
+    :return: Number of workers
+    """
+    if hasattr(os, "sched_getaffinity"):
+        cpus = len(os.sched_getaffinity(0))
+    else:
+        cpus = os.cpu_count() or 1
+    return min(cpus, MAX_PRELOAD_WORKERS)
+
+
+def load_source(fn):
+    """
+    Maps a file into memory, so the lexer reads it without copying it into a string. Files with '\\r' in them are read
+    and their newlines are changed to '\\n', like when a file is opened in text mode. The map must be closed with
+    close_source once the code is loaded, the nodes keep a copy of the code (see Source).
+    :param fn: File name
+    :return: Code of the file, as UTF-8 bytes or a memory map
+    """
+    with open(fn, "rb") as f:
+        try:
+            code = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            # Empty files and files like pipes can't be mapped
+            code = f.read()
+    if code.find(b"\r") == -1:
+        return code
+    text = code[:].replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    close_source(code)
+    return text
+
+
+def close_source(code):
+    """
+    Closes the memory map of code from load_source, so the file is not kept open (or locked, on Windows) while the
+    program runs.
+    :param code: Code from load_source
+    :return: nothing
+    """
+    if isinstance(code, mmap.mmap):
+        code.close()
+
+
+def parse(fn, text):
+    """
+    Lexes and parses code.
+    :param fn: File name of the code
+    :param text: Code, a string or UTF-8 bytes
+    :return: Parsed node, error
+    """
+    from TechZen.lexer_ import Lexer
+    from TechZen.parser_ import Parser
+
+    # Generate tokens while the Abstract Syntax Tree (AST) is made, so there is never a list of all of them
+    lexer = Lexer(fn, text)
+    parser = Parser(lexer.iter_tokens())
+    ast = parser.parse()
+    if ast.error:
+        # An error of the lexer comes first, even when it's after the error of the parser
+        for _ in parser.tokens:
+            pass
+    if lexer.error:
+        return None, lexer.error
+    if ast.error:
+        return None, ast.error
+    return ast.node, None
+
+
+def cache_path(fn):
+    """
+    Where the cache of a file is stored, like __pycache__ for Python files.
+    :param fn: File name
+    :return: Path of the .tzc file
+    """
+    directory, file_name = os.path.split(os.path.abspath(fn))
+    return os.path.join(directory, CACHE_DIR, file_name + CACHE_SUFFIX)
+
+
+def cache_key(fn, text):
+    """
+    The key a cache file must have to be used. It changes when the path, the code, TechZen (its version or the code of
+    NODE_MODULES) or Python changes.
+    :param fn: File name
+    :param text: Code
+    :return: Key (32 bytes)
+    """
+    key = hashlib.sha256()
+    for part in (TechZen.__version__, sys.version, NODE_CODE_HASH, fn, text):
+        # Code can be bytes or a memory map already, which is hashed without a copy
+        if isinstance(part, str):
+            part = part.encode("utf-8", "surrogatepass")
+        key.update(part)
+        key.update(b"\0")
+    return key.digest()
+
+
+def read(fn, text):
+    """
+    Reads the parsed node of a file from its cache.
+    :param fn: File name
+    :param text: Code of the file
+    :return: Parsed node, None when there is no valid cache
+    """
+    try:
+        with open(cache_path(fn), "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+
+    header = MAGIC + cache_key(fn, text)
+    if not data.startswith(header):
+        return None
+
+    try:
+        return unpickle(zlib.decompress(data[len(header) :]))
+    except Exception:
+        return None
+
+
+def unpickle(data):
+    """
+    Unpickles a parsed node. The garbage collector is paused meanwhile, otherwise it looks at all the new nodes again
+    and again while they are made.
+    :param data: Pickled node
+    :return: Parsed node
+    """
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return pickle.loads(data)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def write(fn, text, node, pickled=None):
+    """
+    Writes the parsed node of a file to its cache. The cache is only an optimization, so failing to write it is
+    ignored.
+    :param fn: File name
+    :param text: Code of the file
+    :param node: Parsed node
+    :param pickled: The node already pickled, None to pickle it here
+    :return: nothing
+    """
+    path = cache_path(fn)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        if pickled is None:
+            pickled = pickle.dumps(node, pickle.HIGHEST_PROTOCOL)
+        data = zlib.compress(pickled)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(temp_path, "wb") as f:
+            f.write(MAGIC + cache_key(fn, text) + data)
+        os.replace(temp_path, path)
+    except (OSError, RecursionError, pickle.PicklingError):
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+
+
+def load_ast(fn, text):
+    """
+    Gets the parsed, optimized and resolved node of code. Code from a file is read from its cache if the cache is still
+    valid, otherwise it is lexed and parsed and the cache is written.
+    :param fn: File name of the code
+    :param text: Code, a string or UTF-8 bytes
+    :return: Parsed node, error
+    """
+    from TechZen.optimizer_ import Optimizer
+    from TechZen.resolver_ import Resolver
+
+    use_cache = enabled and os.path.isfile(fn)
+
+    node = None
+    if fn in preloaded:
+        key, preloaded_node = preloaded.pop(fn)
+        # The file changed since it was preloaded
+        if key == cache_key(fn, text):
+            node = preloaded_node
+    if node is None and use_cache:
+        node = read(fn, text)
+    if node is None:
+        node, error = parse(fn, text)
+        if error:
+            return None, error
+        if use_cache:
+            write(fn, text, node)
+
+    # Optimized every time, the cache keeps the node as it was parsed so it does not depend on optimizer_.enabled.
+    # Resolved every time, the Resolver also records the local names of the functions for SymbolTable.get_global
+    return Resolver.resolve(Optimizer.optimize(node)), None
+
+
+def find_includes(node):
+    """
+    Finds the files that code includes, anywhere in it (an include in a function runs when the function is called).
+    :param node: Parsed node
+    :return: List of file names
+    """
+    from TechZen.resolver_ import Resolver
+    from TechZen import nodes_
+
+    file_names = []
+    nodes = [node]
+    while nodes:
+        node = nodes.pop()
+        if isinstance(node, nodes_.IncludeNode):
+            file_names.append(node.file_name.value)
+        else:
+            nodes.extend(reversed(Resolver.child_nodes(node)))
+    return file_names
+
+
+def parse_file(fn, use_cache):
+    """
+    Loads, lexes and parses a file in a worker process of preload, and writes its cache.
+    :param fn: File name
+    :param use_cache: True to write the cache of the file
+    :return: File name, cache key, pickled node and the files it includes, or None if the file has an error
+    """
+    text = load_source(fn)
+    try:
+        node, error = parse(fn, text)
+        if error:
+            return None
+        # Pickled once, for the cache and to send the node back to the process that runs the program
+        pickled = pickle.dumps(node, pickle.HIGHEST_PROTOCOL)
+        if use_cache:
+            write(fn, text, node, pickled)
+        return fn, cache_key(fn, text), pickled, find_includes(node)
+    finally:
+        close_source(text)
+
+
+def preload(node):
+    """
+    Loads the files a program includes, and the files they include, before it runs, so include gets their nodes from
+    `preloaded`. The files without a valid cache are lexed and parsed at the same time in a process pool. This is only
+    done when preload_workers is more than 1 and the program includes at least PRELOAD_POOL_FILES files, otherwise
+    include loads the files when it runs, and only the ones it runs. Files with an error are left for include, which
+    shows the error when it runs. When a file can not be read, a worker process stops or a node can not be unpickled,
+    preloading stops and include loads the files that are left.
+    :param node: Parsed node of the program
+    :return: The names of the files put in `preloaded`, for Runner.run to remove the ones include did not load
+    """
+    from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+    from concurrent.futures.process import BrokenProcessPool
+    from TechZen.types.module_ import Module
+
+    if preload_workers <= 1:
+        return []
+
+    seen = set(Module.modules)
+    seen.update(preloaded)
+    file_names = find_includes(node)
+    # Parsing a few files in new processes takes longer than parsing them in include
+    if len(set(file_names) - seen) < PRELOAD_POOL_FILES:
+        return []
+
+    loaded = []
+    executor = None
+    futures = set()
+
+    try:
+        while file_names or futures:
+            found = []
+            for fn in file_names:
+                if fn in seen:
+                    continue
+                seen.add(fn)
+                try:
+                    text = load_source(fn)
+                except OSError:
+                    continue
+                try:
+                    cached_node = read(fn, text) if enabled else None
+                    if cached_node is None:
+                        if executor is None:
+                            executor = ProcessPoolExecutor(preload_workers)
+                        futures.add(executor.submit(parse_file, fn, enabled))
+                    else:
+                        preloaded[fn] = (cache_key(fn, text), cached_node)
+                        loaded.append(fn)
+                        found.extend(find_includes(cached_node))
+                finally:
+                    close_source(text)
+
+            # Only waits when there are no other files to load yet
+            done, futures = wait(
+                futures, timeout=0 if found else None, return_when=FIRST_COMPLETED
+            )
+            for future in done:
+                result = future.result()
+                if result is not None:
+                    fn, key, pickled, includes = result
+                    preloaded[fn] = (key, unpickle(pickled))
+                    loaded.append(fn)
+                    found.extend(includes)
+            file_names = found
+    except (OSError, BrokenProcessPool, pickle.UnpicklingError):
+        # Preloading is only an optimization, include loads the files that are left when it runs. Other errors are bugs
+        pass
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+    return loaded
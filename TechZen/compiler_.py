@@ -0,0 +1,697 @@
+from TechZen.runtime_ import RTResult, TailCallSignal
+from TechZen.errors_ import RTError
+from TechZen.context_ import Context
+from TechZen.symbol_table_ import SymbolTable
+from TechZen.types.number_ import Number
+from TechZen.types.string_ import String
+from TechZen.types.list_ import List
+from TechZen.types.class_ import Class
+from TechZen.types.instance_ import Instance
+from TechZen.interpreter_ import Interpreter
+from TechZen import nodes_
+
+
+class Compiler:
+    @classmethod
+    def compile(cls, node):
+        """
+        Compiles the parsed result once into a tree of closures. Every closure takes a context and returns a runtime
+        result, just like the 'visit_' methods of the interpreter.
+        :param node: Parsed node
+        :return: Closure
+        """
+        return cls.dispatch_table.get(type(node), cls.no_compile_method)(node)
+
+    @classmethod
+    def no_compile_method(cls, node):
+        """
+        This is the method it returns when the node requested doesn't exist.
+        :param node: Parsed node
+        :return: error
+        """
+        raise Exception(f"No compile_{type(node).__name__} method defined")
+
+    @classmethod
+    def compile_NumberNode(cls, node):
+        """
+        NumberNode method
+        :param node: Parsed node
+        :return: Closure
+        """
+        value = node.constant
+
+        def number(context):
+            return RTResult().success(value)
+
+        return number
+
+    @classmethod
+    def compile_StringNode(cls, node):
+        """
+        StringNode method
+        :param node: Parsed node
+        :return: Closure
+        """
+        value = node.token.value
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        def string(context):
+            return RTResult().success(
+                String(value).set_context(context).set_pos(pos_start, pos_end)
+            )
+
+        return string
+
+    @classmethod
+    def compile_ListNode(cls, node):
+        """
+        ListNode method
+        :param node: Parsed node
+        :return: Closure
+        """
+        element_closures = [cls.compile(element) for element in node.element_nodes]
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        def list_(context):
+            res = RTResult()
+            elements = []
+
+            for element_closure in element_closures:
+                elements.append(res.register(element_closure(context)))
+                if res.should_return():
+                    return res
+
+            return res.success(
+                List(elements).set_context(context).set_pos(pos_start, pos_end)
+            )
+
+        return list_
+
+    @classmethod
+    def compile_DictNode(cls, node):
+        """
+        DictNode method
+        :param node: Parsed node
+        :return: Closure
+        """
+        from TechZen.types.dict_ import Dict
+
+        item_closures = [
+            (cls.compile(key), cls.compile(value))
+            for key, value in node.element_nodes.items()
+        ]
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        def dict_(context):
+            res = RTResult()
+            elements = {}
+
+            for key_closure, value_closure in item_closures:
+                key = res.register(key_closure(context))
+                if res.should_return():
+                    return res
+                elements[key] = res.register(value_closure(context))
+                if res.should_return():
+                    return res
+
+            return res.success(
+                Dict(elements).set_context(context).set_pos(pos_start, pos_end)
+            )
+
+        return dict_
+
+    @classmethod
+    def compile_VarAccessNode(cls, node):
+        """
+        VarAccessNode method
+        :param node: Parsed node
+        :return: Closure
+        """
+        var_name = node.var_name_token.value
+        child = node.child
+        child_closure = cls.compile(child) if child else None
+        slot, is_global = node.slot, node.is_global
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        def var_access(context):
+            res = RTResult()
+            if slot is not None:
+                value = context.symbol_table.get_local(var_name, slot)
+            elif is_global:
+                value = context.symbol_table.get_global(var_name)
+            else:
+                value = context.symbol_table.get(var_name)
+
+            if not value:
+                return res.failure(
+                    RTError(pos_start, pos_end, f"'{var_name}' is not defined", context)
+                )
+
+            if child_closure:
+                if not isinstance(value, Instance) and not isinstance(value, Class):
+                    return res.failure(
+                        RTError(
+                            pos_start,
+                            pos_end,
+                            "Value must be instance of class or class",
+                            context,
+                        )
+                    )
+
+                if type(value) is Instance:
+                    member = value.get_attribute(child)
+                    if member is not None:
+                        return res.success(member)
+
+                new_context = Context(value.parent_class.name, context, pos_start)
+                new_context.symbol_table = value.symbol_table
+
+                value = res.register(child_closure(new_context))
+                if res.error:
+                    return res
+
+            return res.success(value)
+
+        return var_access
+
+    @classmethod
+    def compile_VarAssignNode(cls, node):
+        """
+        VarAssignNode method
+        :param node: Parsed node
+        :return: Closure
+        """
+        var_name = node.var_name_token.value
+        value_closure = cls.compile(node.value_node)
+        extra_names = [name_token.value for name_token in node.extra_names]
+        caches = node.caches
+        slot = node.slot
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        def var_assign(context):
+            res = RTResult()
+            value = res.register(value_closure(context))
+            if res.should_return():
+                return res
+
+            if slot is not None:
+                context.symbol_table.slots[slot] = value
+            else:
+                context.symbol_table.set(var_name, value)
+            return res.success(value)
+
+        def attribute_assign(context):
+            res = RTResult()
+            value = res.register(value_closure(context))
+            if res.should_return():
+                return res
+
+            nd = context.symbol_table.get(var_name)
+            prev = None
+
+            if not nd:
+                return res.failure(
+                    RTError(pos_start, pos_end, f"'{var_name}' not defined", context)
+                )
+
+            for index, name in enumerate(extra_names):
+                if not isinstance(nd, Class) and not isinstance(nd, Instance):
+                    return res.failure(
+                        RTError(
+                            pos_start,
+                            pos_end,
+                            "Value must be instance of class or class",
+                            context,
+                        )
+                    )
+
+                prev = nd
+                nd = nd.get_member(name, caches[index])
+
+                if not nd and index != len(extra_names) - 1:
+                    return res.failure(
+                        RTError(pos_start, pos_end, f"'{name}' not defined", context)
+                    )
+
+            prev.set_member(extra_names[-1], value, caches[-1])
+            return res.success(value)
+
+        return attribute_assign if extra_names else var_assign
+
+    @classmethod
+    def compile_BinOpNode(cls, node):
+        """
+        BinOpNode method. The node has the operator resolved, so the closure does not have to compare token types.
+        Operations on two numbers and additions of two strings are done directly, without the Value methods.
+        :param node: Parsed node
+        :return: Closure
+        """
+        left_node, right_node = node.left_node, node.right_node
+        left_closure = cls.compile(left_node)
+        right_closure = cls.compile(right_node)
+        operation, number_operation = node.operation, node.number_operation
+        is_addition = operation == "added_to"
+
+        def bin_op(context):
+            res = RTResult()
+            left = res.register(left_closure(context))
+            if res.should_return():
+                return res
+            right = res.register(right_closure(context))
+            if res.should_return():
+                return res
+
+            if type(left) is Number and type(right) is Number:
+                value = number_operation(left.value, right.value)
+                if value is not None:
+                    return res.success(Number.of(value))
+            elif is_addition and type(left) is String and type(right) is String:
+                return res.success(
+                    String(left.value + right.value).set_context(left.context)
+                )
+
+            result, error = getattr(left, operation)(right)
+            if error:
+                # The values do not know where they come from, the error is made again with located values
+                _, error = getattr(left.located(left_node, context), operation)(
+                    right.located(right_node, context)
+                )
+                return res.failure(error)
+            return res.success(result)
+
+        return bin_op
+
+    @classmethod
+    def compile_UnaryOpNode(cls, node):
+        """
+        UnaryOpNode method
+        :param node: Parsed node
+        :return: Closure
+        """
+        operand_node, op_token = node.node, node.op_token
+        node_closure = cls.compile(operand_node)
+
+        def unary_op(context):
+            res = RTResult()
+            number = res.register(node_closure(context))
+            if res.should_return():
+                return res
+
+            result, error = Interpreter.unary_operation(op_token, number, Number.of(-1))
+            if error:
+                # The values do not know where they come from, the error is made again with located values
+                _, error = Interpreter.unary_operation(
+                    op_token,
+                    number.located(operand_node, context),
+                    Number.of(-1).located(node, context),
+                )
+                return res.failure(error)
+            return res.success(result)
+
+        return unary_op
+
+    @classmethod
+    def compile_IfNode(cls, node):
+        """
+        IfNode method
+        :param node: Parsed node
+        :return: Closure
+        """
+        cases = [
+            (cls.compile(condition), cls.compile(expr), should_return_null)
+            for condition, expr, should_return_null in node.cases
+        ]
+        else_case = None
+        if node.else_case:
+            expr, should_return_null = node.else_case
+            else_case = (cls.compile(expr), should_return_null)
+
+        def if_(context):
+            res = RTResult()
+            for condition_closure, expr_closure, should_return_null in cases:
+                condition_value = res.register(condition_closure(context))
+                if res.should_return():
+                    return res
+
+                if condition_value.is_true():
+                    expr_value = res.register(expr_closure(context))
+                    if res.should_return():
+                        return res
+                    return res.success(
+                        Number.null if should_return_null else expr_value
+                    )
+
+            if else_case:
+                expr_closure, should_return_null = else_case
+                else_value = res.register(expr_closure(context))
+                if res.should_return():
+                    return res
+                return res.success(Number.null if should_return_null else else_value)
+
+            return res.success(Number.null)
+
+        return if_
+
+    @classmethod
+    def compile_ForNode(cls, node):
+        """
+        ForNode method
+        :param node: Parsed node
+        :return: Closure
+        """
+        var_name = node.var_name_token.value
+        slot = node.slot
+        start_closure = cls.compile(node.start_value_node)
+        end_closure = cls.compile(node.end_value_node)
+        step_closure = (
+            cls.compile(node.step_value_node) if node.step_value_node else None
+        )
+        body_closure = cls.compile(node.body_node)
+        should_return_null = node.should_return_null
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        def for_(context):
+            res = RTResult()
+            elements = []
+
+            start_value = res.register(start_closure(context))
+            if res.should_return():
+                return res
+
+            end_value = res.register(end_closure(context))
+            if res.should_return():
+                return res
+
+            if step_closure:
+                step_value = res.register(step_closure(context))
+                if res.should_return():
+                    return res
+            else:
+                step_value = Number.of(1)
+
+            i = start_value.value
+            end = end_value.value
+            step = step_value.value
+            symbol_table = context.symbol_table
+
+            if type(i) is int and type(end) is int and type(step) is int and step:
+                return int_for(context, range(i, end, step))
+
+            while i < end if step >= 0 else i > end:
+                if slot is not None:
+                    symbol_table.slots[slot] = Number.of(i)
+                else:
+                    symbol_table.set(var_name, Number.of(i))
+                i += step
+
+                value = res.register(body_closure(context))
+                if (
+                    res.should_return()
+                    and res.loop_should_continue is False
+                    and res.loop_should_break is False
+                ):
+                    return res
+
+                if res.loop_should_continue:
+                    continue
+
+                if res.loop_should_break:
+                    break
+
+                if not should_return_null:
+                    elements.append(value)
+
+            return res.success(
+                Number.null
+                if should_return_null
+                else List(elements).set_context(context).set_pos(pos_start, pos_end)
+            )
+
+        def int_for(context, counter):
+            # Same as Interpreter.int_for_loop
+            elements = None if should_return_null else []
+            symbol_table = context.symbol_table
+
+            for i in counter:
+                if slot is not None:
+                    symbol_table.slots[slot] = Number.of(i)
+                else:
+                    symbol_table.set(var_name, Number.of(i))
+
+                body_res = body_closure(context)
+                if body_res.should_return():
+                    if body_res.loop_should_break:
+                        break
+                    if body_res.loop_should_continue:
+                        continue
+                    return body_res
+
+                if elements is not None:
+                    elements.append(body_res.value)
+
+            return RTResult().success(
+                Number.null
+                if elements is None
+                else List(elements).set_context(context).set_pos(pos_start, pos_end)
+            )
+
+        return for_
+
+    @classmethod
+    def compile_WhileNode(cls, node):
+        """
+        WhileNode method
+        :param node: Parsed node
+        :return: Closure
+        """
+        condition_closure = cls.compile(node.condition_node)
+        body_closure = cls.compile(node.body_node)
+        should_return_null = node.should_return_null
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        def while_(context):
+            res = RTResult()
+            elements = []
+
+            while True:
+                condition = res.register(condition_closure(context))
+                if res.should_return():
+                    return res
+
+                if not condition.is_true():
+                    break
+
+                value = res.register(body_closure(context))
+                if (
+                    res.should_return()
+                    and res.loop_should_continue is False
+                    and res.loop_should_break is False
+                ):
+                    return res
+
+                if res.loop_should_continue:
+                    continue
+
+                if res.loop_should_break:
+                    break
+
+                elements.append(value)
+
+            return res.success(
+                Number.null
+                if should_return_null
+                else List(elements).set_context(context).set_pos(pos_start, pos_end)
+            )
+
+        return while_
+
+    @classmethod
+    def compile_FuncDefNode(cls, node):
+        """
+        FuncDefNode method. The body is compiled once here and shared by every function value the closure creates.
+        :param node: Parsed node
+        :return: Closure
+        """
+        from TechZen.types.function_ import Function
+
+        func_name = node.var_name_token.value if node.var_name_token else None
+        body_node = node.body_node
+        body_closure = cls.compile(body_node)
+        arg_names = [arg_name.value for arg_name in node.arg_name_tokens]
+        should_auto_return = node.should_auto_return
+        slot_index = node.slot_index
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        def func_def(context):
+            func_value = (
+                Function(
+                    func_name,
+                    body_node,
+                    arg_names,
+                    should_auto_return,
+                    body_closure,
+                    slot_index=slot_index,
+                )
+                .set_context(context)
+                .set_pos(pos_start, pos_end)
+            )
+
+            if func_name:
+                context.symbol_table.set(func_name, func_value)
+
+            return RTResult().success(func_value)
+
+        return func_def
+
+    @classmethod
+    def compile_CallNode(cls, node):
+        """
+        CallNode method. A tail call returns its arguments to Function.execute, which runs the body again.
+        :param node: Parsed node
+        :return: Closure
+        """
+        from TechZen.types.function_ import Function
+
+        call_closure = cls.compile(node.node_to_call)
+        arg_closures = [cls.compile(arg_node) for arg_node in node.arg_nodes]
+        is_tail_call = node.tail_body is not None
+
+        def call(context):
+            res = RTResult()
+            args = []
+
+            value_to_call = res.register(call_closure(context))
+            if res.should_return():
+                return res
+
+            for arg_closure in arg_closures:
+                args.append(res.register(arg_closure(context)))
+                if res.should_return():
+                    return res
+
+            if (
+                is_tail_call
+                and type(value_to_call) is Function
+                and value_to_call.can_tail_call(node, args)
+            ):
+                return TailCallSignal(args).result()
+
+            return_value = res.register(value_to_call.execute(args, node, context))
+            if res.should_return():
+                return res
+            return res.success(return_value)
+
+        return call
+
+    @classmethod
+    def compile_ReturnNode(cls, node):
+        """
+        ReturnNode method
+        :param node: Parsed node
+        :return: Closure
+        """
+        return_closure = (
+            cls.compile(node.node_to_return) if node.node_to_return else None
+        )
+
+        def return_(context):
+            res = RTResult()
+
+            if return_closure:
+                value = res.register(return_closure(context))
+                if res.should_return():
+                    return res
+            else:
+                value = Number.null
+
+            return res.success_return(value)
+
+        return return_
+
+    @classmethod
+    def compile_ContinueNode(cls, node):
+        """
+        ContinueNode method
+        :param node: Parsed node
+        :return: Closure
+        """
+        return lambda context: RTResult().success_continue()
+
+    @classmethod
+    def compile_BreakNode(cls, node):
+        """
+        BreakNode method
+        :param node: Parsed node
+        :return: Closure
+        """
+        return lambda context: RTResult().success_break()
+
+    @classmethod
+    def compile_ClassNode(cls, node):
+        """
+        ClassNode method
+        :param node: Parsed node
+        :return: Closure
+        """
+        class_name = node.class_name_token.value
+        body_closure = cls.compile(node.body_nodes)
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        def class_(context):
+            res = RTResult()
+
+            ctx = Context(class_name, context, pos_start)
+            ctx.symbol_table = SymbolTable(context.symbol_table)
+
+            res.register(body_closure(ctx))
+            if res.should_return():
+                return res
+
+            cls_ = (
+                Class(class_name, ctx.symbol_table)
+                .set_context(context)
+                .set_pos(pos_start, pos_end)
+            )
+            context.symbol_table.set(class_name, cls_)
+            return res.success(cls_)
+
+        return class_
+
+    @classmethod
+    def compile_TryNode(cls, node):
+        """
+        TryNode method
+        :param node: Parsed node
+        :return: Closure
+        """
+        try_closure = cls.compile(node.try_statements)
+        except_closure = cls.compile(node.except_statements)
+
+        def try_(context):
+            res = RTResult()
+            res.register(try_closure(context))
+            if res.should_return():
+                res.register(except_closure(context))
+                if res.should_return():
+                    return res
+            return res.success(Number.null)
+
+        return try_
+
+    @classmethod
+    def compile_IncludeNode(cls, node):
+        """
+        IncludeNode method. Including a file only happens once per statement, so it is left to the interpreter, which
+        compiles the functions and classes of the file.
+        :param node: Parsed node
+        :return: Closure
+        """
+        return lambda context: Interpreter.run_include(node, context, "closure")
+
+
+# Maps every node class to its compile method, like the dispatch table of the interpreter.
+Compiler.dispatch_table = {
+    node_class: getattr(Compiler, f"compile_{name}")
+    for name, node_class in vars(nodes_).items()
+    if isinstance(node_class, type) and hasattr(Compiler, f"compile_{name}")
+}
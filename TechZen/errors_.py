@@ -1,5 +1,10 @@
+from itertools import groupby
+
 from TechZen.strings_with_arrows import string_with_arrows
 
+# A line of a traceback that repeats, like in deep recursion, is shown this many times before it is counted instead.
+TRACEBACK_REPEATS = 3
+
 
 class Error:
     def __init__(self, pos_start, pos_end, error_name, details):
@@ -86,19 +91,25 @@ class RTError(Error):
 
     def generate_traceback(self):
         """
-        This function generates a traceback for the error.
+        This function generates a traceback for the error. A line that repeats is counted after it is shown a few
+        times, like in Python, so the traceback of deep recursion stays short.
         :return: Traceback for the error, all parent files and functions
         """
-        result = ""
+        lines = []
         pos = self.pos_start
         ctx = self.context
 
         while ctx:
-            result = (
-                f"  File {pos.fn}, line {pos.ln + 1}, in {ctx.display_name}\n" + result
-            )
+            lines.append(f"  File {pos.fn}, line {pos.ln + 1}, in {ctx.display_name}\n")
 
             pos = ctx.parent_entry_pos
             ctx = ctx.parent
 
-        return "Traceback (most recent call last):\n" + result
+        result = ["Traceback (most recent call last):\n"]
+        for line, group in groupby(reversed(lines)):
+            count = sum(1 for _ in group)
+            result.append(line * min(count, TRACEBACK_REPEATS))
+            if count > TRACEBACK_REPEATS:
+                repeated = count - TRACEBACK_REPEATS
+                result.append(f"  [Previous line repeated {repeated} more times]\n")
+        return "".join(result)
@@ -21,6 +21,10 @@ BuiltInFunction.extend = BuiltInFunction("extend")
 BuiltInFunction.len = BuiltInFunction("len")
 BuiltInFunction.run = BuiltInFunction("run")
 BuiltInFunction.update_list = BuiltInFunction("update_list")
+BuiltInFunction.has_key = BuiltInFunction("has_key")
+BuiltInFunction.keys = BuiltInFunction("keys")
+BuiltInFunction.values = BuiltInFunction("values")
+BuiltInFunction.set_key = BuiltInFunction("set_key")
 BuiltInFunction.lower_string = BuiltInFunction("lower")
 BuiltInFunction.upper_string = BuiltInFunction("upper")
 BuiltInFunction.string = BuiltInFunction("string")
@@ -48,6 +52,10 @@ global_symbol_table.set("extend", BuiltInFunction.extend)
 global_symbol_table.set("len", BuiltInFunction.len)
 global_symbol_table.set("run", BuiltInFunction.run)
 global_symbol_table.set("update_list", BuiltInFunction.update_list)
+global_symbol_table.set("has_key", BuiltInFunction.has_key)
+global_symbol_table.set("keys", BuiltInFunction.keys)
+global_symbol_table.set("values", BuiltInFunction.values)
+global_symbol_table.set("set_key", BuiltInFunction.set_key)
 global_symbol_table.set("lower_string", BuiltInFunction.lower_string)
 global_symbol_table.set("upper_string", BuiltInFunction.upper_string)
 global_symbol_table.set("string", BuiltInFunction.string)
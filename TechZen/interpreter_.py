@@ -1,12 +1,24 @@
-from TechZen.runtime_ import RTResult
+from TechZen.runtime_ import (
+    RTResult,
+    Signal,
+    ErrorSignal,
+    ReturnSignal,
+    ContinueSignal,
+    BreakSignal,
+    TailCallSignal,
+)
 from TechZen.errors_ import RTError
 from TechZen.token_ import TokenType, Keywords
 from TechZen.context_ import Context
 from TechZen.symbol_table_ import SymbolTable
+from TechZen.operations_ import binary_method
 from TechZen.types.number_ import Number
+from TechZen.types.string_ import String
 from TechZen.types.list_ import List
 from TechZen.types.class_ import Class
 from TechZen.types.instance_ import Instance
+from TechZen.types.module_ import Module
+from TechZen import nodes_
 
 Number.null = Number(0)
 Number.false = Number(0)
@@ -17,14 +29,27 @@ class Interpreter:
     @classmethod
     def visit(cls, node, context):
         """
-        Interprets the parsed result and returns the method that belongs to it.
+        Interprets the parsed result. The nodes return their value and raise a signal to return, break, continue, exit
+        or fail, which is turned into the runtime result here.
         :param node: Parsed node
         :param context: Context object
-        :return: one of the 'visit_' methods
+        :return: Runtime result
         """
-        method_name = f"visit_{type(node).__name__}"
-        method = getattr(cls, method_name, cls.no_visit_method)
-        return method(node, context)
+        try:
+            return RTResult().success(cls.evaluate(node, context))
+        except Signal as signal:
+            return signal.result()
+
+    @classmethod
+    def evaluate(cls, node, context):
+        """
+        Runs the 'visit_' method of the node and returns its value.
+        The method is looked up in the dispatch table, which is built once when the module is loaded.
+        :param node: Parsed node
+        :param context: Context object
+        :return: Value, raises a Signal when the node does not end normally
+        """
+        return cls.dispatch_table.get(type(node), cls.no_visit_method)(node, context)
 
     @classmethod
     def no_visit_method(cls, node, context):
@@ -42,13 +67,9 @@ class Interpreter:
         NumberNode method
         :param node: Parsed node
         :param context: Context object
-        :return: Runtime result success
+        :return: Number
         """
-        return RTResult().success(
-            Number(node.token.value)
-            .set_context(context)
-            .set_pos(node.pos_start, node.pos_end)
-        )
+        return node.constant
 
     @classmethod
     def visit_StringNode(cls, node, context):
@@ -56,11 +77,9 @@ class Interpreter:
         StringNode method
         :param node: Parsed node
         :param context: Context object
-        :return: Runtime result success
+        :return: String
         """
-        from TechZen.types.string_ import String
-
-        return RTResult().success(
+        return (
             String(node.token.value)
             .set_context(context)
             .set_pos(node.pos_start, node.pos_end)
@@ -72,19 +91,12 @@ class Interpreter:
         ListNode method
         :param node: Parsed node
         :param context: Context object
-        :return: Runtime result success
+        :return: List
         """
-        res = RTResult()
-        elements = []
-
-        for element_node in node.element_nodes:
-            elements.append(res.register(cls.visit(element_node, context)))
-            if res.should_return():
-                return res
-
-        return res.success(
-            List(elements).set_context(context).set_pos(node.pos_start, node.pos_end)
-        )
+        elements = [
+            cls.evaluate(element_node, context) for element_node in node.element_nodes
+        ]
+        return List(elements).set_context(context).set_pos(node.pos_start, node.pos_end)
 
     @classmethod
     def visit_DictNode(cls, node, context):
@@ -92,33 +104,15 @@ class Interpreter:
         DictNode method
         :param node: Parsed node
         :param context: Context object
-        :return: Runtime result success
+        :return: Dict
         """
         from TechZen.types.dict_ import Dict
 
-        res = RTResult()
         elements = {}
-        keys = []
-        values = []
-        for key in node.element_nodes.keys():
-            keys.append(key)
-            values.append(node.element_nodes[key])
-
-        try:
-            for key, value in zip(keys, values):
-                elements[res.register(cls.visit(key, context))] = res.register(
-                    cls.visit(value, context)
-                )
-                if res.should_return():
-                    return res
-        except ValueError:
-            elements[res.register(cls.visit(keys[0], context))] = res.register(
-                cls.visit(values[0], context)
-            )
+        for key, value in node.element_nodes.items():
+            elements[cls.evaluate(key, context)] = cls.evaluate(value, context)
 
-        return res.success(
-            Dict(elements).set_context(context).set_pos(node.pos_start, node.pos_end)
-        )
+        return Dict(elements).set_context(context).set_pos(node.pos_start, node.pos_end)
 
     @classmethod
     def visit_VarAccessNode(cls, node, context):
@@ -126,14 +120,18 @@ class Interpreter:
         VarAccessNode method
         :param node: Parsed node
         :param context: Context object
-        :return: Runtime result success
+        :return: Value of the variable
         """
-        res = RTResult()
         var_name = node.var_name_token.value
-        value = context.symbol_table.get(var_name)
+        if node.slot is not None:
+            value = context.symbol_table.get_local(var_name, node.slot)
+        elif node.is_global:
+            value = context.symbol_table.get_global(var_name)
+        else:
+            value = context.symbol_table.get(var_name)
 
         if not value:
-            return res.failure(
+            raise ErrorSignal(
                 RTError(
                     node.pos_start,
                     node.pos_end,
@@ -144,7 +142,7 @@ class Interpreter:
 
         if node.child:
             if not isinstance(value, Instance) and not isinstance(value, Class):
-                return res.failure(
+                raise ErrorSignal(
                     RTError(
                         node.pos_start,
                         node.pos_end,
@@ -153,17 +151,17 @@ class Interpreter:
                     )
                 )
 
+            if type(value) is Instance:
+                member = value.get_attribute(node.child)
+                if member is not None:
+                    return member
+
             new_context = Context(value.parent_class.name, context, node.pos_start)
             new_context.symbol_table = value.symbol_table
 
-            child = res.register(cls.visit(node.child, new_context))
-            if res.error:
-                return res
+            value = cls.evaluate(node.child, new_context)
 
-            value = child
-
-        value = value.copy().set_pos(node.pos_start, node.pos_end).set_context(context)
-        return res.success(value)
+        return value
 
     @classmethod
     def visit_VarAssignNode(cls, node, context):
@@ -171,13 +169,10 @@ class Interpreter:
         VarAssignNode method
         :param node: Parsed node
         :param context: Context object
-        :return: Runtime result success
+        :return: Assigned value
         """
-        res = RTResult()
         var_name = node.var_name_token.value
-        value = res.register(cls.visit(node.value_node, context))
-        if res.should_return():
-            return res
+        value = cls.evaluate(node.value_node, context)
 
         if node.extra_names:
 
@@ -185,7 +180,7 @@ class Interpreter:
             prev = None
 
             if not nd:
-                return res.failure(
+                raise ErrorSignal(
                     RTError(
                         node.pos_start,
                         node.pos_end,
@@ -198,7 +193,7 @@ class Interpreter:
                 name = name_token.value
 
                 if not isinstance(nd, Class) and not isinstance(nd, Instance):
-                    return res.failure(
+                    raise ErrorSignal(
                         RTError(
                             node.pos_start,
                             node.pos_end,
@@ -208,14 +203,10 @@ class Interpreter:
                     )
 
                 prev = nd
-                nd = (
-                    nd.symbol_table.symbols[name]
-                    if name in nd.symbol_table.symbols
-                    else None
-                )
+                nd = nd.get_member(name, node.caches[index])
 
                 if not nd and index != len(node.extra_names) - 1:
-                    return res.failure(
+                    raise ErrorSignal(
                         RTError(
                             node.pos_start,
                             node.pos_end,
@@ -224,63 +215,57 @@ class Interpreter:
                         )
                     )
 
-            prev.symbol_table.set(name, value)
-            return res.success(value)
+            prev.set_member(name, value, node.caches[-1])
+            return value
 
-        context.symbol_table.set(var_name, value)
-        return res.success(value)
+        if node.slot is not None:
+            context.symbol_table.slots[node.slot] = value
+        else:
+            context.symbol_table.set(var_name, value)
+        return value
 
     @classmethod
-    def visit_BinOpNode(cls, node, context):  # sourcery no-metrics
+    def visit_BinOpNode(cls, node, context):
         """
-        BinOpNode method
+        BinOpNode method. Operations on two numbers and additions of two strings are done directly, without the Value
+        methods.
         :param node: Parsed node
         :param context: Context object
-        :return: Runtime result success
-        """
-        res = RTResult()
-        left = res.register(cls.visit(node.left_node, context))
-        if res.should_return():
-            return res
-        right = res.register(cls.visit(node.right_node, context))
-        if res.should_return():
-            return res
-
-        if node.op_token.type == TokenType.TT_PLUS:
-            result, error = left.added_to(right)
-        elif node.op_token.type == TokenType.TT_MINUS:
-            result, error = left.subbed_by(right)
-        elif node.op_token.type == TokenType.TT_MUL:
-            result, error = left.multed_by(right)
-        elif node.op_token.type == TokenType.TT_POW:
-            result, error = left.pow_of(right)
-        elif node.op_token.type == TokenType.TT_MOD:
-            result, error = left.mod_by(right)
-        elif node.op_token.type == TokenType.TT_DIV:
-            result, error = left.dived_by(right)
-        elif node.op_token.type == TokenType.TT_DFL:
-            result, error = left.floor_by(right)
-        elif node.op_token.type == TokenType.TT_EE:
-            result, error = left.get_comparison_eq(right)
-        elif node.op_token.type == TokenType.TT_NE:
-            result, error = left.get_comparison_ne(right)
-        elif node.op_token.type == TokenType.TT_LT:
-            result, error = left.get_comparison_lt(right)
-        elif node.op_token.type == TokenType.TT_GT:
-            result, error = left.get_comparison_gt(right)
-        elif node.op_token.type == TokenType.TT_LTE:
-            result, error = left.get_comparison_lte(right)
-        elif node.op_token.type == TokenType.TT_GTE:
-            result, error = left.get_comparison_gte(right)
-        elif node.op_token.matches(TokenType.TT_KEYWORD, Keywords.KW_AND.value):
-            result, error = left.anded_by(right)
-        elif node.op_token.matches(TokenType.TT_KEYWORD, Keywords.KW_AND.value):
-            result, error = left.ored_by(right)
-
+        :return: Result of the operation
+        """
+        left = cls.evaluate(node.left_node, context)
+        right = cls.evaluate(node.right_node, context)
+
+        if type(left) is Number and type(right) is Number:
+            value = node.number_operation(left.value, right.value)
+            if value is not None:
+                return Number.of(value)
+        elif (
+            type(left) is String
+            and type(right) is String
+            and node.operation == "added_to"
+        ):
+            return String(left.value + right.value).set_context(left.context)
+
+        result, error = getattr(left, node.operation)(right)
         if error:
-            return res.failure(error)
-        else:
-            return res.success(result.set_pos(node.pos_start, node.pos_end))
+            # The values do not know where they come from, the error is made again with located values
+            _, error = getattr(left.located(node.left_node, context), node.operation)(
+                right.located(node.right_node, context)
+            )
+            raise ErrorSignal(error)
+        return result
+
+    @classmethod
+    def binary_operation(cls, op_token, left, right):
+        """
+        Does the operation of a binary operator.
+        :param op_token: The operator token
+        :param left: Value on the left of the operator
+        :param right: Value on the right of the operator
+        :return: Result, error
+        """
+        return getattr(left, binary_method(op_token))(right)
 
     @classmethod
     def visit_UnaryOpNode(cls, node, context):
@@ -288,24 +273,35 @@ class Interpreter:
         UnaryOpNode method
         :param node: Parsed node
         :param context: Context object
-        :return: Runtime result success
+        :return: Result of the operation
         """
-        res = RTResult()
-        number = res.register(cls.visit(node.node, context))
-        if res.should_return():
-            return res
-
-        error = None
-
-        if node.op_token.type == TokenType.TT_MINUS:
-            number, error = number.multed_by(Number(-1))
-        elif node.op_token.matches(TokenType.TT_KEYWORD, Keywords.KW_NOT.value):
-            number, error = number.notted()
+        number = cls.evaluate(node.node, context)
 
+        result, error = cls.unary_operation(node.op_token, number, Number.of(-1))
         if error:
-            return res.failure(error)
-        else:
-            return res.success(number.set_pos(node.pos_start, node.pos_end))
+            # The values do not know where they come from, the error is made again with located values
+            _, error = cls.unary_operation(
+                node.op_token,
+                number.located(node.node, context),
+                Number.of(-1).located(node, context),
+            )
+            raise ErrorSignal(error)
+        return result
+
+    @classmethod
+    def unary_operation(cls, op_token, number, minus_one):
+        """
+        Does the operation of a unary operator.
+        :param op_token: The operator token
+        :param number: Value after the operator
+        :param minus_one: Number(-1), a minus multiplies the value with it
+        :return: Result, error
+        """
+        if op_token.type == TokenType.TT_MINUS:
+            return number.multed_by(minus_one)
+        if op_token.matches(TokenType.TT_KEYWORD, Keywords.KW_NOT.value):
+            return number.notted()
+        return number, None
 
     @classmethod
     def visit_IfNode(cls, node, context):
@@ -313,28 +309,19 @@ class Interpreter:
         IfNode method
         :param node: Parsed node
         :param context: Context object
-        :return: Runtime result success
+        :return: Value of the case that ran
         """
-        res = RTResult()
         for condition, expr, should_return_null in node.cases:
-            condition_value = res.register(cls.visit(condition, context))
-            if res.should_return():
-                return res
-
-            if condition_value.is_true():
-                expr_value = res.register(cls.visit(expr, context))
-                if res.should_return():
-                    return res
-                return res.success(Number.null if should_return_null else expr_value)
+            if cls.evaluate(condition, context).is_true():
+                expr_value = cls.evaluate(expr, context)
+                return Number.null if should_return_null else expr_value
 
         if node.else_case:
             expr, should_return_null = node.else_case
-            else_value = res.register(cls.visit(expr, context))
-            if res.should_return():
-                return res
-            return res.success(Number.null if should_return_null else else_value)
+            else_value = cls.evaluate(expr, context)
+            return Number.null if should_return_null else else_value
 
-        return res.success(Number.null)
+        return Number.null
 
     @classmethod
     def visit_ForNode(cls, node, context):
@@ -342,99 +329,115 @@ class Interpreter:
         ForNode method
         :param node: Parsed node
         :param context: Context object
-        :return: Runtime result success
+        :return: List of the values of the body, or null
         """
-        res = RTResult()
-        elements = []
-
-        start_value = res.register(cls.visit(node.start_value_node, context))
-        if res.should_return():
-            return res
-
-        end_value = res.register(cls.visit(node.end_value_node, context))
-        if res.should_return():
-            return res
+        elements = None if node.should_return_null else []
 
+        start_value = cls.evaluate(node.start_value_node, context)
+        end_value = cls.evaluate(node.end_value_node, context)
         if node.step_value_node:
-            step_value = res.register(cls.visit(node.step_value_node, context))
-            if res.should_return():
-                return res
+            step_value = cls.evaluate(node.step_value_node, context)
         else:
-            step_value = Number(1)
+            step_value = Number.of(1)
 
         i = start_value.value
+        end = end_value.value
+        step = step_value.value
 
-        if step_value.value >= 0:
-            condition = lambda: i < end_value.value
-        else:
-            condition = lambda: i > end_value.value
-
-        while condition():
-            context.symbol_table.set(node.var_name_token.value, Number(i))
-            i += step_value.value
-
-            value = res.register(cls.visit(node.body_node, context))
-            if (
-                res.should_return()
-                and res.loop_should_continue is False
-                and res.loop_should_break is False
-            ):
-                return res
+        if type(i) is int and type(end) is int and type(step) is int and step:
+            return cls.int_for_loop(node, context, range(i, end, step))
 
-            if res.loop_should_continue:
+        symbol_table = context.symbol_table
+        var_name = node.var_name_token.value
+        while i < end if step >= 0 else i > end:
+            if node.slot is not None:
+                symbol_table.slots[node.slot] = Number.of(i)
+            else:
+                symbol_table.set(var_name, Number.of(i))
+            i += step
+
+            try:
+                value = cls.evaluate(node.body_node, context)
+            except ContinueSignal:
                 continue
-
-            if res.loop_should_break:
+            except BreakSignal:
                 break
 
-            elements.append(value)
+            if elements is not None:
+                elements.append(value)
 
-        return res.success(
+        return (
             Number.null
-            if node.should_return_null
+            if elements is None
             else List(elements)
             .set_context(context)
             .set_pos(node.pos_start, node.pos_end)
         )
 
     @classmethod
-    def visit_WhileNode(cls, node, context):
+    def int_for_loop(cls, node, context, counter):
         """
-        WhileNode method
+        For loop of which the start, end and step are integers. The counter is a range and the results of the body are
+        only kept when the loop has a value.
         :param node: Parsed node
         :param context: Context object
-        :return: Runtime result success
+        :param counter: Range of the values of the variable
+        :return: List of the values of the body, or null
         """
-        res = RTResult()
-        elements = []
+        elements = None if node.should_return_null else []
+        body_node = node.body_node
+        symbol_table = context.symbol_table
+        slot = node.slot
+        var_name = node.var_name_token.value
 
-        while True:
-            condition = res.register(cls.visit(node.condition_node, context))
-            if res.should_return():
-                return res
+        for i in counter:
+            if slot is not None:
+                symbol_table.slots[slot] = Number.of(i)
+            else:
+                symbol_table.set(var_name, Number.of(i))
 
-            if not condition.is_true():
+            try:
+                value = cls.evaluate(body_node, context)
+            except ContinueSignal:
+                continue
+            except BreakSignal:
                 break
 
-            value = res.register(cls.visit(node.body_node, context))
-            if (
-                res.should_return()
-                and res.loop_should_continue is False
-                and res.loop_should_break is False
-            ):
-                return res
+            if elements is not None:
+                elements.append(value)
 
-            if res.loop_should_continue:
-                continue
+        return (
+            Number.null
+            if elements is None
+            else List(elements)
+            .set_context(context)
+            .set_pos(node.pos_start, node.pos_end)
+        )
 
-            if res.loop_should_break:
+    @classmethod
+    def visit_WhileNode(cls, node, context):
+        """
+        WhileNode method
+        :param node: Parsed node
+        :param context: Context object
+        :return: List of the values of the body, or null
+        """
+        elements = None if node.should_return_null else []
+
+        while cls.evaluate(node.condition_node, context).is_true():
+            try:
+                value = cls.evaluate(node.body_node, context)
+            except ContinueSignal:
+                continue
+            except BreakSignal:
                 break
 
-            elements.append(value)
+            if elements is not None:
+                elements.append(value)
 
-        return res.success(
+        return (
             Number.null
-            if node.should_return_null
+            if elements is None
             else List(elements)
             .set_context(context)
             .set_pos(node.pos_start, node.pos_end)
@@ -446,17 +449,21 @@ class Interpreter:
         FuncDefNode method
         :param node: Parsed node
         :param context: Context object
-        :return: Runtime result success
+        :return: Function
         """
         from TechZen.types.function_ import Function
 
-        res = RTResult()
-
         func_name = node.var_name_token.value if node.var_name_token else None
         body_node = node.body_node
         arg_names = [arg_name.value for arg_name in node.arg_name_tokens]
         func_value = (
-            Function(func_name, body_node, arg_names, node.should_auto_return)
+            Function(
+                func_name,
+                body_node,
+                arg_names,
+                node.should_auto_return,
+                slot_index=node.slot_index,
+            )
             .set_context(context)
             .set_pos(node.pos_start, node.pos_end)
         )
@@ -464,7 +471,7 @@ class Interpreter:
         if node.var_name_token:
             context.symbol_table.set(func_name, func_value)
 
-        return res.success(func_value)
+        return func_value
 
     @classmethod
     def visit_CallNode(cls, node, context):
@@ -472,30 +479,55 @@ class Interpreter:
         CallNode method
         :param node: Parsed node
         :param context: Context object
-        :return: Runtime result success
-        """
-        res = RTResult()
-        args = []
-
-        value_to_call = res.register(cls.visit(node.node_to_call, context))
-        if res.should_return():
-            return res
-        value_to_call = value_to_call.copy().set_pos(node.pos_start, node.pos_end)
-
-        for arg_node in node.arg_nodes:
-            args.append(res.register(cls.visit(arg_node, context)))
-            if res.should_return():
-                return res
-
-        return_value = res.register(value_to_call.execute(args))
-        if res.should_return():
-            return res
-        return_value = (
-            return_value.copy()
-            .set_pos(node.pos_start, node.pos_end)
-            .set_context(context)
-        )
-        return res.success(return_value)
+        :return: Returned value
+        """
+        from TechZen.types.function_ import Function
+
+        value_to_call = cls.evaluate(node.node_to_call, context)
+        args = [cls.evaluate(arg_node, context) for arg_node in node.arg_nodes]
+
+        if (
+            node.tail_body is not None
+            and type(value_to_call) is Function
+            and value_to_call.can_tail_call(node, args)
+        ):
+            raise TailCallSignal(args)
+
+        # Functions and classes run in the context they are called from and report errors at the call
+        if type(value_to_call) is Function and value_to_call.body_closure is None:
+            return cls.call_function(value_to_call, args, node, context)
+        return value_to_call.execute(args, node, context).unwrap()
+
+    @classmethod
+    def call_function(cls, function, args, node, context):
+        """
+        Calls a function of which the body is interpreted, without making a runtime result for the call. A tail call
+        runs the body again in a new context, instead of calling the function again.
+        :param function: Function
+        :param args: Arguments
+        :param node: Node of the call
+        :param context: Context of the call
+        :return: Returned value
+        """
+        if len(args) != len(function.arg_names):
+            raise ErrorSignal(
+                function.check_args(function.arg_names, args, node, context).error
+            )
+
+        exec_ctx = function.generate_new_context(node, context)
+        function.populate_args(function.arg_names, args, exec_ctx)
+
+        while True:
+            try:
+                value = cls.evaluate(function.body_node, exec_ctx)
+            except ReturnSignal as signal:
+                return signal.value
+            except TailCallSignal as signal:
+                exec_ctx = function.generate_tail_context(exec_ctx, signal.args)
+                continue
+            except RecursionError:
+                raise ErrorSignal(function.recursion_error(node, context))
+            return value if function.should_auto_return else Number.null
 
     @classmethod
     def visit_ReturnNode(cls, node, context):
@@ -503,18 +535,14 @@ class Interpreter:
         ReturnNode method
         :param node: Parsed node
         :param context: Context object
-        :return: Runtime result success, return method
+        :return: nothing, raises the return signal
         """
-        res = RTResult()
-
         if node.node_to_return:
-            value = res.register(cls.visit(node.node_to_return, context))
-            if res.should_return():
-                return res
+            value = cls.evaluate(node.node_to_return, context)
         else:
             value = Number.null
 
-        return res.success_return(value)
+        raise ReturnSignal(value)
 
     @classmethod
     def visit_ContinueNode(cls, node, context):
@@ -522,9 +550,9 @@ class Interpreter:
         ContinueNode method
         :param node: Parsed node
         :param context: Context object
-        :return: Runtime result success, continue method
+        :return: nothing, raises the continue signal
         """
-        return RTResult().success_continue()
+        raise ContinueSignal()
 
     @classmethod
     def visit_BreakNode(cls, node, context):
@@ -532,9 +560,9 @@ class Interpreter:
         BreakNode method
         :param node: Parsed node
         :param context: Context object
-        :return: Runtime result success, break method
+        :return: nothing, raises the break signal
         """
-        return RTResult().success_break()
+        raise BreakSignal()
 
     @classmethod
     def visit_ClassNode(cls, node, context):
@@ -542,16 +570,12 @@ class Interpreter:
         ClassNode method
         :param node: Parsed node
         :param context: Context object
-        :return: Runtime result success
+        :return: Class
         """
-        res = RTResult()
-
-        ctx = Context(node.class_name_token.value, node.pos_start)
+        ctx = Context(node.class_name_token.value, context, node.pos_start)
         ctx.symbol_table = SymbolTable(context.symbol_table)
 
-        res.register(cls.visit(node.body_nodes, ctx))
-        if res.should_return():
-            return res
+        cls.evaluate(node.body_nodes, ctx)
 
         cls_ = (
             Class(node.class_name_token.value, ctx.symbol_table)
@@ -559,24 +583,21 @@ class Interpreter:
             .set_pos(node.pos_start, node.pos_end)
         )
         context.symbol_table.set(node.class_name_token.value, cls_)
-        return res.success(cls_)
+        return cls_
 
     @classmethod
     def visit_TryNode(cls, node, context):
         """
-        TryNode method
+        TryNode method. Anything that stops the try statements runs the except statements.
         :param node: Parsed node
         :param context: Context object
-        :return: Runtime result success
+        :return: Null
         """
-        res = RTResult()
-        _ = res.register(cls.visit(node.try_statements, context))
-        broken = bool(res.should_return())
-        if broken:
-            _ = res.register(cls.visit(node.except_statements, context))
-            if res.should_return():
-                return res
-        return res.success(Number.null)
+        try:
+            cls.evaluate(node.try_statements, context)
+        except Signal:
+            cls.evaluate(node.except_statements, context)
+        return Number.null
 
     @classmethod
     def visit_IncludeNode(cls, node, context):
@@ -584,20 +605,65 @@ class Interpreter:
         IncludeNode method
         :param node: Parsed node
         :param context: Context object
-        :return: Runtime result success
+        :return: Null
+        """
+        return cls.include(node, context, "tree")
+
+    @classmethod
+    def run_include(cls, node, context, backend):
+        """
+        Includes a file for the other backends.
+        :param node: IncludeNode
+        :param context: Context object
+        :param backend: "closure" or "vm"
+        :return: Runtime result
+        """
+        try:
+            return RTResult().success(cls.include(node, context, backend))
+        except Signal as signal:
+            return signal.result()
+
+    @classmethod
+    def include(cls, node, context, backend):
+        """
+        Includes a file. Only the functions and classes of the included file are run, the first time it's included
+        by the backend. Later includes of the file set the functions and classes of its module again.
+        :param node: IncludeNode
+        :param context: Context object
+        :param backend: The backend that runs the code, like in Runner.run
+        :return: Null
         """
-        res = RTResult()
         from TechZen.global_symbol_table_ import global_symbol_table
-        from TechZen.parser_ import Parser
-        from TechZen.lexer_ import Lexer
 
-        fn = str(node.file_name)[7:]
+        fn = node.file_name.value
+        module = Module.modules.get(fn)
+        if module is None or module.backend != backend:
+            module = Module.modules[fn] = cls.load_module(node, context, backend)
+
+        # The global table has no parent or slots, so setting the names is a dict update
+        global_symbol_table.symbols.update(module.symbol_table.symbols)
+        return Number.null
+
+    @classmethod
+    def load_module(cls, node, context, backend):
+        """
+        Loads the included file of an IncludeNode and runs its functions and classes. They are run by the backend that
+        includes the file, so the VM gets functions with bytecode and the closure backend functions with compiled
+        closures. They are set in the global symbol table, like before, and kept in the module.
+        :param node: Parsed node
+        :param context: Context object
+        :param backend: The backend that runs the code, like in Runner.run
+        :return: Module
+        """
+        from TechZen.global_symbol_table_ import global_symbol_table
+        from TechZen.cache_ import load_source, close_source, load_ast
+
+        fn = node.file_name.value
 
         try:
-            with open(fn, "r") as f:
-                script = f.read()
+            script = load_source(fn)
         except Exception as e:
-            return RTResult().failure(
+            raise ErrorSignal(
                 RTError(
                     node.pos_start,
                     node.pos_end,
@@ -606,56 +672,56 @@ class Interpreter:
                 )
             )
 
-        lexer = Lexer(str(fn), script)
-        tokens, error = lexer.make_tokens()
+        # Generate Abstract Syntax Tree (AST), or load it from the cache of the file
+        try:
+            ast, error = load_ast(fn, script)
+        finally:
+            close_source(script)
         if error:
-            return None, error, False
-
-        func_tokens = []
-        switch = False
-        switch_arrow = False
-        switch_class = False
-
-        for token in tokens:
-            if str(token) == "KEYWORD:class":
-                switch_class = True
-            if str(token) == "KEYWORD:fun" and not switch_class:
-                switch = True
-
-            if str(token) == "ARROW" and not switch_class:
-                switch_arrow = True
-
-            if switch:
-                func_tokens.append(token)
-
-            if str(token) == "NEWLINE" and switch_arrow:
-                switch = False
-
-            if str(token) == "KEYWORD:endf" and not switch_arrow:
-                switch = False
-
-            if str(token) == "KEYWORD:endc":
-                switch_class = False
-
-        for token in tokens:
-            if str(token) == "KEYWORD:class":
-                switch = True
-            if switch:
-                func_tokens.append(token)
-            if str(token) == "KEYWORD:endc":
-                switch = False
-            if str(token) == "EOF":
-                func_tokens.append(token)
-
-        # Generate Abstract Syntax Tree (AST)
-        parser = Parser(func_tokens)
-        ast = parser.parse()
-        if ast.error:
-            return None, ast.error, False
-
-        interpreter = Interpreter()
+            raise ErrorSignal(error)
+
+        definitions = [
+            statement
+            for statement in ast.element_nodes
+            if isinstance(statement, (nodes_.FuncDefNode, nodes_.ClassNode))
+        ]
+        definitions_node = nodes_.ListNode(definitions, ast.pos_start, ast.pos_end)
+
         context = Context("<program>")
         context.symbol_table = global_symbol_table
-        result = interpreter.visit(ast.node, context)
+        if backend == "vm":
+            from TechZen.bytecode_ import BytecodeCompiler
+            from TechZen.vm_ import VM
+
+            result = VM.run(
+                BytecodeCompiler.compile_program(definitions_node, fn), context
+            )
+        elif backend == "closure":
+            from TechZen.compiler_ import Compiler
+
+            result = Compiler.compile(definitions_node)(context)
+        else:
+            result = cls.visit(definitions_node, context)
+        if result.error:
+            raise ErrorSignal(result.error)
+
+        symbol_table = SymbolTable()
+        for definition in definitions:
+            name_token = (
+                definition.var_name_token
+                if isinstance(definition, nodes_.FuncDefNode)
+                else definition.class_name_token
+            )
+            if name_token:
+                symbol_table.set(
+                    name_token.value, global_symbol_table.get(name_token.value)
+                )
+        return Module(fn, symbol_table, backend)
+
 
-        return res.success(Number.null)
+# Maps every node class to its visit method, so Interpreter.evaluate only costs one dict lookup.
+Interpreter.dispatch_table = {
+    node_class: getattr(Interpreter, f"visit_{name}")
+    for name, node_class in vars(nodes_).items()
+    if isinstance(node_class, type) and hasattr(Interpreter, f"visit_{name}")
+}
@@ -1,3 +1,5 @@
+import re
+
 from TechZen.token_ import (
     Token,
     TokenType,
@@ -8,108 +10,159 @@ from TechZen.token_ import (
     COMMENT_SYMBOL,
     SYMBOL_TO_TOKENS,
 )
-from TechZen.position_ import Position
+from TechZen.position_ import Source, Position
 from TechZen.errors_ import IllegalCharError, ExpectedCharError
 
 
-LETTERS_DIGITS = LETTERS + DIGITS
+# Tokens of one or two characters, the lexer reads UTF-8 bytes
+OPERATOR_TOKENS = {
+    symbol.encode(): token_type
+    for symbol, token_type in {
+        **SYMBOL_TO_TOKENS,
+        "-": TokenType.TT_MINUS,
+        "->": TokenType.TT_ARROW,
+        "/": TokenType.TT_DIV,
+        "//": TokenType.TT_DFL,
+        "=": TokenType.TT_EQ,
+        "==": TokenType.TT_EE,
+        "!=": TokenType.TT_NE,
+        "<": TokenType.TT_LT,
+        "<=": TokenType.TT_LTE,
+        ">": TokenType.TT_GT,
+        ">=": TokenType.TT_GTE,
+    }.items()
+}
+ESCAPE_CHARACTERS = {b"n": b"\n", b"t": b"\t", b"r": b"\r", b"v": b"\v", b"0": b"\0"}
+
+# The master pattern: the spaces and tabs before a token, then one of the tokens the lexer sees most. Everything else
+# (comments, strings with escapes or without an end, '!' without '=' and illegal characters) only matches the spaces
+# and is made by a method of the lexer.
+TOKEN_PATTERN = re.compile(
+    (
+        f"(?P<skip>[{re.escape(SKIP_LETTERS)}]*)(?:"
+        + "|".join(
+            [
+                r"(?P<newline>\n)",
+                f"(?P<identifier>[{LETTERS}][{LETTERS}{DIGITS}_]*)",
+                f"(?P<float>[{DIGITS}]+\\.[{DIGITS}]*)",
+                f"(?P<int>[{DIGITS}]+)",
+                r"""(?P<string>"[^"\\]*"|'[^'\\]*')""",
+                r"(?P<minus>->?)",
+                "(?P<operator>//|[=!<>]=|[{}])".format(
+                    "".join(
+                        re.escape(symbol.decode())
+                        for symbol in OPERATOR_TOKENS
+                        if len(symbol) == 1 and symbol not in b"-\n"
+                    )
+                ),
+            ]
+        )
+        + ")?"
+    ).encode()
+)
+COMMENT_BYTES = COMMENT_SYMBOL.encode()
+STRING_PART_PATTERNS = {quote: re.compile(b"[^%s\\\\]*" % quote) for quote in (b'"', b"'")}
+
+
+def next_char(text, idx):
+    """
+    Finds where the character after the one at an index starts. A character is one to four bytes in UTF-8, the bytes
+    after the first one are 0b10xxxxxx. After the end of the code, it's the next index.
+    :param text: UTF-8 bytes
+    :param idx: Index of the character
+    :return: Index of the next character
+    """
+    idx += 1
+    while idx < len(text) and text[idx] & 0xC0 == 0x80:
+        idx += 1
+    return idx
 
 
 class Lexer:
     def __init__(self, fn, text):
         """
         This is the lexer of the language. It takes in an input and figures out what each character/word stands for
-        (Token).
+        (Token). It matches a token at a time with TOKEN_PATTERN, and gives tokens their indices in the source. The
+        input is read as UTF-8 bytes, so a memory map of a file is lexed without reading all of it into a string, and
+        only the names and strings in it are decoded.
         :param fn: File name of input
-        :param text: Input to make tokens out of
+        :param text: Input to make tokens out of, a string or UTF-8 bytes (like a memory map)
         """
+        if isinstance(text, str):
+            text = text.encode("utf-8", "surrogatepass")
         self.fn = fn
         self.text = text
-        self.pos = Position(-1, 0, -1, fn, text)
-        self.current_char = None
-        self.advance()
-
-    def advance(self):
-        """
-        Advance to the next character
-        :return: nothing
-        """
-        self.pos.advance(self.current_char)
-        self.current_char = (
-            self.text[self.pos.idx] if self.pos.idx < len(self.text) else None
-        )
+        self.source = Source(fn, text)
+        self.idx = 0
+        self.error = None
 
-    def make_tokens(self):  # sourcery no-metrics
+    def make_tokens(self):
         """
         Makes tokens from the input.
         :return: The input in token format, if there is an error, then the error
         """
-        tokens = []
-
-        while self.current_char is not None:
-            if self.current_char in SKIP_LETTERS:
-                self.advance()
-            elif self.current_char == COMMENT_SYMBOL:
-                self.skip_comment()
-            elif self.current_char in DIGITS:
-                tokens.append(self.make_number())
-            elif self.current_char in LETTERS:
-                tokens.append(self.make_identifier())
-            elif self.current_char in SYMBOL_TO_TOKENS:
-                tokens.append(
-                    Token(SYMBOL_TO_TOKENS[self.current_char], pos_start=self.pos)
-                )
-                self.advance()
-            elif self.current_char in ('"', "'"):
-                tokens.append(self.make_string(self.current_char))
-            elif self.current_char == "-":
-                tokens.append(self.make_minus_or_arrow())
-                self.advance()
-            elif self.current_char == "/":
-                tokens.append(self.make_division())
-            elif self.current_char == "!":
-                token, error = self.make_not_equals()
-                if error:
-                    return [], error
-                tokens.append(token)
-            elif self.current_char == "=":
-                tokens.append(self.make_equals())
-            elif self.current_char == "<":
-                tokens.append(self.make_less_than())
-            elif self.current_char == ">":
-                tokens.append(self.make_greater_than())
-            else:
-                pos_start = self.pos.copy()
-                char = self.current_char
-                self.advance()
-                return [], IllegalCharError(pos_start, self.pos, "'" + char + "'")
-
-        tokens.append(Token(TokenType.TT_EOF, pos_start=self.pos))
+        tokens = list(self.iter_tokens())
+        if self.error:
+            return [], self.error
         return tokens, None
 
-    def make_number(self):
+    def iter_tokens(self):  # sourcery no-metrics
         """
-        Decides whether number is an integer or a floating point.
-        :return: Integer or floating point
+        Makes tokens from the input one at a time, when they are needed, so all of them never have to be in memory.
+        If there is an error, it's saved in self.error and the tokens end with an EOF token where the error is.
+        :return: Every token, the last one is EOF
         """
-        num_str = ""
-        dot_count = 0
-        pos_start = self.pos.copy()
+        source = self.source
+        text = self.text
+        match = TOKEN_PATTERN.match
 
-        while self.current_char is not None and self.current_char in DIGITS + ".":
-            if self.current_char == ".":
-                if dot_count == 1:
+        while self.idx < len(text):
+            token_match = match(text, self.idx)
+            kind = token_match.lastgroup
+
+            if kind == "skip":
+                idx = self.idx = token_match.end()
+                if idx == len(text):
+                    break
+                char = text[idx : idx + 1]
+                if char in (b'"', b"'"):
+                    yield self.make_string(char)
+                elif char == COMMENT_BYTES:
+                    self.skip_comment()
+                elif char == b"!":
+                    self.error = self.make_not_equals()
                     break
-                dot_count += 1
-                num_str += "."
+                else:
+                    self.error = self.make_illegal_char()
+                    break
+                continue
+
+            idx = token_match.start(kind)
+            end = token_match.end()
+            lexeme = token_match.group(kind)
+            if kind == "identifier":
+                lexeme = lexeme.decode()
+                token_type = (
+                    TokenType.TT_KEYWORD
+                    if lexeme.upper() in KEYWORDS
+                    else TokenType.TT_IDENTIFIER
+                )
+                yield Token(token_type, lexeme, source, idx, end)
+            elif kind == "int":
+                yield Token(TokenType.TT_INT, int(lexeme), source, idx, end)
+            elif kind == "float":
+                yield Token(TokenType.TT_FLOAT, float(lexeme), source, idx, end)
+            elif kind == "string":
+                value = lexeme[1:-1].decode("utf-8", "replace")
+                yield Token(TokenType.TT_STRING, value, source, idx, end)
             else:
-                num_str += self.current_char
-            self.advance()
+                yield Token(OPERATOR_TOKENS[lexeme], None, source, idx, end)
+                if kind == "minus":
+                    # The character after a minus or an arrow is skipped
+                    end = next_char(text, end)
+            self.idx = end
 
-        if dot_count == 0:
-            return Token(TokenType.TT_INT, int(num_str), pos_start, self.pos)
-        else:
-            return Token(TokenType.TT_FLOAT, float(num_str), pos_start, self.pos)
+        yield Token(TokenType.TT_EOF, None, source, self.idx)
 
     def make_string(self, qt):
         """
@@ -117,160 +170,80 @@ class Lexer:
         :param qt: Quote type " or '
         :return:
         """
-        string = ""
-        pos_start = self.pos.copy()
-        escape_character = False
-        self.advance()
-
-        escape_characters = {"n": "\n", "t": "\t", "r": "\r", "v": "\v", "0": "\0"}
-
-        while self.current_char is not None and (
-            self.current_char != qt or escape_character
-        ):
-            if escape_character:
-                string += escape_characters.get(self.current_char, self.current_char)
-                escape_character = False
-            elif self.current_char == "\\":
-                escape_character = True
-            else:
-                string += self.current_char
-            self.advance()
-
-        self.advance()
-        return Token(TokenType.TT_STRING, string, pos_start, self.pos)
-
-    def make_identifier(self):
-        """
-        Finds out if a token is an identifier or a keyword.
-        :return: Token - KEYWORD or IDENTIFIER
-        """
-        id_str = ""
-        pos_start = self.pos.copy()
-
-        while (
-            self.current_char is not None and self.current_char in LETTERS_DIGITS + "_"
-        ):
-            id_str += self.current_char
-            self.advance()
-
-        token_type = (
-            TokenType.TT_KEYWORD
-            if id_str.upper() in KEYWORDS
-            else TokenType.TT_IDENTIFIER
-        )
-        return Token(token_type, id_str, pos_start, self.pos)
-
-    def make_minus_or_arrow(self):
-        """
-        Decides if the minus is a minus or an arrow.
-        :return: Token - MINUS or ARROW
-        """
-        token_type = TokenType.TT_MINUS
-        pos_start = self.pos.copy()
-        self.advance()
-
-        if self.current_char == ">":
-            self.advance()
-            token_type = TokenType.TT_ARROW
-
-        return Token(token_type, pos_start=pos_start, pos_end=self.pos)
+        text = self.text
+        part_pattern = STRING_PART_PATTERNS[qt]
+        parts = []
+        start = self.idx
+        idx = start + 1
+
+        while idx < len(text):
+            end = part_pattern.match(text, idx).end()
+            parts.append(text[idx:end])
+            idx = end
+            if idx == len(text) or text[idx : idx + 1] == qt:
+                break
+            # A backslash, the character after it is escaped
+            idx += 1
+            if idx < len(text):
+                char = text[idx : idx + 1]
+                parts.append(ESCAPE_CHARACTERS.get(char, char))
+                idx += 1
+
+        self.idx = idx + 1
+        value = b"".join(parts).decode("utf-8", "replace")
+        return Token(TokenType.TT_STRING, value, self.source, start, self.idx)
 
     def make_not_equals(self):
         """
-        Makes the not equals token.
-        :return: Token or error
-        """
-        pos_start = self.pos.copy()
-        self.advance()
-
-        if self.current_char == "=":
-            self.advance()
-            return Token(TokenType.TT_NE, pos_start=pos_start, pos_end=self.pos), None
-
-        self.advance()
-        return None, ExpectedCharError(pos_start, self.pos, "'=' (after '!')")
-
-    def make_division(self):
-        """
-        Decides if "/" is a division or a floor.
-        :return: Token - DIV or DFL
-        """
-        token_type = TokenType.TT_DIV
-        pos_start = self.pos.copy()
-        self.advance()
-
-        if self.current_char == "/":
-            self.advance()
-            token_type = TokenType.TT_DFL
-
-        return Token(token_type, pos_start=pos_start, pos_end=self.pos)
-
-    def make_equals(self):
-        """
-        Decides if "=" is an equal sign or an is equal sign.
-        :return: Token - EQUALS or IS_EQUAL
-        """
-        token_type = TokenType.TT_EQ
-        pos_start = self.pos.copy()
-        self.advance()
-
-        if self.current_char == "=":
-            self.advance()
-            token_type = TokenType.TT_EE
-
-        return Token(token_type, pos_start=pos_start, pos_end=self.pos)
-
-    def make_less_than(self):
-        """
-        Decides if "<" is less than or less than or equal to.
-        :return: Token - LESS_THAN or LESS_THAN_OR_EQUAL
+        Makes the error of a '!' that isn't followed by '='.
+        :return: Error
         """
-        token_type = TokenType.TT_LT
-        pos_start = self.pos.copy()
-        self.advance()
-
-        if self.current_char == "=":
-            self.advance()
-            token_type = TokenType.TT_LTE
-
-        return Token(token_type, pos_start=pos_start, pos_end=self.pos)
+        end = next_char(self.text, self.idx + 1)
+        return ExpectedCharError(
+            Position(self.source, self.idx),
+            Position(self.source, end),
+            "'=' (after '!')",
+        )
 
-    def make_greater_than(self):
+    def make_illegal_char(self):
         """
-        Decides if ">" is greater than or greater than or equal to.
-        :return: Token - GREATER_THAN or GREATER_THAN_OR_EQUAL
+        Makes the error of a character that can't start a token.
+        :return: Error
         """
-        token_type = TokenType.TT_GT
-        pos_start = self.pos.copy()
-        self.advance()
-
-        if self.current_char == "=":
-            self.advance()
-            token_type = TokenType.TT_GTE
-
-        return Token(token_type, pos_start=pos_start, pos_end=self.pos)
+        end = next_char(self.text, self.idx)
+        return IllegalCharError(
+            Position(self.source, self.idx),
+            Position(self.source, end),
+            "'" + self.text[self.idx : end].decode("utf-8", "replace") + "'",
+        )
 
     def skip_comment(self):
         """
         Skips all comments, even multiline comments.
         :return: nothing
         """
-        pos_start = self.pos.copy()
-        self.advance()
-        if self.current_char == "[":
-            self.advance()
-            while self.current_char != "]":
-                self.advance()
-            self.advance()
-            if self.current_char != "#":
+        text = self.text
+        pos_start = Position(self.source, self.idx)
+        idx = self.idx + 1
+        if text[idx : idx + 1] == b"[":
+            end = text.find(b"]", idx + 1)
+            if end == -1:
+                self.idx = len(text)
+                return
+            self.idx = end + 1
+            if text[self.idx : self.idx + 1] != COMMENT_BYTES:
                 return (
                     None,
                     ExpectedCharError(
                         pos_start,
-                        self.pos,
+                        Position(self.source, self.idx),
                         "While making multiline comment, a '#' (Hash sign) is expected after a ']' (Square bracket)",
                     ),
                 )
-            while self.current_char != "\n":
-                self.advance()
-        self.advance()
+            idx = text.find(b"\n", self.idx)
+            if idx == -1:
+                idx = len(text)
+            self.idx = idx + 1
+        else:
+            # The character after the comment symbol is skipped
+            self.idx = next_char(text, idx)
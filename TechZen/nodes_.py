@@ -1,13 +1,19 @@
 # TODO docstring
+from TechZen.types.number_ import Number
+from TechZen.operations_ import binary_method, NUMBER_OPERATIONS
 
 
 class NumberNode:
+    __slots__ = ("token", "constant", "pos_start", "pos_end", "child")
+
     def __init__(self, token):
         """
         This is the number node in the AST that's parsed in the Parser.
         :param token: Number
         """
         self.token = token
+        # The value of the literal, made once and shared by every run of the node
+        self.constant = Number.of(token.value)
 
         self.pos_start = self.token.pos_start
         self.pos_end = self.token.pos_end
@@ -19,6 +25,8 @@ class NumberNode:
 
 
 class StringNode:
+    __slots__ = ("token", "pos_start", "pos_end", "child")
+
     def __init__(self, token):
         """
         This is the string node in the AST that's parsed in the Parser.
@@ -36,6 +44,8 @@ class StringNode:
 
 
 class ListNode:
+    __slots__ = ("element_nodes", "pos_start", "pos_end", "child")
+
     def __init__(self, element_nodes, pos_start, pos_end):
         """
         This is the list node in the AST that's parsed in the Parser.
@@ -52,6 +62,8 @@ class ListNode:
 
 
 class DictNode:
+    __slots__ = ("element_nodes", "pos_start", "pos_end", "child")
+
     def __init__(self, element_nodes, pos_start, pos_end):
         """
         This is the dictionary node in the AST that's parsed in the Parser.
@@ -67,7 +79,41 @@ class DictNode:
         self.child = None
 
 
+class InlineCache:
+    __slots__ = ("shape", "slot")
+
+    def __init__(self):
+        """
+        Inline cache of a member of an access ('a.b') or an assignment ('var a.b = c'). It keeps the shape of the last
+        instance the member was looked up in and the slot of the member in that shape.
+        """
+        self.shape = None
+        self.slot = None
+
+    def find_slot(self, shape, name):
+        """
+        Find the slot of a member in a shape. Only looked up when the shape is not the one of the last lookup.
+        :param shape: Shape of the instance, maps the names of its fields to their slot
+        :param name: Member name
+        :return: Slot, None if the member is not a field of the shape
+        """
+        if shape is not self.shape:
+            self.shape = shape
+            self.slot = shape.get(name, None)
+        return self.slot
+
+
 class VarAccessNode:
+    __slots__ = (
+        "var_name_token",
+        "pos_start",
+        "pos_end",
+        "slot",
+        "is_global",
+        "cache",
+        "child",
+    )
+
     def __init__(self, var_name_token):
         """
         This is the variable access node in the AST that's parsed in the Parser.'
@@ -78,10 +124,27 @@ class VarAccessNode:
         self.pos_start = self.var_name_token.pos_start
         self.pos_end = self.var_name_token.pos_end
 
+        # Set by the Resolver: the local slot of the variable, or whether it is read from the global table
+        self.slot = None
+        self.is_global = False
+        # Inline cache, made the first time the node is read as a member of an instance
+        self.cache = None
+
         self.child = None
 
 
 class VarAssignNode:
+    __slots__ = (
+        "var_name_token",
+        "value_node",
+        "extra_names",
+        "pos_start",
+        "pos_end",
+        "slot",
+        "caches",
+        "child",
+    )
+
     def __init__(self, var_name_token, value_node, extra_names=None):
         """
         This is the variable assign node in the AST that's parsed in the Parser.'
@@ -102,10 +165,26 @@ class VarAssignNode:
             else self.var_name_token.pos_end
         )
 
+        # Set by the Resolver: the local slot of the variable
+        self.slot = None
+        # Inline caches of the extra names
+        self.caches = [InlineCache() for _ in self.extra_names]
+
         self.child = None
 
 
 class BinOpNode:
+    __slots__ = (
+        "left_node",
+        "op_token",
+        "right_node",
+        "operation",
+        "number_operation",
+        "pos_start",
+        "pos_end",
+        "child",
+    )
+
     def __init__(self, left_node, op_token, right_node):
         """
         This is the binary operation node in the AST that's parsed in the Parser.'
@@ -116,6 +195,9 @@ class BinOpNode:
         self.left_node = left_node
         self.op_token = op_token
         self.right_node = right_node
+        # The Value method of the operator and what it does for two numbers, found once for every run of the node
+        self.operation = binary_method(op_token)
+        self.number_operation = NUMBER_OPERATIONS[self.operation]
 
         self.pos_start = self.left_node.pos_start
         self.pos_end = self.right_node.pos_end
@@ -127,6 +209,8 @@ class BinOpNode:
 
 
 class UnaryOpNode:
+    __slots__ = ("op_token", "node", "pos_start", "pos_end", "child")
+
     def __init__(self, op_token, node):
         """
         This is the unary operation node in the AST that's parsed in the Parser.
@@ -146,6 +230,8 @@ class UnaryOpNode:
 
 
 class IfNode:
+    __slots__ = ("cases", "else_case", "pos_start", "pos_end", "child")
+
     def __init__(self, cases, else_case):
         """
         This is the if node in the AST that's parsed in the Parser.
@@ -162,6 +248,19 @@ class IfNode:
 
 
 class ForNode:
+    __slots__ = (
+        "var_name_token",
+        "start_value_node",
+        "end_value_node",
+        "step_value_node",
+        "body_node",
+        "should_return_null",
+        "pos_start",
+        "pos_end",
+        "slot",
+        "child",
+    )
+
     def __init__(
         self,
         var_name_token,
@@ -190,10 +289,22 @@ class ForNode:
         self.pos_start = self.var_name_token.pos_start
         self.pos_end = self.body_node.pos_end
 
+        # Set by the Resolver: the local slot of the variable
+        self.slot = None
+
         self.child = None
 
 
 class WhileNode:
+    __slots__ = (
+        "condition_node",
+        "body_node",
+        "should_return_null",
+        "pos_start",
+        "pos_end",
+        "child",
+    )
+
     def __init__(self, condition_node, body_node, should_return_null):
         """
         This is the while node in the AST that's parsed in the Parser.
@@ -212,6 +323,17 @@ class WhileNode:
 
 
 class FuncDefNode:
+    __slots__ = (
+        "var_name_token",
+        "arg_name_tokens",
+        "body_node",
+        "should_auto_return",
+        "pos_start",
+        "pos_end",
+        "slot_index",
+        "child",
+    )
+
     def __init__(self, var_name_token, arg_name_tokens, body_node, should_auto_return):
         """
         This is the function definition node in the AST that's parsed in the Parser.
@@ -234,10 +356,22 @@ class FuncDefNode:
 
         self.pos_end = self.body_node.pos_end
 
+        # Set by the Resolver: maps the arguments and local variables of the function to their slot
+        self.slot_index = None
+
         self.child = None
 
 
 class CallNode:
+    __slots__ = (
+        "node_to_call",
+        "arg_nodes",
+        "pos_start",
+        "pos_end",
+        "child",
+        "tail_body",
+    )
+
     def __init__(self, node_to_call, arg_nodes):
         """
         This is the call node in the AST that's parsed in the Parser.
@@ -256,8 +390,14 @@ class CallNode:
 
         self.child = None
 
+        # Set by the Resolver: the body of the function the call is in, when the function calls itself by its name as
+        # the last thing it does (a tail call)
+        self.tail_body = None
+
 
 class ReturnNode:
+    __slots__ = ("node_to_return", "pos_start", "pos_end", "child")
+
     def __init__(self, node_to_return, pos_start, pos_end):
         """
         This is the return node in the AST that's parsed in the Parser.
@@ -274,6 +414,8 @@ class ReturnNode:
 
 
 class ContinueNode:
+    __slots__ = ("pos_start", "pos_end", "child")
+
     def __init__(self, pos_start, pos_end):
         """
         This is the continue node in the AST that's parsed in the Parser.
@@ -287,6 +429,8 @@ class ContinueNode:
 
 
 class BreakNode:
+    __slots__ = ("pos_start", "pos_end", "child")
+
     def __init__(self, pos_start, pos_end):
         """
         This is the break node in the AST that's parsed in the Parser.
@@ -300,6 +444,8 @@ class BreakNode:
 
 
 class ClassNode:
+    __slots__ = ("class_name_token", "body_nodes", "pos_start", "pos_end", "child")
+
     def __init__(self, class_name_token, body_nodes, pos_start, pos_end):
         """
         This is the class node in the AST that's parsed in the Parser.
@@ -317,6 +463,8 @@ class ClassNode:
 
 
 class TryNode:
+    __slots__ = ("try_statements", "except_statements", "pos_start", "pos_end", "child")
+
     def __init__(self, try_statements, except_statements, pos_start, pos_end):
         """
         This is the try node in the AST that's parsed in the Parser.
@@ -334,6 +482,8 @@ class TryNode:
 
 
 class IncludeNode:
+    __slots__ = ("file_name", "pos_start", "pos_end", "child")
+
     def __init__(self, file_name, pos_start, pos_end):
         self.file_name = file_name
         self.pos_start = pos_start
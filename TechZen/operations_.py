@@ -0,0 +1,157 @@
+#######################################
+# OPERATIONS
+#######################################
+import operator
+
+from TechZen.token_ import TokenType, Keywords
+
+# The Value method every binary operator calls, by token type, or by keyword for AND and OR.
+BINARY_METHODS = {
+    TokenType.TT_PLUS: "added_to",
+    TokenType.TT_MINUS: "subbed_by",
+    TokenType.TT_MUL: "multed_by",
+    TokenType.TT_POW: "pow_of",
+    TokenType.TT_MOD: "mod_by",
+    TokenType.TT_DIV: "dived_by",
+    TokenType.TT_DFL: "floor_of",
+    TokenType.TT_EE: "get_comparison_eq",
+    TokenType.TT_NE: "get_comparison_ne",
+    TokenType.TT_LT: "get_comparison_lt",
+    TokenType.TT_GT: "get_comparison_gt",
+    TokenType.TT_LTE: "get_comparison_lte",
+    TokenType.TT_GTE: "get_comparison_gte",
+    Keywords.KW_AND.value: "anded_by",
+    Keywords.KW_OR.value: "ored_by",
+}
+
+
+def binary_method(op_token):
+    """
+    Finds the Value method of a binary operator.
+    :param op_token: The operator token
+    :return: Method name
+    """
+    if op_token.type == TokenType.TT_KEYWORD:
+        return BINARY_METHODS.get(op_token.value.upper())
+    return BINARY_METHODS.get(op_token.type)
+
+
+def divide(a, b):
+    """
+    Divides two numbers.
+    :param a: Number value, the dividend
+    :param b: Number value, the divisor
+    :return: Quotient, None when dividing by zero
+    """
+    return None if b == 0 else a / b
+
+
+def floor_divide(a, b):
+    """
+    Floor divides two numbers.
+    :param a: Number value, the dividend
+    :param b: Number value, the divisor
+    :return: Quotient, None when dividing by zero
+    """
+    return None if b == 0 else a // b
+
+
+def equals(a, b):
+    """
+    Decides whether two numbers are equal.
+    :param a: Number value
+    :param b: Number value
+    :return: 1 if they are equal, otherwise 0
+    """
+    return int(a == b)
+
+
+def not_equals(a, b):
+    """
+    Decides whether two numbers are not equal.
+    :param a: Number value
+    :param b: Number value
+    :return: 1 if they are not equal, otherwise 0
+    """
+    return int(a != b)
+
+
+def less_than(a, b):
+    """
+    Decides whether a number is less than another.
+    :param a: Number value
+    :param b: Number value
+    :return: 1 if a is less than b, otherwise 0
+    """
+    return int(a < b)
+
+
+def greater_than(a, b):
+    """
+    Decides whether a number is greater than another.
+    :param a: Number value
+    :param b: Number value
+    :return: 1 if a is greater than b, otherwise 0
+    """
+    return int(a > b)
+
+
+def less_than_or_equals(a, b):
+    """
+    Decides whether a number is less than or equal to another.
+    :param a: Number value
+    :param b: Number value
+    :return: 1 if a is less than or equal to b, otherwise 0
+    """
+    return int(a <= b)
+
+
+def greater_than_or_equals(a, b):
+    """
+    Decides whether a number is greater than or equal to another.
+    :param a: Number value
+    :param b: Number value
+    :return: 1 if a is greater than or equal to b, otherwise 0
+    """
+    return int(a >= b)
+
+
+def and_(a, b):
+    """
+    Decides whether two numbers are true.
+    :param a: Number value
+    :param b: Number value
+    :return: 1 if both are true, otherwise 0
+    """
+    return int(a and b)
+
+
+def or_(a, b):
+    """
+    Decides whether one of two numbers is true.
+    :param a: Number value
+    :param b: Number value
+    :return: 1 if one of them is true, otherwise 0
+    """
+    return int(a or b)
+
+
+# What the methods of Number do with the values of two numbers, so operations on two numbers do not need the Value
+# methods. None means the method makes an error, like a division by zero.
+NUMBER_OPERATIONS = {
+    "added_to": operator.add,
+    "subbed_by": operator.sub,
+    "multed_by": operator.mul,
+    "pow_of": operator.pow,
+    "mod_by": operator.mod,
+    "dived_by": divide,
+    "floor_of": floor_divide,
+    "get_comparison_eq": equals,
+    "get_comparison_ne": not_equals,
+    "get_comparison_lt": less_than,
+    "get_comparison_gt": greater_than,
+    "get_comparison_lte": less_than_or_equals,
+    "get_comparison_gte": greater_than_or_equals,
+    "anded_by": and_,
+    "ored_by": or_,
+}
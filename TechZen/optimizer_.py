@@ -0,0 +1,311 @@
+#######################################
+# OPTIMIZER
+#######################################
+from TechZen import nodes_
+from TechZen.token_ import Token, TokenType
+from TechZen.types.number_ import Number
+from TechZen.types.string_ import String
+
+# Set to False to run programs as they are written, without folding constants.
+enabled = True
+
+# Number of nodes the Optimizer folded away since the start, the report of what it did.
+folded = 0
+
+# Folded operations that could take long or make huge values are left to run, results are at most this big (bits of
+# an integer, or characters of a string).
+MAX_FOLDED_SIZE = 4096
+
+
+class Optimizer:
+    @classmethod
+    def optimize(cls, node):
+        """
+        Folds the constants of a parsed program before it runs. Operations on numbers and strings that are known
+        before the program runs are replaced by their result, and the cases of an if statement that can never run
+        are removed. Operations with an error are left as they are, so the error is raised when they run.
+        Members ('a.b') are left out, like in the Resolver. Names are never folded, not even NULL, TRUE and FALSE: any
+        code that runs later, like a file that is run or included, can set them.
+        :param node: Parsed node
+        :return: Optimized node, the node itself or the node that replaces it
+        """
+        if not enabled:
+            return node
+        return cls.visit(node)
+
+    @classmethod
+    def visit(cls, node):
+        """
+        Optimizes a node and the nodes inside it.
+        :param node: Parsed node
+        :return: Optimized node
+        """
+        return cls.dispatch_table.get(type(node), cls.no_visit_method)(node)
+
+    @staticmethod
+    def no_visit_method(node):
+        """
+        Nodes without names or nodes inside them are left as they are.
+        :param node: Parsed node
+        :return: The node
+        """
+        return node
+
+    @staticmethod
+    def constant(node):
+        """
+        Gets the value of a node that is a constant.
+        :param node: Parsed node
+        :return: Number or String, None if the node is not a constant
+        """
+        if node.child is not None:
+            return None
+        if isinstance(node, nodes_.NumberNode):
+            return node.constant
+        if isinstance(node, nodes_.StringNode):
+            return String(node.token.value)
+        return None
+
+    @staticmethod
+    def make_constant(value, node):
+        """
+        Makes the node of a folded value.
+        :param value: Number or String
+        :param node: Node the value replaces, the new node gets its position
+        :return: NumberNode or StringNode, None if the value is not a number or a string
+        """
+        global folded
+
+        if isinstance(value, Number):
+            is_float = type(value.value) is float
+            type_ = TokenType.TT_FLOAT if is_float else TokenType.TT_INT
+            node_class = nodes_.NumberNode
+        elif isinstance(value, String):
+            type_ = TokenType.TT_STRING
+            node_class = nodes_.StringNode
+        else:
+            return None
+
+        folded += 1
+        pos_start, pos_end = node.pos_start, node.pos_end
+        return node_class(
+            Token(type_, value.value, pos_start.source, pos_start.idx, pos_end.idx)
+        )
+
+    @staticmethod
+    def too_big(op_token, left, right):
+        """
+        Decides whether an operation should be left to run, because it could take long or make a huge value.
+        :param op_token: The operator token
+        :param left: Value on the left of the operator
+        :param right: Value on the right of the operator
+        :return: Boolean
+        """
+        if op_token.type == TokenType.TT_POW:
+            if not isinstance(left.value, int) or not isinstance(right.value, int):
+                return abs(right.value) > 64
+            return abs(right.value) * left.value.bit_length() > MAX_FOLDED_SIZE
+        if op_token.type == TokenType.TT_MUL and isinstance(left, String):
+            return len(left.value) * right.value > MAX_FOLDED_SIZE
+        return False
+
+    @classmethod
+    def visit_ListNode(cls, node):
+        """
+        ListNode method
+        :param node: Parsed node
+        :return: Optimized node
+        """
+        node.element_nodes = [
+            cls.visit(element_node) for element_node in node.element_nodes
+        ]
+        return node
+
+    @classmethod
+    def visit_DictNode(cls, node):
+        """
+        DictNode method
+        :param node: Parsed node
+        :return: Optimized node
+        """
+        node.element_nodes = {
+            cls.visit(key): cls.visit(value)
+            for key, value in node.element_nodes.items()
+        }
+        return node
+
+    @classmethod
+    def visit_VarAssignNode(cls, node):
+        """
+        VarAssignNode method
+        :param node: Parsed node
+        :return: Optimized node
+        """
+        node.value_node = cls.visit(node.value_node)
+        return node
+
+    @classmethod
+    def visit_BinOpNode(cls, node):
+        """
+        BinOpNode method
+        :param node: Parsed node
+        :return: Optimized node, a constant if both operands are constants
+        """
+        from TechZen.interpreter_ import Interpreter
+
+        node.left_node = cls.visit(node.left_node)
+        node.right_node = cls.visit(node.right_node)
+
+        left = cls.constant(node.left_node)
+        right = cls.constant(node.right_node)
+        if left is None or right is None or node.child is not None:
+            return node
+
+        try:
+            if cls.too_big(node.op_token, left, right):
+                return node
+            result, error = Interpreter.binary_operation(node.op_token, left, right)
+        except (ArithmeticError, TypeError, ValueError):
+            # Fails the same way when it runs
+            return node
+        if error:
+            return node
+        return cls.make_constant(result, node) or node
+
+    @classmethod
+    def visit_UnaryOpNode(cls, node):
+        """
+        UnaryOpNode method
+        :param node: Parsed node
+        :return: Optimized node, a constant if the operand is a constant
+        """
+        from TechZen.interpreter_ import Interpreter
+
+        node.node = cls.visit(node.node)
+
+        number = cls.constant(node.node)
+        if number is None or node.child is not None:
+            return node
+
+        result, error = Interpreter.unary_operation(
+            node.op_token, number, Number.of(-1)
+        )
+        if error:
+            return node
+        return cls.make_constant(result, node) or node
+
+    @classmethod
+    def visit_IfNode(cls, node):
+        """
+        IfNode method. Cases with a condition that is always false are removed. A case with a condition that is
+        always true becomes the else case, the cases after it are removed.
+        :param node: Parsed node
+        :return: Optimized node
+        """
+        global folded
+
+        cases = []
+        for index, (condition, expr, should_return_null) in enumerate(node.cases):
+            condition = cls.visit(condition)
+            expr = cls.visit(expr)
+            value = cls.constant(condition)
+            if value is None:
+                cases.append((condition, expr, should_return_null))
+            elif value.is_true():
+                folded += len(node.cases) - index + (1 if node.else_case else 0)
+                node.cases = cases
+                node.else_case = (expr, should_return_null)
+                return node
+            else:
+                folded += 1
+
+        node.cases = cases
+        if node.else_case:
+            expr, should_return_null = node.else_case
+            node.else_case = (cls.visit(expr), should_return_null)
+        return node
+
+    @classmethod
+    def visit_ForNode(cls, node):
+        """
+        ForNode method
+        :param node: Parsed node
+        :return: Optimized node
+        """
+        node.start_value_node = cls.visit(node.start_value_node)
+        node.end_value_node = cls.visit(node.end_value_node)
+        if node.step_value_node:
+            node.step_value_node = cls.visit(node.step_value_node)
+        node.body_node = cls.visit(node.body_node)
+        return node
+
+    @classmethod
+    def visit_WhileNode(cls, node):
+        """
+        WhileNode method
+        :param node: Parsed node
+        :return: Optimized node
+        """
+        node.condition_node = cls.visit(node.condition_node)
+        node.body_node = cls.visit(node.body_node)
+        return node
+
+    @classmethod
+    def visit_FuncDefNode(cls, node):
+        """
+        FuncDefNode method
+        :param node: Parsed node
+        :return: Optimized node
+        """
+        node.body_node = cls.visit(node.body_node)
+        return node
+
+    @classmethod
+    def visit_CallNode(cls, node):
+        """
+        CallNode method
+        :param node: Parsed node
+        :return: Optimized node
+        """
+        node.node_to_call = cls.visit(node.node_to_call)
+        node.arg_nodes = [cls.visit(arg_node) for arg_node in node.arg_nodes]
+        return node
+
+    @classmethod
+    def visit_ReturnNode(cls, node):
+        """
+        ReturnNode method
+        :param node: Parsed node
+        :return: Optimized node
+        """
+        if node.node_to_return:
+            node.node_to_return = cls.visit(node.node_to_return)
+        return node
+
+    @classmethod
+    def visit_ClassNode(cls, node):
+        """
+        ClassNode method
+        :param node: Parsed node
+        :return: Optimized node
+        """
+        node.body_nodes = cls.visit(node.body_nodes)
+        return node
+
+    @classmethod
+    def visit_TryNode(cls, node):
+        """
+        TryNode method
+        :param node: Parsed node
+        :return: Optimized node
+        """
+        node.try_statements = cls.visit(node.try_statements)
+        node.except_statements = cls.visit(node.except_statements)
+        return node
+
+
+Optimizer.dispatch_table = {
+    node_class: getattr(Optimizer, f"visit_{name}")
+    for name, node_class in vars(nodes_).items()
+    if isinstance(node_class, type) and hasattr(Optimizer, f"visit_{name}")
+}
@@ -22,12 +22,86 @@ from TechZen.nodes_ import (
 )
 from TechZen.token_ import TokenType, Keywords
 
+# Precedence of the binary operators, a higher precedence binds stronger
+LOGIC_PRECEDENCE = 1
+COMPARISON_PRECEDENCE = 2
+POWER_PRECEDENCE = 5
+BINARY_PRECEDENCE = {
+    TokenType.TT_EE: COMPARISON_PRECEDENCE,
+    TokenType.TT_NE: COMPARISON_PRECEDENCE,
+    TokenType.TT_LT: COMPARISON_PRECEDENCE,
+    TokenType.TT_GT: COMPARISON_PRECEDENCE,
+    TokenType.TT_LTE: COMPARISON_PRECEDENCE,
+    TokenType.TT_GTE: COMPARISON_PRECEDENCE,
+    TokenType.TT_PLUS: 3,
+    TokenType.TT_MINUS: 3,
+    TokenType.TT_MUL: 4,
+    TokenType.TT_DIV: 4,
+    TokenType.TT_MOD: 4,
+    TokenType.TT_DFL: 4,
+    TokenType.TT_POW: POWER_PRECEDENCE,
+}
+KEYWORD_PRECEDENCE = {
+    Keywords.KW_AND.value: LOGIC_PRECEDENCE,
+    Keywords.KW_OR.value: LOGIC_PRECEDENCE,
+}
+
+# Tokens that are parsed into a node on their own, unless a call or member follows
+ATOM_NODES = {
+    TokenType.TT_INT: NumberNode,
+    TokenType.TT_FLOAT: NumberNode,
+    TokenType.TT_STRING: StringNode,
+    TokenType.TT_IDENTIFIER: VarAccessNode,
+}
+CALL_TOKENS = (TokenType.TT_LPAREN, TokenType.TT_DOT)
+
+# Tokens and keywords that can start an expression, and with the statement keywords a statement. The parser looks at
+# them to decide whether to parse another one, so it never has to go back after a failed attempt.
+EXPR_START_TOKENS = frozenset(
+    {
+        TokenType.TT_INT,
+        TokenType.TT_FLOAT,
+        TokenType.TT_STRING,
+        TokenType.TT_IDENTIFIER,
+        TokenType.TT_PLUS,
+        TokenType.TT_MINUS,
+        TokenType.TT_LPAREN,
+        TokenType.TT_LSQUARE,
+        TokenType.TT_LCURLY,
+    }
+)
+EXPR_START_KEYWORDS = frozenset(
+    {
+        Keywords.KW_VAR.value,
+        Keywords.KW_NOT.value,
+        Keywords.KW_IF.value,
+        Keywords.KW_FOR.value,
+        Keywords.KW_WHILE.value,
+        Keywords.KW_FUN.value,
+        Keywords.KW_CLASS.value,
+        Keywords.KW_TRY.value,
+        Keywords.KW_INCLUDE.value,
+    }
+)
+STATEMENT_START_KEYWORDS = EXPR_START_KEYWORDS | {
+    Keywords.KW_RETURN.value,
+    Keywords.KW_CONTINUE.value,
+    Keywords.KW_BREAK.value,
+}
+
 #######################################
 # PARSE RESULT
 #######################################
 
 
 class ParseResult:
+    __slots__ = (
+        "error",
+        "node",
+        "last_registered_advance_count",
+        "advance_count",
+    )
+
     def __init__(self):
         """
         This is the parse result. This class checks if there are any errors, or successes.
@@ -36,7 +110,6 @@ class ParseResult:
         self.node = None
         self.last_registered_advance_count = 0
         self.advance_count = 0
-        self.to_reverse_count = 0
 
     def register_advancement(self):
         """
@@ -58,17 +131,6 @@ class ParseResult:
             self.error = res.error
         return res.node
 
-    def try_register(self, res):
-        """
-        Try to register the result, else reverse the advances
-        :param res: Result
-        :return: self.register if it works, else None
-        """
-        if res.error:
-            self.to_reverse_count = res.advance_count
-            return None
-        return self.register(res)
-
     def success(self, node):
         """
         Register the success
@@ -99,40 +161,35 @@ class Parser:
         """
         This is the parser. It looks if there is an illegal character error, or expected character error. It also
         finds out if the syntax for each expression / statement is correct. It also prioritizes things, for example,
-        multiplication before addition.
-        :param tokens: All the tokens found from the lexer
+        multiplication before addition. Tokens are read one at a time and only the current and the next token are
+        kept, so they can come from Lexer.iter_tokens without making a list of all of them.
+        :param tokens: All the tokens found from the lexer, a list or an iterator
         """
-        self.tokens = tokens
-        self.token_idx = -1
+        self.tokens = iter(tokens)
         self.current_token = None
+        self.next_token = next(self.tokens, None)
         self.advance()
 
     def advance(self):
         """
-        Advances to the next token
+        Advances to the next token. After the last token (EOF), the current token stays the last token.
         :return: Current token (after advancing)
         """
-        self.token_idx += 1
-        self.update_current_token()
-        return self.current_token
-
-    def reverse(self, amount=1):
-        """
-        Goes back to the previous token
-        :param amount: How many tokens to go back, default 1
-        :return: Current token
-        """
-        self.token_idx -= amount
-        self.update_current_token()
+        if self.next_token is not None:
+            self.current_token = self.next_token
+            self.next_token = next(self.tokens, None)
         return self.current_token
 
-    def update_current_token(self):
+    def can_start(self, keywords):
         """
-        Update the current token
-        :return: nothing
+        Looks at the current token to find out if it starts an expression or statement, without parsing it
+        :param keywords: EXPR_START_KEYWORDS or STATEMENT_START_KEYWORDS
+        :return: True if the current token can start one
         """
-        if 0 <= self.token_idx < len(self.tokens):
-            self.current_token = self.tokens[self.token_idx]
+        token = self.current_token
+        if token.type == TokenType.TT_KEYWORD:
+            return token.value.upper() in keywords
+        return token.type in EXPR_START_TOKENS
 
     def parse(self):
         """
@@ -140,7 +197,32 @@ class Parser:
         :return: Parse result
         """
         res = self.statements()
-        if not res.error and self.current_token.type != TokenType.TT_EOF:
+        if not res.error:
+            self.expect_eof(res)
+        return res
+
+    def iter_parse(self):
+        """
+        Parses the code one statement at a time, without making a node of all of them. Together with
+        Lexer.iter_tokens, only the statement being parsed is in memory, so huge files can be parsed (and used) in
+        memory that depends on how deep the code is nested, not on how long it is.
+        :return: A parse result for every statement, the last one has the error if there is one
+        """
+        res = ParseResult()
+        for statement in self.iter_statements(res):
+            yield ParseResult().success(statement)
+        if not res.error:
+            self.expect_eof(res)
+        if res.error:
+            yield res
+
+    def expect_eof(self, res):
+        """
+        Fails if there are tokens left after all the statements.
+        :param res: Parse result of the statements
+        :return: Parse result
+        """
+        if self.current_token.type != TokenType.TT_EOF:
             return res.failure(
                 InvalidSyntaxError(
                     self.current_token.pos_start,
@@ -158,19 +240,29 @@ class Parser:
         :return: Parse result
         """
         res = ParseResult()
-        statements = []
         pos_start = self.current_token.pos_start.copy()
+        statements = list(self.iter_statements(res))
+        if res.error:
+            return res
+
+        return res.success(
+            ListNode(statements, pos_start, self.current_token.pos_end.copy())
+        )
 
+    def iter_statements(self, res):
+        """
+        Parses statements, one at a time. Stops at the first error, which is saved in res.
+        :param res: Parse result that gets the advancements and the error
+        :return: Every statement node
+        """
         while self.current_token.type == TokenType.TT_NEWLINE:
             res.register_advancement()
             self.advance()
 
         statement = res.register(self.statement())
         if res.error:
-            return res
-        statements.append(statement)
-
-        more_statements = True
+            return
+        yield statement
 
         while True:
             newline_count = 0
@@ -178,20 +270,13 @@ class Parser:
                 res.register_advancement()
                 self.advance()
                 newline_count += 1
-            if newline_count == 0:
-                more_statements = False
-            if not more_statements:
-                break
-            statement = res.try_register(self.statement())
-            if not statement:
-                self.reverse(res.to_reverse_count)
-                more_statements = False
-                continue
-            statements.append(statement)
-
-        return res.success(
-            ListNode(statements, pos_start, self.current_token.pos_end.copy())
-        )
+            # A token that can't start a statement ends the block ('END', 'ELSE', EOF, ...)
+            if newline_count == 0 or not self.can_start(STATEMENT_START_KEYWORDS):
+                return
+            statement = res.register(self.statement())
+            if res.error:
+                return
+            yield statement
 
     def statement(self):
         """
@@ -205,9 +290,11 @@ class Parser:
             res.register_advancement()
             self.advance()
 
-            expr = res.try_register(self.expr())
-            if not expr:
-                self.reverse(res.to_reverse_count)
+            expr = None
+            if self.can_start(EXPR_START_KEYWORDS):
+                expr = res.register(self.expr())
+                if res.error:
+                    return res
             return res.success(
                 ReturnNode(expr, pos_start, self.current_token.pos_start.copy())
             )
@@ -299,15 +386,7 @@ class Parser:
                 return res
             return res.success(VarAssignNode(var_name, expr, extra_names))
 
-        node = res.register(
-            self.bin_op(
-                self.comp_expr,
-                (
-                    (TokenType.TT_KEYWORD, Keywords.KW_AND.value),
-                    (TokenType.TT_KEYWORD, Keywords.KW_OR.value),
-                ),
-            )
-        )
+        node = res.register(self.binary_expr(LOGIC_PRECEDENCE))
 
         if res.error:
             return res.failure(
@@ -321,88 +400,86 @@ class Parser:
 
         return res.success(node)
 
-    def comp_expr(self):
+    def binary_expr(self, min_precedence):
         """
-        Parses all comparison expressions.
+        Parses binary operators by precedence climbing (a Pratt parser), instead of a function for every level of
+        precedence. Operators that bind weaker than min_precedence are left for the caller.
+        :param min_precedence: Lowest precedence of the operators that are parsed
         :return: Parse result
         """
         res = ParseResult()
-        if self.current_token.matches(TokenType.TT_KEYWORD, Keywords.KW_NOT.value):
-            op_token = self.current_token
+        token = self.current_token
+
+        # Fast path for a literal or variable that is not called or followed by a member
+        if (
+            token.type in ATOM_NODES
+            and self.next_token.type not in CALL_TOKENS
+        ):
             res.register_advancement()
             self.advance()
-
-            node = res.register(self.comp_expr())
+            left = ATOM_NODES[token.type](token)
+        else:
+            left = res.register(self.prefix_expr(min_precedence))
             if res.error:
-                return res
-
-            return res.success(UnaryOpNode(op_token, node))
-
-        node = res.register(
-            self.bin_op(
-                self.arith_expr,
-                (
-                    TokenType.TT_EE,
-                    TokenType.TT_NE,
-                    TokenType.TT_LT,
-                    TokenType.TT_GT,
-                    TokenType.TT_LTE,
-                    TokenType.TT_GTE,
-                ),
-            )
-        )
-        if res.error:
-            return res.failure(
-                InvalidSyntaxError(
-                    self.current_token.pos_start,
-                    self.current_token.pos_end,
-                    "Expected int, float, identifier, '+', '-', '[', '(', or 'NOT'",
+                if min_precedence > COMPARISON_PRECEDENCE:
+                    return res
+                return res.failure(
+                    InvalidSyntaxError(
+                        self.current_token.pos_start,
+                        self.current_token.pos_end,
+                        "Expected int, float, identifier, '+', '-', '[', '(', or 'NOT'",
+                    )
                 )
-            )
 
-        return res.success(node)
+        while True:
+            op_token = self.current_token
+            if op_token.type == TokenType.TT_KEYWORD:
+                precedence = KEYWORD_PRECEDENCE.get(op_token.value)
+            else:
+                precedence = BINARY_PRECEDENCE.get(op_token.type)
+            if precedence is None or precedence < min_precedence:
+                break
 
-    def arith_expr(self):
-        """
-        Parses all arithmetic expressions.
-        :return: Parse result
-        """
-        return self.bin_op(self.term, (TokenType.TT_PLUS, TokenType.TT_MINUS))
+            res.register_advancement()
+            self.advance()
+            # Powers are right associative, the other operators left associative
+            right = res.register(
+                self.binary_expr(
+                    precedence if precedence == POWER_PRECEDENCE else precedence + 1
+                )
+            )
+            if res.error:
+                return res
+            left = BinOpNode(left, op_token, right)
 
-    def term(self):
-        """
-        Parses all terms.
-        :return: Parse result
-        """
-        return self.bin_op(
-            self.factor,
-            (TokenType.TT_MUL, TokenType.TT_DIV, TokenType.TT_MOD, TokenType.TT_DFL),
-        )
+        return res.success(left)
 
-    def factor(self):
+    def prefix_expr(self, min_precedence):
         """
-        Parses all factors.
+        Parses an operand of a binary operator that starts with a unary operator, or else a call or atom. 'NOT' can
+        only start an operand of 'AND' and 'OR', '+' and '-' can start any operand and bind stronger than everything
+        but a power.
+        :param min_precedence: Lowest precedence of the operators that are parsed
         :return: Parse result
         """
         res = ParseResult()
         token = self.current_token
 
         if token.type in (TokenType.TT_PLUS, TokenType.TT_MINUS):
-            res.register_advancement()
-            self.advance()
-            factor = res.register(self.factor())
-            if res.error:
-                return res
-            return res.success(UnaryOpNode(token, factor))
-
-        return self.power()
+            operand_precedence = POWER_PRECEDENCE
+        elif min_precedence <= COMPARISON_PRECEDENCE and token.matches(
+            TokenType.TT_KEYWORD, Keywords.KW_NOT.value
+        ):
+            operand_precedence = COMPARISON_PRECEDENCE
+        else:
+            return self.call()
 
-    def power(self):
-        """
-        Parses all powers.
-        :return: Parse result
-        """
-        return self.bin_op(self.call, (TokenType.TT_POW,), self.factor)
+        res.register_advancement()
+        self.advance()
+        node = res.register(self.binary_expr(operand_precedence))
+        if res.error:
+            return res
+        return res.success(UnaryOpNode(token, node))
 
     def call(self):
         """
@@ -1302,9 +1379,9 @@ class Parser:
         while not self.current_token.matches(
             TokenType.TT_KEYWORD, Keywords.KW_EXCEPT.value
         ):
-            res.register_advancement()
-            self.advance()
-            if self.current_token.matches(TokenType.TT_KEYWORD, Keywords.KW_END.value):
+            if self.current_token.type == TokenType.TT_EOF or self.current_token.matches(
+                TokenType.TT_KEYWORD, Keywords.KW_END.value
+            ):
                 return res.failure(
                     InvalidSyntaxError(
                         self.current_token.pos_start,
@@ -1312,6 +1389,8 @@ class Parser:
                         "Expected 'EXCEPT'",
                     )
                 )
+            res.register_advancement()
+            self.advance()
 
         res.register_advancement()
         self.advance()
@@ -1330,7 +1409,7 @@ class Parser:
 
         except_statements = res.register(self.statements())
         if res.error:
-            print(res)
+            return res
 
         if not self.current_token.matches(TokenType.TT_KEYWORD, Keywords.KW_END.value):
             return res.failure(
@@ -1381,25 +1460,3 @@ class Parser:
             )
 
     ###################################
-
-    def bin_op(self, func_a, ops, func_b=None):
-        if func_b is None:
-            func_b = func_a
-        res = ParseResult()
-        left = res.register(func_a())
-        if res.error:
-            return res
-
-        while (
-            self.current_token.type in ops
-            or (self.current_token.type, self.current_token.value) in ops
-        ):
-            op_token = self.current_token
-            res.register_advancement()
-            self.advance()
-            right = res.register(func_b())
-            if res.error:
-                return res
-            left = BinOpNode(left, op_token, right)
-
-        return res.success(left)
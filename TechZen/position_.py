@@ -1,37 +1,110 @@
-class Position:
-    def __init__(self, idx, ln, col, fn, ftxt):
+from bisect import bisect_right
+
+
+class Source:
+    __slots__ = ("fn", "buffer", "line_starts", "decoded_text")
+
+    def __init__(self, fn, buffer):
         """
-        This class gives the position of each token / character in the code.
-        :param idx: The index of the character
-        :param ln: The line of the character
-        :param col: The column of the character
-        :param fn: The file name of the character
-        :param ftxt: The text of the file
+        This is the code of a file, shared by all positions in it. The code is kept as UTF-8 bytes and positions are
+        indices of bytes. The code is only decoded, and the index of where each line starts is only made, when a line or
+        column is needed, which is when an error is shown.
+        A memory map of the file is copied, the nodes live longer than the map and the file can change meanwhile.
+        :param fn: The file name
+        :param buffer: The code of the file, as UTF-8 bytes or a memory map
         """
-        self.idx = idx
-        self.ln = ln
-        self.col = col
         self.fn = fn
-        self.ftxt = ftxt
+        self.buffer = buffer if isinstance(buffer, bytes) else bytes(buffer)
+        self.line_starts = None
+        self.decoded_text = None
+
+    @property
+    def text(self):
+        if self.decoded_text is None:
+            self.decoded_text = str(self.buffer, "utf-8", "replace")
+        return self.decoded_text
 
-    def advance(self, current_char=None):
+    def line_col(self, idx):
         """
-        Advance to the next character.
-        :param current_char: Newline otherwise none
-        :return: Position
+        Finds the line and column of an index. The column counts characters, not bytes.
+        :param idx: The index of the byte
+        :return: Line, column
         """
-        self.idx += 1
-        self.col += 1
+        if self.line_starts is None:
+            self.line_starts = [0]
+            newline = self.buffer.find(b"\n")
+            while newline != -1:
+                self.line_starts.append(newline + 1)
+                newline = self.buffer.find(b"\n", newline + 1)
+        ln = bisect_right(self.line_starts, idx) - 1
+        line_start = self.line_starts[ln]
+        # Indices after the end of the code (like the end of a string without an end quote) are one byte long
+        past_end = max(idx - len(self.buffer), 0)
+        return ln, len(str(self.buffer[line_start:idx], "utf-8", "ignore")) + past_end
 
-        if current_char == "\n":
-            self.ln += 1
-            self.col = 0
+    def text_idx(self, idx):
+        """
+        Finds the index in the decoded text of an index of a byte.
+        :param idx: The index of the byte
+        :return: The index of the character
+        """
+        return len(str(self.buffer[:idx], "utf-8", "ignore"))
 
-        return self
+    def __reduce__(self):
+        # Only the code is pickled, the decoded text and the line starts are made again when they are needed
+        return Source, (self.fn, self.buffer)
+
+
+class Position:
+    __slots__ = ("source", "idx")
+
+    def __init__(self, source, idx):
+        """
+        This class gives the position of each token / character in the code. Only the index is stored, the line and
+        column are found from the source.
+        :param source: The source of the code
+        :param idx: The index of the byte
+        """
+        self.source = source
+        self.idx = idx
+
+    @property
+    def ln(self):
+        return self.source.line_col(self.idx)[0]
+
+    @property
+    def col(self):
+        return self.source.line_col(self.idx)[1]
+
+    @property
+    def fn(self):
+        return self.source.fn
+
+    @property
+    def ftxt(self):
+        return self.source.text
+
+    @property
+    def text_idx(self):
+        return self.source.text_idx(self.idx)
 
     def copy(self):
         """
-        Create a copy of the position.
-        :return: Position copy
+        Positions don't change, so a copy is the same position.
+        :return: Position
         """
-        return Position(self.idx, self.ln, self.col, self.fn, self.ftxt)
+        return self
+
+
+# The position just after a character, used as the end of tokens. It's on the line of that character, so the end of a
+# newline is on the line it ends.
+class EndPosition(Position):
+    __slots__ = ()
+
+    @property
+    def ln(self):
+        return self.source.line_col(self.idx - 1)[0]
+
+    @property
+    def col(self):
+        return self.source.line_col(self.idx - 1)[1] + 1
@@ -0,0 +1,242 @@
+#######################################
+# RESOLVER
+#######################################
+from TechZen import nodes_
+from TechZen.symbol_table_ import SymbolTable
+
+
+class Resolver:
+    @classmethod
+    def resolve(cls, node):
+        """
+        Gives the variables of a parsed program an address, before it runs.
+        Every function gets a slot for each of its arguments and for each name set in its own body, so reading and
+        setting them does not need a dict lookup. Other names read in a function are read from the global table
+        directly, unless some function, class or instance table may hold them (see SymbolTable.get_global).
+        Code outside of functions, class bodies and members ('a.b') keep using names, because the table they run in
+        is only known when they run. Calls of a function to itself as the last thing it does are marked as tail calls.
+        :param node: Parsed node
+        :return: The same node
+        """
+        cls.visit(node, None)
+        return node
+
+    @classmethod
+    def visit(cls, node, slot_index):
+        """
+        Resolves a node and the nodes inside it.
+        :param node: Parsed node
+        :param slot_index: Slots of the function the node is in, None outside of functions
+        :return: nothing
+        """
+        cls.dispatch_table.get(type(node), cls.visit_children)(node, slot_index)
+
+    @classmethod
+    def visit_children(cls, node, slot_index):
+        """
+        Resolves the nodes inside a node that has no names itself.
+        :param node: Parsed node
+        :param slot_index: Slots of the function the node is in, None outside of functions
+        :return: nothing
+        """
+        for child in cls.child_nodes(node):
+            cls.visit(child, slot_index)
+
+    @staticmethod
+    def child_nodes(node):
+        """
+        The nodes directly inside a node. Members ('a.b') are left out, they run in the table of the instance or
+        class.
+        :param node: Parsed node
+        :return: List of nodes
+        """
+        if isinstance(node, nodes_.ListNode):
+            return node.element_nodes
+        if isinstance(node, nodes_.DictNode):
+            return [child for item in node.element_nodes.items() for child in item]
+        if isinstance(node, nodes_.VarAssignNode):
+            return [node.value_node]
+        if isinstance(node, nodes_.BinOpNode):
+            return [node.left_node, node.right_node]
+        if isinstance(node, nodes_.UnaryOpNode):
+            return [node.node]
+        if isinstance(node, nodes_.IfNode):
+            children = [child for case in node.cases for child in case[:2]]
+            if node.else_case:
+                children.append(node.else_case[0])
+            return children
+        if isinstance(node, nodes_.ForNode):
+            children = [node.start_value_node, node.end_value_node]
+            if node.step_value_node:
+                children.append(node.step_value_node)
+            children.append(node.body_node)
+            return children
+        if isinstance(node, nodes_.WhileNode):
+            return [node.condition_node, node.body_node]
+        if isinstance(node, nodes_.FuncDefNode):
+            return [node.body_node]
+        if isinstance(node, nodes_.CallNode):
+            return [node.node_to_call] + node.arg_nodes
+        if isinstance(node, nodes_.ReturnNode):
+            return [node.node_to_return] if node.node_to_return else []
+        if isinstance(node, nodes_.ClassNode):
+            return [node.body_nodes]
+        if isinstance(node, nodes_.TryNode):
+            return [node.try_statements, node.except_statements]
+        return []
+
+    @classmethod
+    def declare(cls, node, names):
+        """
+        Finds the names a function body sets in its own symbol table.
+        :param node: Parsed node
+        :param names: List the names are added to
+        :return: nothing
+        """
+        if isinstance(node, nodes_.VarAssignNode) and not node.extra_names:
+            names.append(node.var_name_token.value)
+        elif isinstance(node, nodes_.ForNode):
+            names.append(node.var_name_token.value)
+        elif isinstance(node, nodes_.FuncDefNode):
+            # The body of a nested function gets its own table
+            if node.var_name_token:
+                names.append(node.var_name_token.value)
+            return
+        elif isinstance(node, nodes_.ClassNode):
+            names.append(node.class_name_token.value)
+            return
+
+        for child in cls.child_nodes(node):
+            cls.declare(child, names)
+
+    @classmethod
+    def visit_VarAccessNode(cls, node, slot_index):
+        """
+        VarAccessNode method
+        :param node: Parsed node
+        :param slot_index: Slots of the function the node is in, None outside of functions
+        :return: nothing
+        """
+        var_name = node.var_name_token.value
+        node.slot = slot_index.get(var_name, None) if slot_index else None
+        node.is_global = slot_index is not None and node.slot is None
+
+    @classmethod
+    def visit_VarAssignNode(cls, node, slot_index):
+        """
+        VarAssignNode method
+        :param node: Parsed node
+        :param slot_index: Slots of the function the node is in, None outside of functions
+        :return: nothing
+        """
+        node.slot = (
+            slot_index.get(node.var_name_token.value, None)
+            if slot_index and not node.extra_names
+            else None
+        )
+        cls.visit(node.value_node, slot_index)
+
+    @classmethod
+    def visit_ForNode(cls, node, slot_index):
+        """
+        ForNode method
+        :param node: Parsed node
+        :param slot_index: Slots of the function the node is in, None outside of functions
+        :return: nothing
+        """
+        node.slot = (
+            slot_index.get(node.var_name_token.value, None) if slot_index else None
+        )
+        cls.visit_children(node, slot_index)
+
+    @classmethod
+    def visit_FuncDefNode(cls, node, slot_index):
+        """
+        FuncDefNode method. The arguments come first, so they get slots 0 to n - 1.
+        :param node: Parsed node
+        :param slot_index: Slots of the function the node is in, None outside of functions
+        :return: nothing
+        """
+        names = [arg_name.value for arg_name in node.arg_name_tokens]
+        cls.declare(node.body_node, names)
+
+        node.slot_index = {}
+        for name in names:
+            node.slot_index.setdefault(name, len(node.slot_index))
+        SymbolTable.nested_names.update(node.slot_index)
+
+        cls.visit(node.body_node, node.slot_index)
+        if node.var_name_token:
+            cls.mark_tail_calls(node)
+
+    @classmethod
+    def mark_tail_calls(cls, node):
+        """
+        Finds the calls a function makes to itself by its name as the last thing it does, in the body of a function
+        with an arrow and in its return statements. They run the body of the function again instead of calling it, so
+        the Python stack does not grow with them. Return statements in a try statement are left out, because the try
+        statement handles everything that stops it.
+        :param node: FuncDefNode with a name
+        :return: nothing
+        """
+        name = node.var_name_token.value
+        if node.should_auto_return:
+            cls.mark_tail_call(node.body_node, name, node.body_node)
+
+        nodes = [node.body_node]
+        while nodes:
+            child = nodes.pop()
+            if isinstance(child, nodes_.ReturnNode):
+                if child.node_to_return:
+                    cls.mark_tail_call(child.node_to_return, name, node.body_node)
+            elif not isinstance(
+                child, (nodes_.FuncDefNode, nodes_.ClassNode, nodes_.TryNode)
+            ):
+                nodes.extend(cls.child_nodes(child))
+
+    @classmethod
+    def mark_tail_call(cls, node, name, body_node):
+        """
+        Marks the calls of a function to itself in a node whose value the function returns. The cases of an if
+        expression give their value to it too.
+        :param node: Parsed node
+        :param name: Function name
+        :param body_node: Body of the function
+        :return: nothing
+        """
+        if node.child is not None:
+            return
+        if isinstance(node, nodes_.CallNode):
+            callee = node.node_to_call
+            if (
+                isinstance(callee, nodes_.VarAccessNode)
+                and callee.child is None
+                and callee.var_name_token.value == name
+            ):
+                node.tail_body = body_node
+        elif isinstance(node, nodes_.IfNode):
+            cases = [
+                (expr, should_return_null) for _, expr, should_return_null in node.cases
+            ]
+            if node.else_case:
+                cases.append(node.else_case)
+            for expr, should_return_null in cases:
+                if not should_return_null:
+                    cls.mark_tail_call(expr, name, body_node)
+
+    @classmethod
+    def visit_ClassNode(cls, node, slot_index):
+        """
+        ClassNode method. The class body runs in a table of its own, which is not a function table.
+        :param node: Parsed node
+        :param slot_index: Slots of the function the node is in, None outside of functions
+        :return: nothing
+        """
+        cls.visit(node.body_nodes, None)
+
+
+Resolver.dispatch_table = {
+    node_class: getattr(Resolver, f"visit_{name}")
+    for name, node_class in vars(nodes_).items()
+    if isinstance(node_class, type) and hasattr(Resolver, f"visit_{name}")
+}
@@ -1,36 +1,62 @@
-from TechZen.parser_ import Parser
 from TechZen.interpreter_ import Interpreter
 from TechZen.context_ import Context
 
+BACKENDS = ("tree", "closure", "vm")
+
 
 class Runner:
     @staticmethod
-    def run(fn, text):
+    def run(fn, text, backend="tree"):
         """
         This runs all the code together to understand techzen code.
+        The files the code includes are parsed by include when it runs. They are only parsed before, at the same time in
+        a process pool, when cache_.preload_workers is set higher than 1 (only the shell sets it) and the code includes
+        at least cache_.PRELOAD_POOL_FILES files. A script that sets it must call this under
+        `if __name__ == "__main__":`, because worker processes import the __main__ module where they are spawned.
         :param fn: Filename in which the code is run
-        :param text: Input text / code
+        :param text: Input text / code, a string or UTF-8 bytes (like a memory map of the file, which is closed once the
+        code is loaded)
+        :param backend: "tree" to walk the AST with the Interpreter, "closure" to compile it into closures first,
+        "vm" to compile it into bytecode for the VM. The VM keeps its frames on a stack of its own instead of the Python
+        stack, so only the VM can run deep recursion (up to vm_.max_depth calls)
         :return: result of the run code
         """
         from TechZen.global_symbol_table_ import global_symbol_table
-        from TechZen.lexer_ import Lexer
+        from TechZen.cache_ import load_ast, close_source, preload, preloaded
+
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend '{backend}', expected one of {BACKENDS}")
 
-        # Generate tokens
-        lexer = Lexer(fn, text)
-        tokens, error = lexer.make_tokens()
+        # Generate Abstract Syntax Tree (AST), or load it from the cache of the file
+        try:
+            node, error = load_ast(fn, text)
+        finally:
+            close_source(text)
         if error:
             return None, error, False
 
-        # Generate Abstract Syntax Tree (AST)
-        parser = Parser(tokens)
-        ast = parser.parse()
-        if ast.error:
-            return None, ast.error, False
+        # Parse the files it includes before it runs, at the same time
+        preloaded_files = preload(node)
 
         # Run program
-        interpreter = Interpreter()
         context = Context("<program>")
         context.symbol_table = global_symbol_table
-        result = interpreter.visit(ast.node, context)
+        try:
+            if backend == "closure":
+                from TechZen.compiler_ import Compiler
+
+                result = Compiler.compile(node)(context)
+            elif backend == "vm":
+                from TechZen.bytecode_ import BytecodeCompiler
+                from TechZen.vm_ import VM
+
+                result = VM.run(BytecodeCompiler.compile_program(node, fn), context)
+            else:
+                interpreter = Interpreter()
+                result = interpreter.visit(node, context)
+        finally:
+            # Files in branches that did not run are never included, their nodes are not kept
+            for preloaded_file in preloaded_files:
+                preloaded.pop(preloaded_file, None)
 
         return result.value, result.error, result.should_exit
@@ -4,6 +4,15 @@
 
 
 class RTResult:
+    __slots__ = (
+        "value",
+        "error",
+        "func_return_value",
+        "loop_should_continue",
+        "loop_should_break",
+        "should_exit",
+    )
+
     def __init__(self):
         """
         This is the runtime result. This class checks if there are any errors, or successes.
@@ -105,3 +114,107 @@ class RTResult:
             or self.loop_should_break
             or self.should_exit
         )
+
+    def unwrap(self):
+        """
+        Get the value of the result, for code that runs with signals instead of results (see Signal).
+        :return: Value, raises the signal of the result when it should return
+        """
+        if self.error:
+            raise ErrorSignal(self.error)
+        if self.func_return_value:
+            raise ReturnSignal(self.func_return_value)
+        if self.loop_should_continue:
+            raise ContinueSignal()
+        if self.loop_should_break:
+            raise BreakSignal()
+        if self.should_exit:
+            raise ExitSignal(self.value)
+        return self.value
+
+
+#######################################
+# SIGNALS
+#######################################
+
+
+class Signal(Exception):
+    """
+    The Interpreter raises signals to stop running the nodes around it, so nodes return their value directly instead
+    of a result that has to be checked after every child. Interpreter.visit turns them back into an RTResult.
+    """
+
+    def result(self):
+        """
+        The runtime result that has the same meaning as the signal.
+        :return: Runtime result
+        """
+        raise NotImplementedError
+
+
+class ErrorSignal(Signal):
+    def __init__(self, error):
+        """
+        Raised for a runtime error.
+        :param error: Error
+        """
+        self.error = error
+
+    def result(self):
+        return RTResult().failure(self.error)
+
+
+class ReturnSignal(Signal):
+    def __init__(self, value):
+        """
+        Raised by return, caught by the function call.
+        :param value: Returned value
+        """
+        self.value = value
+
+    def result(self):
+        return RTResult().success_return(self.value)
+
+
+class ContinueSignal(Signal):
+    """
+    Raised by continue, caught by the loop.
+    """
+
+    def result(self):
+        return RTResult().success_continue()
+
+
+class BreakSignal(Signal):
+    """
+    Raised by break, caught by the loop.
+    """
+
+    def result(self):
+        return RTResult().success_break()
+
+
+class TailCallSignal(Signal):
+    def __init__(self, args):
+        """
+        Raised by a function that calls itself as the last thing it does, caught by the function call, which runs the
+        body again with the new arguments instead of calling the function again.
+        :param args: Arguments of the new call
+        """
+        self.args = args
+
+    def result(self):
+        # The signal is returned like a value, Function.execute runs the body again when it gets it
+        return RTResult().success_return(self)
+
+
+class ExitSignal(Signal):
+    def __init__(self, value):
+        """
+        Raised by exit(), stops the program.
+        :param value: Exit value
+        """
+        self.value = value
+
+    def result(self):
+        return RTResult().success_exit(self.value)
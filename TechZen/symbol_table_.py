@@ -4,13 +4,21 @@
 
 
 class SymbolTable:
-    def __init__(self, parent=None):
+    # Names that have been set in a table with a parent (function, class and instance tables), including all local
+    # names the Resolver gave a slot. A name that is not in here can only be set in a global table.
+    nested_names = set()
+
+    def __init__(self, parent=None, slot_index=None):
         """
         This is the symbol table. This is where all built-in functions and variable are stored.
         :param parent: None, otherwise a parent
+        :param slot_index: Maps the local names of a function to their slot, None if the table has no slots
         """
         self.symbols = {}
         self.parent = parent
+        self.globals = parent.globals if parent else self
+        self.slot_index = slot_index
+        self.slots = [None] * len(slot_index) if slot_index else None
 
     def get(self, name):
         """
@@ -18,11 +26,41 @@ class SymbolTable:
         :param name: key
         :return: value
         """
-        value = self.symbols.get(name, None)
+        symbol_table = self
+        while symbol_table:
+            value = symbol_table.symbols.get(name, None)
+            if value is None and symbol_table.slot_index:
+                index = symbol_table.slot_index.get(name, None)
+                if index is not None:
+                    value = symbol_table.slots[index]
+            if value is not None:
+                return value
+            symbol_table = symbol_table.parent
+        return None
+
+    def get_local(self, name, index):
+        """
+        Get a local value by its slot. If it has not been set yet, it is looked up in the parents.
+        :param name: key
+        :param index: slot of the key
+        :return: value
+        """
+        value = self.slots[index]
         if value is None and self.parent:
             return self.parent.get(name)
         return value
 
+    def get_global(self, name):
+        """
+        Get a value that the Resolver found no local slot for. If no table with a parent ever set the name, it can
+        only be in the global table, so the parents do not have to be searched.
+        :param name: key
+        :return: value
+        """
+        if name in SymbolTable.nested_names:
+            return self.get(name)
+        return self.globals.symbols.get(name, None)
+
     def set(self, name, value):
         """
         Set a value in the symbol table
@@ -30,6 +68,13 @@ class SymbolTable:
         :param value: value
         :return: nothing
         """
+        if self.slot_index:
+            index = self.slot_index.get(name, None)
+            if index is not None:
+                self.slots[index] = value
+                return
+        if self.parent:
+            SymbolTable.nested_names.add(name)
         self.symbols[name] = value
 
     def remove(self, name):
@@ -38,4 +83,7 @@ class SymbolTable:
         :param name: key
         :return: nothing
         """
+        if self.slot_index and name in self.slot_index:
+            self.slots[self.slot_index[name]] = None
+            return
         del self.symbols[name]
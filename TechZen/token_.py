@@ -4,6 +4,8 @@
 from enum import Enum
 import string
 
+from TechZen.position_ import Position, EndPosition
+
 DIGITS = "0123456789"
 LETTERS = string.ascii_letters
 SKIP_LETTERS = " \t"
@@ -127,24 +129,31 @@ KEYWORDS = {
 
 
 class Token:
-    def __init__(self, type_, value=None, pos_start=None, pos_end=None):
+    __slots__ = ("type", "value", "source", "start", "end")
+
+    def __init__(self, type_, value=None, source=None, start=0, end=None):
         """
-        This is the token class. It defines the token and its values.
+        This is the token class. It defines the token and its values. Its positions are indices into the source, the
+        Position objects are only made when they are used.
         :param type_: The TokenType
         :param value: Value of the token
-        :param pos_start: Start position of the token
-        :param pos_end: End position of the token
+        :param source: Source of the code the token is in
+        :param start: Index where the token starts
+        :param end: Index after the token, default the character after start
         """
         self.type = type_
         self.value = value
+        self.source = source
+        self.start = start
+        self.end = start + 1 if end is None else end
 
-        if pos_start:
-            self.pos_start = pos_start.copy()
-            self.pos_end = pos_start.copy()
-            self.pos_end.advance()
+    @property
+    def pos_start(self):
+        return Position(self.source, self.start)
 
-        if pos_end:
-            self.pos_end = pos_end.copy()
+    @property
+    def pos_end(self):
+        return EndPosition(self.source, self.end)
 
     def matches(self, type_, value):
         """
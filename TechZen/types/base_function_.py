@@ -6,6 +6,8 @@ from TechZen.symbol_table_ import SymbolTable
 
 
 class BaseFunction(Value):
+    __slots__ = ("name", "slot_index")
+
     def __init__(self, name):
         """
         Base class for functions.
@@ -13,21 +15,28 @@ class BaseFunction(Value):
         """
         super().__init__()
         self.name = name or "<anonymous>"
+        self.slot_index = None
 
-    def generate_new_context(self):
+    def generate_new_context(self, node, context):
         """
-        Generate a new context for the function.
+        Generate a new context for the function. Functions run in the context they are called from.
+        :param node: Node of the call
+        :param context: Context of the call
         :return: New context
         """
-        new_context = Context(self.name, self.context, self.pos_start)
-        new_context.symbol_table = SymbolTable(new_context.parent.symbol_table)
+        new_context = Context(self.name, context, node.pos_start)
+        new_context.symbol_table = SymbolTable(
+            new_context.parent.symbol_table, self.slot_index
+        )
         return new_context
 
-    def check_args(self, arg_names, args):
+    def check_args(self, arg_names, args, node, context):
         """
         Check all function arguments when you call the function.
         :param arg_names: Function arguments
         :param args: User inputted arguments
+        :param node: Node of the call
+        :param context: Context of the call
         :return: Either runtime result success or failure
         """
         res = RTResult()
@@ -35,20 +44,20 @@ class BaseFunction(Value):
         if len(args) > len(arg_names):
             return res.failure(
                 RTError(
-                    self.pos_start,
-                    self.pos_end,
+                    node.pos_start,
+                    node.pos_end,
                     f"{len(args) - len(arg_names)} too many args passed into '{self.name}'",
-                    self.context,
+                    context,
                 )
             )
 
         if len(args) < len(arg_names):
             return res.failure(
                 RTError(
-                    self.pos_start,
-                    self.pos_end,
+                    node.pos_start,
+                    node.pos_end,
                     f"{len(arg_names) - len(args)} too few args passed into '{self.name}'",
-                    self.context,
+                    context,
                 )
             )
         return res.success(None)
@@ -64,20 +73,19 @@ class BaseFunction(Value):
         """
         for i, _ in enumerate(args):
             arg_name = arg_names[i]
-            arg_value = args[i]
-            arg_value.set_context(exec_ctx)
-            exec_ctx.symbol_table.set(arg_name, arg_value)
+            exec_ctx.symbol_table.set(arg_name, args[i])
 
-    def check_and_populate_args(self, arg_names, args, exec_ctx):
+    def check_and_populate_args(self, arg_names, args, exec_ctx, node):
         """
         Check how if the number of arguments passed are valid and then populate the function with those arguments.
         :param arg_names: Function arguments
         :param args: User inputted arguments
-        :param exec_ctx: Context for symbol table
+        :param exec_ctx: Context for symbol table, the context of the call is its parent
+        :param node: Node of the call
         :return: Runtime result success
         """
         res = RTResult()
-        res.register(self.check_args(arg_names, args))
+        res.register(self.check_args(arg_names, args, node, exec_ctx.parent))
         if res.should_return():
             return res
         self.populate_args(arg_names, args, exec_ctx)
@@ -5,8 +5,10 @@ from TechZen.errors_ import RTError
 from TechZen.types.number_ import Number
 from TechZen.types.string_ import String
 from TechZen.types.list_ import List
+from TechZen.types.dict_ import Dict
 from TechZen.types.base_function_ import BaseFunction
 from TechZen.runner import Runner
+from TechZen.cache_ import load_source
 
 Number.null = Number(0)
 Number.false = Number(0)
@@ -14,6 +16,8 @@ Number.true = Number(1)
 
 
 class BuiltInFunction(BaseFunction):
+    __slots__ = ()
+
     def __init__(self, name):
         """
         Built-in functions. The other functions are inherited from the base function.
@@ -21,19 +25,24 @@ class BuiltInFunction(BaseFunction):
         """
         super().__init__(name)
 
-    def execute(self, args):
+    def execute(self, args, node, context):
         """
-        Execute the function.
+        Execute the function. The built-in functions report errors at their own position, so a copy located at the call
+        runs them.
         :param args: User inputted arguments
+        :param node: Node of the call
+        :param context: Context of the call
         :return: Runtime result
         """
         res = RTResult()
-        exec_ctx = self.generate_new_context()
+        exec_ctx = self.generate_new_context(node, context)
 
         method_name = f"execute_{self.name}"
-        method = getattr(self, method_name, self.no_visit_method)
+        method = getattr(self.located(node, context), method_name, self.no_visit_method)
 
-        res.register(self.check_and_populate_args(method.arg_names, args, exec_ctx))
+        res.register(
+            self.check_and_populate_args(method.arg_names, args, exec_ctx, node)
+        )
         if res.should_return():
             return res
 
@@ -112,7 +121,7 @@ class BuiltInFunction(BaseFunction):
                 break
             except ValueError:
                 print(f"'{text}' must be an integer. Try again!")
-        return RTResult().success(Number(number))
+        return RTResult().success(Number.of(number))
 
     execute_input_int.arg_names = ["value"]
 
@@ -327,10 +336,101 @@ class BuiltInFunction(BaseFunction):
             return RTResult().failure(
                 RTError(self.pos_start, self.pos_end, "Argument must be list", exec_ctx)
             )
-        return RTResult().success(Number(len(list_.elements)))
+        return RTResult().success(Number.of(len(list_.elements)))
 
     execute_len.arg_names = ["list"]
 
+    def execute_has_key(self, exec_ctx):
+        """
+        Built-in has key in dictionary function.
+        :param exec_ctx: Context for symbol table
+        :return: Runtime result
+        """
+        dict_ = exec_ctx.symbol_table.get("dict")
+        key = exec_ctx.symbol_table.get("key")
+
+        if not isinstance(dict_, Dict):
+            return RTResult().failure(
+                RTError(
+                    self.pos_start,
+                    self.pos_end,
+                    "First argument must be dictionary",
+                    exec_ctx,
+                )
+            )
+        return RTResult().success(
+            Number.true if key in dict_.elements else Number.false
+        )
+
+    execute_has_key.arg_names = ["dict", "key"]
+
+    def execute_keys(self, exec_ctx):
+        """
+        Built-in dictionary keys function.
+        :param exec_ctx: Context for symbol table
+        :return: Runtime result
+        """
+        dict_ = exec_ctx.symbol_table.get("dict")
+
+        if not isinstance(dict_, Dict):
+            return RTResult().failure(
+                RTError(
+                    self.pos_start,
+                    self.pos_end,
+                    "Argument must be dictionary",
+                    exec_ctx,
+                )
+            )
+        return RTResult().success(List(list(dict_.elements.keys())))
+
+    execute_keys.arg_names = ["dict"]
+
+    def execute_values(self, exec_ctx):
+        """
+        Built-in dictionary values function.
+        :param exec_ctx: Context for symbol table
+        :return: Runtime result
+        """
+        dict_ = exec_ctx.symbol_table.get("dict")
+
+        if not isinstance(dict_, Dict):
+            return RTResult().failure(
+                RTError(
+                    self.pos_start,
+                    self.pos_end,
+                    "Argument must be dictionary",
+                    exec_ctx,
+                )
+            )
+        return RTResult().success(List(list(dict_.elements.values())))
+
+    execute_values.arg_names = ["dict"]
+
+    def execute_set_key(self, exec_ctx):
+        """
+        Built-in set key in dictionary function. Changes the dictionary itself, like append does with lists.
+        :param exec_ctx: Context for symbol table
+        :return: Runtime result
+        """
+        dict_ = exec_ctx.symbol_table.get("dict")
+        key = exec_ctx.symbol_table.get("key")
+        value = exec_ctx.symbol_table.get("value")
+
+        if not isinstance(dict_, Dict):
+            return RTResult().failure(
+                RTError(
+                    self.pos_start,
+                    self.pos_end,
+                    "First argument must be dictionary",
+                    exec_ctx,
+                )
+            )
+
+        dict_.elements[key] = value
+        return RTResult().success(Number.null)
+
+    execute_set_key.arg_names = ["dict", "key", "value"]
+
     def execute_lower(self, exec_ctx):
         """
         Built-in lower string function.
@@ -408,7 +508,7 @@ class BuiltInFunction(BaseFunction):
                     self.pos_start, self.pos_end, "Argument must be number in string", exec_ctx
                 )
             )
-        return RTResult().success(Number(int(str(string_.value))))
+        return RTResult().success(Number.of(int(str(string_.value))))
 
     execute_int.arg_names = ["value"]
 
@@ -430,8 +530,7 @@ class BuiltInFunction(BaseFunction):
         fn = fn.value
 
         try:
-            with open(fn, "r") as f:
-                script = f.read()
+            script = load_source(fn)
         except Exception as e:
             return RTResult().failure(
                 RTError(
@@ -486,6 +585,10 @@ BuiltInFunction.extend = BuiltInFunction("extend")
 BuiltInFunction.len = BuiltInFunction("len")
 BuiltInFunction.run = BuiltInFunction("run")
 BuiltInFunction.update_list = BuiltInFunction("update_list")
+BuiltInFunction.has_key = BuiltInFunction("has_key")
+BuiltInFunction.keys = BuiltInFunction("keys")
+BuiltInFunction.values = BuiltInFunction("values")
+BuiltInFunction.set_key = BuiltInFunction("set_key")
 BuiltInFunction.lower_string = BuiltInFunction("lower")
 BuiltInFunction.upper_string = BuiltInFunction("upper")
 BuiltInFunction.string = BuiltInFunction("string")
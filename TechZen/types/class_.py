@@ -1,5 +1,8 @@
 from TechZen.types.value_ import Value
+from TechZen.types.number_ import Number
 from TechZen.types.string_ import String
+from TechZen.types.list_ import List
+from TechZen.types.dict_ import Dict
 from TechZen.types.instance_ import Instance
 from TechZen.symbol_table_ import SymbolTable
 from TechZen.context_ import Context
@@ -7,7 +10,14 @@ from TechZen.errors_ import RTError
 from TechZen.runtime_ import RTResult
 
 
+# Values that every instance gets its own copy of. Methods and other values are shared by the instances, through the
+# table of the class.
+FIELD_TYPES = (Number, String, List, Dict)
+
+
 class Class(Value):
+    __slots__ = ("name", "symbol_table", "fields", "shape")
+
     def __init__(self, name, symbol_table):
         """
         Class type. Inherits from Value class.
@@ -17,6 +27,10 @@ class Class(Value):
         super().__init__()
         self.name = name
         self.symbol_table = symbol_table
+        # Names and values of the fields in the table, found when the class is first instantiated
+        self.fields = None
+        # Slots of the fields of the instances, a new shape is made when the fields change
+        self.shape = None
 
     def dived_by(self, other):
         """
@@ -41,53 +55,99 @@ class Class(Value):
 
         return value, None
 
-    def execute(self, args):
+    def get_member(self, name, cache=None):
         """
-        Execute the class.
-        :param args: Class arguments
-        :return: Runtime result
+        Get a member of the class.
+        :param name: Member name
+        :param cache: Inline cache of the member, not used by classes
+        :return: Value, None if the class has no such member
+        """
+        return self.symbol_table.symbols.get(name, None)
+
+    def set_member(self, name, value, cache=None):
+        """
+        Set a member of the class.
+        :param name: Member name
+        :param value: Value
+        :param cache: Inline cache of the member, not used by classes
+        :return: nothing
+        """
+        self.symbol_table.set(name, value)
+        self.fields = None
+
+    def instantiate(self, node, context):
+        """
+        Create a new instance of the class and find its constructor, the function with the name of the class. The
+        instance only gets copies of the fields of the class, its methods are found in the table of the class, which
+        is the parent of the table of the instance. The fields, 'this' and 'self' are kept in the slots of the table
+        of the instance, at the slots of the shape of the class.
+        :param node: Node of the call
+        :param context: Context of the call
+        :return: Instance, constructor, context the constructor is called from and error
         """
         from TechZen.types.function_ import Function
 
-        res = RTResult()
+        exec_ctx = Context(self.name, context, node.pos_start)
 
-        exec_ctx = Context(self.name, self.context, self.pos_start)
+        if self.fields is None:
+            self.fields = [
+                (name, value)
+                for name, value in self.symbol_table.symbols.items()
+                if isinstance(value, FIELD_TYPES) and name not in ("this", "self")
+            ]
+            names = [name for name, _ in self.fields] + ["this", "self"]
+            self.shape = {name: slot for slot, name in enumerate(names)}
+            SymbolTable.nested_names.update(self.shape)
 
         inst = Instance(self)
-        inst.symbol_table = SymbolTable(self.symbol_table)
+        inst.symbol_table = SymbolTable(self.symbol_table, self.shape)
 
         exec_ctx.symbol_table = inst.symbol_table
-        for name in self.symbol_table.symbols:
-            inst.symbol_table.set(name, self.symbol_table.symbols[name].copy())
-
-        for name in inst.symbol_table.symbols:
-            inst.symbol_table.symbols[name].set_context(exec_ctx)
+        slots = inst.symbol_table.slots
+        for slot, (_, value) in enumerate(self.fields):
+            slots[slot] = value.copy().set_context(exec_ctx)
 
-        inst.symbol_table.set("this", inst)
-        inst.symbol_table.set("self", inst)
+        slots[-2] = inst
+        slots[-1] = inst
 
-        method = (
-            inst.symbol_table.symbols[self.name]
-            if self.name in inst.symbol_table.symbols
-            else None
-        )
+        method = self.symbol_table.symbols.get(self.name, None)
 
         if method is None or not isinstance(method, Function):
-            return res.failure(
+            return (
+                None,
+                None,
+                None,
                 RTError(
-                    self.pos_start,
-                    self.pos_end,
+                    node.pos_start,
+                    node.pos_end,
                     f"Function '{self.name}' not defined",
-                    self.context,
-                )
+                    context,
+                ),
             )
 
-        res.register(method.execute(args))
+        return inst, method, exec_ctx, None
+
+    def execute(self, args, node, context):
+        """
+        Execute the class.
+        :param args: Class arguments
+        :param node: Node of the call
+        :param context: Context of the call
+        :return: Runtime result
+        """
+        res = RTResult()
+
+        inst, method, exec_ctx, error = self.instantiate(node, context)
+        if error:
+            return res.failure(error)
+
+        # The constructor runs in the context of the instance and reports errors at its definition
+        res.register(method.execute(args, method, exec_ctx))
         if res.should_return():
             return res
 
         return res.success(
-            inst.set_context(self.context).set_pos(self.pos_start, self.pos_end)
+            inst.set_context(context).set_pos(node.pos_start, node.pos_end)
         )
 
     def copy(self):
@@ -3,9 +3,13 @@ from TechZen.errors_ import RTError
 
 
 class Dict(Value):
+    __slots__ = ("elements",)
+
     def __init__(self, elements):
         """
-        Dictionary type. Inherits from Value class.
+        Dictionary type. Inherits from Value class. Keys are compared by value: numbers that are equal (like 1, 1.0
+        and TRUE) are the same key, and setting it again replaces the value. A number and a string are never the same
+        key.
         :param elements: Elements of the dictionary
         """
         super().__init__()
@@ -29,17 +33,10 @@ class Dict(Value):
         """
         new_dict = self.copy()
         try:
-            for i in range(len(list(self.elements.keys()))):
-                if list(self.elements.keys())[i].value == other.value:
-                    new_dict.elements.pop(list(self.elements.keys())[i])
-                    return new_dict, None
+            del new_dict.elements[other]
         except KeyError:
-            return (
-                None,
-                RTError(
-                    other.pos_start, other.pos_end, "Key does not exist", self.context
-                ),
-            )
+            return None, self.missing_key(other)
+        return new_dict, None
 
     def dived_by(self, other):
         """
@@ -47,17 +44,18 @@ class Dict(Value):
         :param other: Key
         :return: Value
         """
-        try:
-            for i in range(len(list(self.elements.keys()))):
-                if list(self.elements.keys())[i].value == other.value:
-                    return self.elements.get(list(self.elements.keys())[i]), None
-        except KeyError:
-            return (
-                None,
-                RTError(
-                    other.pos_start, other.pos_end, "Key does not exist", self.context
-                ),
-            )
+        value = self.elements.get(other, None)
+        if value is None:
+            return None, self.missing_key(other)
+        return value, None
+
+    def missing_key(self, key):
+        """
+        Error for a key that is not in the dictionary.
+        :param key: Key
+        :return: Runtime error
+        """
+        return RTError(key.pos_start, key.pos_end, "Key does not exist", self.context)
 
     def copy(self):
         """
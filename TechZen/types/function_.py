@@ -1,5 +1,8 @@
 from TechZen.types.base_function_ import BaseFunction
-from TechZen.runtime_ import RTResult
+from TechZen.errors_ import RTError
+from TechZen.runtime_ import RTResult, TailCallSignal
+from TechZen.context_ import Context
+from TechZen.symbol_table_ import SymbolTable
 from TechZen.interpreter_ import Interpreter
 from TechZen.types.number_ import Number
 
@@ -9,34 +12,68 @@ Number.true = Number(1)
 
 
 class Function(BaseFunction):
-    def __init__(self, name, body_node, arg_names, should_auto_return):
+    __slots__ = ("body_node", "arg_names", "should_auto_return", "body_closure", "code")
+
+    def __init__(
+        self,
+        name,
+        body_node,
+        arg_names,
+        should_auto_return,
+        body_closure=None,
+        code=None,
+        slot_index=None,
+    ):
         """
         Function type. Inherits from BaseFunction.
         :param name: Function name
         :param body_node: Function code
         :param arg_names: Function arguments
         :param should_auto_return: True or False
+        :param body_closure: Function code compiled by the Compiler, None to interpret the body node
+        :param code: Function code compiled to bytecode, the VM runs it in its own frame
+        :param slot_index: Slots of the arguments and local variables, given by the Resolver
         """
         super().__init__(name)
         self.body_node = body_node
         self.arg_names = arg_names
         self.should_auto_return = should_auto_return
+        self.body_closure = body_closure
+        self.code = code
+        self.slot_index = slot_index
 
-    def execute(self, args):
+    def execute(self, args, node, context):
         """
         Execute the function code.
         :param args: User-inputted arguments
+        :param node: Node of the call
+        :param context: Context of the call
         :return:
         """
         res = RTResult()
         interpreter = Interpreter()
-        exec_ctx = self.generate_new_context()
+        exec_ctx = self.generate_new_context(node, context)
 
-        res.register(self.check_and_populate_args(self.arg_names, args, exec_ctx))
+        res.register(
+            self.check_and_populate_args(self.arg_names, args, exec_ctx, node)
+        )
         if res.should_return():
             return res
 
-        value = res.register(interpreter.visit(self.body_node, exec_ctx))
+        while True:
+            try:
+                if self.body_closure is not None:
+                    value = res.register(self.body_closure(exec_ctx))
+                else:
+                    value = res.register(interpreter.visit(self.body_node, exec_ctx))
+            except RecursionError:
+                return res.failure(self.recursion_error(node, context))
+            tail_call = res.func_return_value
+            if type(tail_call) is not TailCallSignal:
+                break
+            # The body ended with a call of the function to itself, it runs again with the new arguments
+            exec_ctx = self.generate_tail_context(exec_ctx, tail_call.args)
+
         if res.should_return() and res.func_return_value is None:
             return res
         ret_value = (
@@ -46,6 +83,54 @@ class Function(BaseFunction):
         )
         return res.success(ret_value)
 
+    @staticmethod
+    def recursion_error(node, context):
+        """
+        Make the error of a call that goes deeper than the backend allows: the Python recursion limit for the
+        interpreter and the compiled closures, or the maximum depth of the VM (see vm_.max_depth).
+        :param node: Node of the call
+        :param context: Context of the call
+        :return: Runtime error at the call
+        """
+        return RTError(
+            node.pos_start,
+            node.pos_end,
+            "Maximum recursion depth exceeded",
+            context,
+        )
+
+    def can_tail_call(self, node, args):
+        """
+        Decides whether a call of the function is a tail call, so the body of the function that makes it can run
+        again instead (see Resolver.mark_tail_calls). The name of the function may have been set to another value, so
+        that is checked when it runs.
+        :param node: CallNode
+        :param args: Arguments of the call
+        :return: True or False
+        """
+        return self.body_node is node.tail_body and len(args) == len(self.arg_names)
+
+    def generate_tail_context(self, context, args):
+        """
+        Generate the context of a tail call. It takes the place of the context of the call that makes it, so the
+        caller and the traceback stay the same. The local variables keep their value until they are set again, like
+        they would be found in the parent of a new context.
+        :param context: Context of the call that makes the tail call
+        :param args: Arguments of the tail call
+        :return: New context
+        """
+        new_context = Context(
+            context.display_name, context.parent, context.parent_entry_pos
+        )
+        symbol_table = context.symbol_table
+        new_context.symbol_table = SymbolTable(symbol_table.parent)
+        new_context.symbol_table.symbols = symbol_table.symbols.copy()
+        if symbol_table.slot_index:
+            new_context.symbol_table.slot_index = symbol_table.slot_index
+            new_context.symbol_table.slots = symbol_table.slots.copy()
+        self.populate_args(self.arg_names, args, new_context)
+        return new_context
+
     def copy(self):
         """
         Make a copy of the function
@@ -1,16 +1,91 @@
 from TechZen.types.value_ import Value
+from TechZen.nodes_ import VarAccessNode, InlineCache
 
 
 class Instance(Value):
+    __slots__ = ("parent_class", "symbol_table")
+
     def __init__(self, parent_class):
         """
         Instance type. Inherits from Value class.
+        The fields of an instance are kept in the slots of its symbol table. The slot index of the table is the shape
+        of the instance, it is shared by all instances of the class (see Class.instantiate).
         :param parent_class: Parent class
         """
         super().__init__()
         self.parent_class = parent_class
         self.symbol_table = None
 
+    def find_slot(self, name, cache=None):
+        """
+        Find the slot of a field of the instance.
+        :param name: Member name
+        :param cache: Inline cache of the member, None to look it up in the shape
+        :return: Slot, None if it is not a field of the shape of the instance
+        """
+        shape = self.symbol_table.slot_index
+        if cache is None:
+            return shape.get(name, None)
+        return cache.find_slot(shape, name)
+
+    def get_member(self, name, cache=None):
+        """
+        Get a member of the instance, a field of its own or a method of its class.
+        :param name: Member name
+        :param cache: Inline cache of the member
+        :return: Value, None if the instance has no such member
+        """
+        slot = self.find_slot(name, cache)
+        if slot is None:
+            value = self.symbol_table.symbols.get(name, None)
+        else:
+            value = self.symbol_table.slots[slot]
+        if value is None:
+            return self.parent_class.get_member(name)
+        return value
+
+    def set_member(self, name, value, cache=None):
+        """
+        Set a member of the instance.
+        :param name: Member name
+        :param value: Value
+        :param cache: Inline cache of the member
+        :return: nothing
+        """
+        slot = self.find_slot(name, cache)
+        if slot is None:
+            self.symbol_table.set(name, value)
+        else:
+            self.symbol_table.slots[slot] = value
+
+    def get_attribute(self, node):
+        """
+        Get the value of a member access that only reads names, like 'a.b.c', without running the members in the
+        tables of the instances. Each member is found with the inline cache of its node.
+        :param node: VarAccessNode of the first member
+        :return: Value, None if the members have to be run in the tables (a member is not a name, is missing or is
+                 read from something that is not an instance)
+        """
+        inst = self
+        while type(node) is VarAccessNode and type(inst) is Instance:
+            table = inst.symbol_table
+            cache = node.cache
+            if cache is None:
+                cache = node.cache = InlineCache()
+            if table.slot_index is cache.shape:
+                slot = cache.slot
+            else:
+                slot = cache.find_slot(table.slot_index, node.var_name_token.value)
+            value = None if slot is None else table.slots[slot]
+            if value is None:
+                value = table.get(node.var_name_token.value)
+                if value is None:
+                    return None
+            if node.child is None:
+                return value
+            inst, node = value, node.child
+        return None
+
     def copy(self):
         """
         Make a copy of instance.
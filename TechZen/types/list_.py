@@ -4,6 +4,8 @@ from TechZen.errors_ import RTError
 
 
 class List(Value):
+    __slots__ = ("elements",)
+
     def __init__(self, elements):
         """
         List type. Inherits from Value class.
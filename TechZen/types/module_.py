@@ -0,0 +1,31 @@
+from TechZen.types.value_ import Value
+
+
+class Module(Value):
+    __slots__ = ("name", "symbol_table", "backend")
+
+    # Every module that has been included, by file name. A file is only loaded the first time it's included, and again
+    # when another backend includes it.
+    modules = {}
+
+    def __init__(self, name, symbol_table, backend):
+        """
+        Module type, the functions and classes of an included file. Inherits from Value class.
+        :param name: File name of the module
+        :param symbol_table: Symbol table with the functions and classes of the file
+        :param backend: The backend that ran the functions and classes, like in Runner.run
+        """
+        super().__init__()
+        self.name = name
+        self.symbol_table = symbol_table
+        self.backend = backend
+
+    def copy(self):
+        """
+        Create a copy of the module
+        :return: Copy
+        """
+        return self
+
+    def __repr__(self):
+        return f"<module {self.name}>"
@@ -1,8 +1,14 @@
 from TechZen.types.value_ import Value
 from TechZen.errors_ import RTError
 
+# Range of the integers Number.of shares
+SMALL_INT_MIN = -5
+SMALL_INT_MAX = 1024
+
 
 class Number(Value):
+    __slots__ = ("value",)
+
     def __init__(self, value):
         """
         Number type. Inherits from Value class.
@@ -18,7 +24,7 @@ class Number(Value):
         :return: Sum
         """
         if isinstance(other, Number):
-            return Number(self.value + other.value).set_context(self.context), None
+            return Number.of(self.value + other.value), None
         else:
             return None, Value.illegal_operation(self, other)
 
@@ -29,7 +35,7 @@ class Number(Value):
         :return: Difference
         """
         if isinstance(other, Number):
-            return Number(self.value - other.value).set_context(self.context), None
+            return Number.of(self.value - other.value), None
         else:
             return None, Value.illegal_operation(self, other)
 
@@ -40,7 +46,7 @@ class Number(Value):
         :return: Product
         """
         if isinstance(other, Number):
-            return Number(self.value * other.value).set_context(self.context), None
+            return Number.of(self.value * other.value), None
         else:
             return None, Value.illegal_operation(self, other)
 
@@ -60,7 +66,7 @@ class Number(Value):
                 ),
             )
 
-        return Number(self.value / other.value).set_context(self.context), None
+        return Number.of(self.value / other.value), None
 
     def floor_of(self, other):
         """
@@ -78,7 +84,7 @@ class Number(Value):
                 ),
             )
 
-        return Number(self.value // other.value).set_context(self.context), None
+        return Number.of(self.value // other.value), None
 
     def pow_of(self, other):
         """
@@ -87,7 +93,7 @@ class Number(Value):
         :return: Product
         """
         if isinstance(other, Number):
-            return Number(self.value**other.value).set_context(self.context), None
+            return Number.of(self.value**other.value), None
         else:
             return None, Value.illegal_operation(self, other)
 
@@ -98,7 +104,7 @@ class Number(Value):
         :return: Number
         """
         if isinstance(other, Number):
-            return Number(self.value % other.value).set_context(self.context), None
+            return Number.of(self.value % other.value), None
         else:
             return None, Value.illegal_operation(self, other)
 
@@ -110,7 +116,7 @@ class Number(Value):
         """
         if isinstance(other, Number):
             return (
-                Number(int(self.value == other.value)).set_context(self.context),
+                Number.of(int(self.value == other.value)),
                 None,
             )
         else:
@@ -124,7 +130,7 @@ class Number(Value):
         """
         if isinstance(other, Number):
             return (
-                Number(int(self.value != other.value)).set_context(self.context),
+                Number.of(int(self.value != other.value)),
                 None,
             )
         else:
@@ -137,7 +143,7 @@ class Number(Value):
         :return: Boolean
         """
         if isinstance(other, Number):
-            return Number(int(self.value < other.value)).set_context(self.context), None
+            return Number.of(int(self.value < other.value)), None
         else:
             return None, Value.illegal_operation(self, other)
 
@@ -148,7 +154,7 @@ class Number(Value):
         :return: Boolean
         """
         if isinstance(other, Number):
-            return Number(int(self.value > other.value)).set_context(self.context), None
+            return Number.of(int(self.value > other.value)), None
         else:
             return None, Value.illegal_operation(self, other)
 
@@ -160,7 +166,7 @@ class Number(Value):
         """
         if isinstance(other, Number):
             return (
-                Number(int(self.value <= other.value)).set_context(self.context),
+                Number.of(int(self.value <= other.value)),
                 None,
             )
         else:
@@ -174,7 +180,7 @@ class Number(Value):
         """
         if isinstance(other, Number):
             return (
-                Number(int(self.value >= other.value)).set_context(self.context),
+                Number.of(int(self.value >= other.value)),
                 None,
             )
         else:
@@ -188,7 +194,7 @@ class Number(Value):
         """
         if isinstance(other, Number):
             return (
-                Number(int(self.value and other.value)).set_context(self.context),
+                Number.of(int(self.value and other.value)),
                 None,
             )
         else:
@@ -202,7 +208,7 @@ class Number(Value):
         """
         if isinstance(other, Number):
             return (
-                Number(int(self.value or other.value)).set_context(self.context),
+                Number.of(int(self.value or other.value)),
                 None,
             )
         else:
@@ -213,7 +219,18 @@ class Number(Value):
         Return the opposite of the number
         :return: Boolean
         """
-        return Number(1 if self.value == 0 else 0).set_context(self.context), None
+        return Number.of(1 if self.value == 0 else 0), None
+
+    @classmethod
+    def of(cls, value):
+        """
+        Get a number. Numbers are never changed, so small integers are shared instead of made again.
+        :param value: Value
+        :return: Number
+        """
+        if type(value) is int and SMALL_INT_MIN <= value <= SMALL_INT_MAX:
+            return cls.small_ints[value - SMALL_INT_MIN]
+        return cls(value)
 
     def copy(self):
         """
@@ -232,10 +249,25 @@ class Number(Value):
         """
         return self.value != 0
 
+    def __eq__(self, other):
+        """
+        Numbers with the same value are equal, so they find the same key in a dictionary. Like in Python, 1, 1.0 and
+        TRUE (which is 1) are the same key.
+        :param other: Class / other
+        :return: Boolean
+        """
+        if isinstance(other, Number):
+            return self.value == other.value
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self.value)
+
     def __repr__(self):
         return str(self.value)
 
 
+Number.small_ints = [Number(i) for i in range(SMALL_INT_MIN, SMALL_INT_MAX + 1)]
 Number.null = Number(0)
 Number.false = Number(0)
 Number.true = Number(1)
@@ -3,6 +3,8 @@ from TechZen.types.number_ import Number
 
 
 class String(Value):
+    __slots__ = ("value",)
+
     def __init__(self, value):
         """
         String type. Inherits from Value class.
@@ -41,7 +43,7 @@ class String(Value):
         """
         if isinstance(other, String):
             return (
-                Number(int(self.value == other.value)).set_context(self.context),
+                Number.of(int(self.value == other.value)),
                 None,
             )
         else:
@@ -55,7 +57,7 @@ class String(Value):
         """
         if isinstance(other, String):
             return (
-                Number(int(self.value != other.value)).set_context(self.context),
+                Number.of(int(self.value != other.value)),
                 None,
             )
         else:
@@ -78,6 +80,19 @@ class String(Value):
         copy.set_context(self.context)
         return copy
 
+    def __eq__(self, other):
+        """
+        Strings with the same value are equal, so they find the same key in a dictionary.
+        :param other: Class / other
+        :return: Boolean
+        """
+        if isinstance(other, String):
+            return self.value == other.value
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self.value)
+
     def __str__(self):
         return self.value
 
@@ -3,6 +3,8 @@ from TechZen.errors_ import RTError
 
 
 class Value:
+    __slots__ = ("pos_start", "pos_end", "context")
+
     def __init__(self):
         """
         This is the value base class. All other types use this class as a parent.
@@ -157,13 +159,15 @@ class Value:
         """
         return None, self.illegal_operation()
 
-    def execute(self, args):
+    def execute(self, args, node, context):
         """
         Execute a function, for most classes this doesn't exist, so as a base it returns an error.
         :param args: Arguments in the function
+        :param node: Node of the call
+        :param context: Context of the call
         :return: Error
         """
-        return RTResult().failure(self.illegal_operation())
+        return RTResult().failure(self.located(node, context).illegal_operation())
 
     def copy(self):
         """
@@ -172,6 +176,16 @@ class Value:
         """
         raise Exception("No copy method defined")
 
+    def located(self, node, context):
+        """
+        Values are shared and do not know where they are used, so they have no position. When an operation on them
+        fails, it is done again with a located copy to get the error message.
+        :param node: Node the value comes from
+        :param context: Context the value is used in
+        :return: Copy with the position of the node and the context
+        """
+        return self.copy().set_pos(node.pos_start, node.pos_end).set_context(context)
+
     @staticmethod
     def is_true():
         """
@@ -0,0 +1,671 @@
+#######################################
+# VIRTUAL MACHINE
+#######################################
+from TechZen.runtime_ import RTResult
+from TechZen.errors_ import RTError
+from TechZen.context_ import Context
+from TechZen.symbol_table_ import SymbolTable
+from TechZen.bytecode_ import BytecodeCompiler, OpCode, BINARY_METHODS
+from TechZen.operations_ import NUMBER_OPERATIONS
+from TechZen.types.number_ import Number
+from TechZen.types.string_ import String
+from TechZen.types.list_ import List
+from TechZen.types.class_ import Class
+from TechZen.types.instance_ import Instance
+from TechZen.types.function_ import Function
+from TechZen.interpreter_ import Interpreter
+
+LOAD_CONST = int(OpCode.LOAD_CONST)
+LOAD_NULL = int(OpCode.LOAD_NULL)
+LOAD_NAME = int(OpCode.LOAD_NAME)
+STORE_NAME = int(OpCode.STORE_NAME)
+STORE_ATTR = int(OpCode.STORE_ATTR)
+ENTER_MEMBER = int(OpCode.ENTER_MEMBER)
+EXIT_MEMBER = int(OpCode.EXIT_MEMBER)
+POP_TOP = int(OpCode.POP_TOP)
+BUILD_LIST = int(OpCode.BUILD_LIST)
+BUILD_DICT = int(OpCode.BUILD_DICT)
+LIST_APPEND = int(OpCode.LIST_APPEND)
+UNARY_NEGATIVE = int(OpCode.UNARY_NEGATIVE)
+UNARY_NOT = int(OpCode.UNARY_NOT)
+JUMP = int(OpCode.JUMP)
+POP_JUMP_IF_FALSE = int(OpCode.POP_JUMP_IF_FALSE)
+FOR_PREP = int(OpCode.FOR_PREP)
+FOR_ITER = int(OpCode.FOR_ITER)
+SETUP_LOOP = int(OpCode.SETUP_LOOP)
+SETUP_TRY = int(OpCode.SETUP_TRY)
+POP_BLOCK = int(OpCode.POP_BLOCK)
+BREAK_LOOP = int(OpCode.BREAK_LOOP)
+CONTINUE_LOOP = int(OpCode.CONTINUE_LOOP)
+MAKE_FUNCTION = int(OpCode.MAKE_FUNCTION)
+MAKE_CLASS = int(OpCode.MAKE_CLASS)
+CALL = int(OpCode.CALL)
+TAIL_CALL = int(OpCode.TAIL_CALL)
+RETURN_VALUE = int(OpCode.RETURN_VALUE)
+END = int(OpCode.END)
+INCLUDE = int(OpCode.INCLUDE)
+LOAD_LOCAL = int(OpCode.LOAD_LOCAL)
+STORE_LOCAL = int(OpCode.STORE_LOCAL)
+LOAD_GLOBAL = int(OpCode.LOAD_GLOBAL)
+
+# Most frames the VM runs at the same time. The frames are kept in a list instead of the Python stack, so a program can
+# recurse much deeper than with the other backends. A call that goes deeper fails with an error instead of using up
+# the memory.
+max_depth = 100_000
+
+BINARY_OPERATIONS = {int(op): method for op, method in BINARY_METHODS.items()}
+NUMBER_BINARY_OPERATIONS = {
+    op: NUMBER_OPERATIONS[method] for op, method in BINARY_OPERATIONS.items()
+}
+BINARY_ADD = int(OpCode.BINARY_ADD)
+
+# Why the VM unwinds the blocks and frames.
+UNWIND_ERROR = "error"
+UNWIND_RETURN = "return"
+UNWIND_BREAK = "break"
+UNWIND_CONTINUE = "continue"
+UNWIND_EXIT = "exit"
+
+BLOCK_LOOP = "loop"
+BLOCK_TRY = "try"
+
+
+class Block:
+    def __init__(self, kind, target, frame, continue_target=None):
+        """
+        A loop or try block inside a frame.
+        :param kind: BLOCK_LOOP or BLOCK_TRY
+        :param target: Where to jump on break (loop) or when anything unwinds into it (try)
+        :param frame: Frame the block is in, its stack height and context are restored when the block is unwound
+        :param continue_target: Where to jump on continue
+        """
+        self.kind = kind
+        self.target = target
+        self.stack_height = len(frame.stack)
+        self.context = frame.context
+        self.scope_depth = len(frame.scopes)
+        self.continue_target = continue_target
+
+
+class Frame:
+    def __init__(self, code, context, finish=None):
+        """
+        A frame of the VM. Every running program, function call and class body has its own frame with a value stack.
+        :param code: Code to run
+        :param context: Context of the frame
+        :param finish: Function that turns the value the code returns into the value the caller gets, or None
+        """
+        self.code = code
+        self.context = context
+        self.finish = finish
+        self.ip = 0
+        self.stack = []
+        self.blocks = []
+        self.scopes = []
+
+
+class VM:
+    def __init__(self):
+        """
+        This is the virtual machine. It runs bytecode with an explicit stack of frames, so calling a TechZen function
+        does not call Python functions recursively.
+        """
+        self.frames = []
+        self.result = None
+
+    @classmethod
+    def run(cls, code, context):
+        """
+        Runs a compiled program.
+        :param code: Code of the program
+        :param context: Context object
+        :return: Runtime result
+        """
+        vm = cls()
+        vm.frames.append(Frame(code, context))
+        vm.execute()
+        return vm.result
+
+    def execute(self):  # sourcery no-metrics
+        """
+        The run loop. The inner loop runs the instructions of the current frame, it is left whenever another frame
+        becomes the current one.
+        :return: nothing
+        """
+        frames = self.frames
+
+        while frames:
+            frame = frames[-1]
+            code = frame.code
+            instructions = code.instructions
+            constants = code.constants
+            names = code.names
+            local_names = code.local_names
+            stack = frame.stack
+            push = stack.append
+            pop = stack.pop
+            context = frame.context
+            ip = frame.ip
+
+            while True:
+                op = instructions[ip]
+                arg = instructions[ip + 1]
+                ip += 2
+
+                if op == LOAD_LOCAL:
+                    value = context.symbol_table.slots[arg]
+                    if value is None:
+                        value = context.symbol_table.get_local(local_names[arg], arg)
+                        if value is None:
+                            frame.ip = ip
+                            self.undefined_name(code, ip, local_names[arg], context)
+                            break
+                    push(value)
+
+                elif op == LOAD_GLOBAL:
+                    value = context.symbol_table.get_global(names[arg])
+                    if value is None:
+                        frame.ip = ip
+                        self.undefined_name(code, ip, names[arg], context)
+                        break
+                    push(value)
+
+                elif op == LOAD_NAME:
+                    value = context.symbol_table.get(names[arg])
+                    if value is None:
+                        frame.ip = ip
+                        self.undefined_name(code, ip, names[arg], context)
+                        break
+                    push(value)
+
+                elif op == LOAD_CONST:
+                    push(constants[arg])
+
+                elif op == STORE_LOCAL:
+                    context.symbol_table.slots[arg] = stack[-1]
+
+                elif op == STORE_NAME:
+                    context.symbol_table.set(names[arg], stack[-1])
+
+                elif op == POP_TOP:
+                    pop()
+
+                elif op in BINARY_OPERATIONS:
+                    right = pop()
+                    left = pop()
+                    # Operations on two numbers and additions of two strings skip the Value methods
+                    value = (
+                        NUMBER_BINARY_OPERATIONS[op](left.value, right.value)
+                        if type(left) is Number and type(right) is Number
+                        else None
+                    )
+                    if value is not None:
+                        push(Number.of(value))
+                    elif (
+                        op == BINARY_ADD
+                        and type(left) is String
+                        and type(right) is String
+                    ):
+                        push(String(left.value + right.value).set_context(left.context))
+                    else:
+                        result, error = getattr(left, BINARY_OPERATIONS[op])(right)
+                        if error:
+                            frame.ip = ip
+                            self.unwind_error(
+                                self.binary_error(
+                                    code.nodes[(ip >> 1) - 1], op, left, right, context
+                                )
+                            )
+                            break
+                        push(result)
+
+                elif op == FOR_ITER:
+                    state = stack[-1]
+                    i = state[0]
+                    if i < state[1] if state[2] >= 0 else i > state[1]:
+                        state[0] = i + state[2]
+                        push(Number.of(i))
+                    else:
+                        ip = arg
+
+                elif op == POP_JUMP_IF_FALSE:
+                    if not pop().is_true():
+                        ip = arg
+
+                elif op == JUMP:
+                    ip = arg
+
+                elif op == LOAD_NULL:
+                    push(Number.null)
+
+                elif op == CALL or op == TAIL_CALL:
+                    node = code.nodes[(ip >> 1) - 1]
+                    args = stack[len(stack) - arg :]
+                    del stack[len(stack) - arg :]
+                    value_to_call = pop()
+                    frame.ip = ip
+                    if (
+                        op == TAIL_CALL
+                        and type(value_to_call) is Function
+                        and value_to_call.can_tail_call(node, args)
+                    ):
+                        self.tail_call(frame, value_to_call, args)
+                        break
+                    if self.call(value_to_call, args, node, context):
+                        break
+                    # The call did not need a new frame, its result is already on the stack
+                    ip = frame.ip
+
+                elif op == END:
+                    frame.ip = ip
+                    self.finish_frame(pop())
+                    break
+
+                elif op == LIST_APPEND:
+                    value = pop()
+                    stack[-arg].elements.append(value)
+
+                elif op == BUILD_LIST:
+                    elements = stack[len(stack) - arg :]
+                    del stack[len(stack) - arg :]
+                    node = code.nodes[(ip >> 1) - 1]
+                    push(
+                        List(elements)
+                        .set_context(context)
+                        .set_pos(node.pos_start, node.pos_end)
+                    )
+
+                elif op == UNARY_NEGATIVE or op == UNARY_NOT:
+                    value = pop()
+                    if op == UNARY_NEGATIVE:
+                        result, error = value.multed_by(Number.of(-1))
+                    else:
+                        result, error = value.notted()
+                    if error:
+                        node = code.nodes[(ip >> 1) - 1]
+                        value = value.located(node.node, context)
+                        if op == UNARY_NEGATIVE:
+                            _, error = value.multed_by(
+                                Number.of(-1).located(node, context)
+                            )
+                        else:
+                            _, error = value.notted()
+                        frame.ip = ip
+                        self.unwind_error(error)
+                        break
+                    push(result)
+
+                elif op == SETUP_LOOP:
+                    frame.blocks.append(Block(BLOCK_LOOP, arg, frame, ip))
+
+                elif op == POP_BLOCK:
+                    frame.blocks.pop()
+
+                elif op == FOR_PREP:
+                    step_value = pop()
+                    end_value = pop()
+                    start_value = pop()
+                    push([start_value.value, end_value.value, step_value.value])
+
+                elif op == BREAK_LOOP or op == CONTINUE_LOOP:
+                    frame.ip = ip
+                    self.unwind(UNWIND_BREAK if op == BREAK_LOOP else UNWIND_CONTINUE)
+                    break
+
+                elif op == RETURN_VALUE:
+                    frame.ip = ip
+                    self.unwind(UNWIND_RETURN, pop())
+                    break
+
+                elif op == ENTER_MEMBER:
+                    value = pop()
+                    node = code.nodes[(ip >> 1) - 1]
+                    if not isinstance(value, Instance) and not isinstance(
+                        value, Class
+                    ):
+                        frame.ip = ip
+                        self.unwind_error(
+                            RTError(
+                                node.pos_start,
+                                node.pos_end,
+                                "Value must be instance of class or class",
+                                context,
+                            )
+                        )
+                        break
+                    member = (
+                        value.get_attribute(node.child)
+                        if type(value) is Instance
+                        else None
+                    )
+                    if member is not None:
+                        push(member)
+                        ip = arg
+                    else:
+                        frame.scopes.append(context)
+                        context = Context(
+                            value.parent_class.name, context, node.pos_start
+                        )
+                        context.symbol_table = value.symbol_table
+                        frame.context = context
+
+                elif op == EXIT_MEMBER:
+                    context = frame.scopes.pop()
+                    frame.context = context
+
+                elif op == STORE_ATTR:
+                    error = self.store_attribute(
+                        code.nodes[(ip >> 1) - 1], stack[-1], context
+                    )
+                    if error:
+                        frame.ip = ip
+                        self.unwind_error(error)
+                        break
+
+                elif op == BUILD_DICT:
+                    from TechZen.types.dict_ import Dict
+
+                    items = stack[len(stack) - 2 * arg :]
+                    del stack[len(stack) - 2 * arg :]
+                    node = code.nodes[(ip >> 1) - 1]
+                    push(
+                        Dict(dict(zip(items[::2], items[1::2])))
+                        .set_context(context)
+                        .set_pos(node.pos_start, node.pos_end)
+                    )
+
+                elif op == SETUP_TRY:
+                    frame.blocks.append(Block(BLOCK_TRY, arg, frame))
+
+                elif op == MAKE_FUNCTION:
+                    template = constants[arg]
+                    node = code.nodes[(ip >> 1) - 1]
+                    push(
+                        Function(
+                            template.name,
+                            template.body_node,
+                            template.arg_names,
+                            template.should_auto_return,
+                            code=template.code,
+                            slot_index=template.slot_index,
+                        )
+                        .set_context(context)
+                        .set_pos(node.pos_start, node.pos_end)
+                    )
+
+                elif op == MAKE_CLASS:
+                    frame.ip = ip
+                    self.make_class(constants[arg], code.nodes[(ip >> 1) - 1], context)
+                    break
+
+                elif op == INCLUDE:
+                    frame.ip = ip
+                    if self.push_result(
+                        Interpreter.run_include(
+                            code.nodes[(ip >> 1) - 1], context, "vm"
+                        )
+                    ):
+                        break
+                    ip = frame.ip
+
+                else:
+                    raise Exception(f"Unknown opcode {op}")
+
+    def undefined_name(self, code, ip, name, context):
+        """
+        Unwinds because a variable is not defined.
+        :param code: Code of the current frame
+        :param ip: Instruction pointer, just after the instruction that failed
+        :param name: Variable name
+        :param context: Context object
+        :return: True
+        """
+        node = code.nodes[(ip >> 1) - 1]
+        return self.unwind_error(
+            RTError(node.pos_start, node.pos_end, f"'{name}' is not defined", context)
+        )
+
+    def binary_error(self, node, op, left, right, context):
+        """
+        Values have no positions, so when a binary operation fails, it is done again with located values to get the
+        same error as the interpreter.
+        :param node: BinOpNode
+        :param op: Binary opcode
+        :param left: Left value
+        :param right: Right value
+        :param context: Context object
+        :return: Error
+        """
+        left = left.located(node.left_node, context)
+        right = right.located(node.right_node, context)
+        _, error = getattr(left, BINARY_OPERATIONS[op])(right)
+        return error
+
+    def call(self, value_to_call, args, node, context):
+        """
+        Calls a value. TechZen functions and classes get a new frame, everything else is executed directly. Functions
+        made by another backend (like by a script that run() runs) are compiled when they are first called.
+        :param value_to_call: Function, class or other value
+        :param args: Arguments
+        :param node: CallNode
+        :param context: Context of the caller
+        :return: True if the current frame changed
+        """
+        if isinstance(value_to_call, Function):
+            return self.call_function(value_to_call, args, node, context)
+
+        if isinstance(value_to_call, Class):
+            inst, method, exec_ctx, error = value_to_call.instantiate(node, context)
+            if error:
+                return self.unwind_error(error)
+            # Like Class.execute, the constructor reports errors at its definition
+            return self.call_function(
+                method,
+                args,
+                method,
+                exec_ctx,
+                lambda _: inst.set_context(context).set_pos(
+                    node.pos_start, node.pos_end
+                ),
+            )
+
+        return self.push_result(value_to_call.execute(args, node, context))
+
+    def call_function(self, function, args, node, context, finish=None):
+        """
+        Pushes a new frame that runs a function, compiled first if it has no bytecode yet.
+        :param function: Function
+        :param args: Arguments
+        :param node: Node of the call
+        :param context: Context of the call
+        :param finish: Function that turns the return value into the value the caller gets
+        :return: True if the current frame changed
+        """
+        if len(self.frames) >= max_depth:
+            return self.unwind_error(function.recursion_error(node, context))
+
+        if function.code is None:
+            function.code = BytecodeCompiler.compile_function(
+                function.name,
+                function.body_node,
+                function.should_auto_return,
+                function.slot_index,
+                function.body_node,
+            )
+
+        exec_ctx = function.generate_new_context(node, context)
+        res = function.check_and_populate_args(
+            function.arg_names, args, exec_ctx, node
+        )
+        if res.should_return():
+            return self.push_result(res)
+
+        self.frames.append(Frame(function.code, exec_ctx, finish))
+        return True
+
+    @staticmethod
+    def tail_call(frame, function, args):
+        """
+        Runs the code of the current frame again for a tail call of its function to itself, instead of pushing a new
+        frame.
+        :param frame: Current frame
+        :param function: Function
+        :param args: Arguments
+        :return: nothing
+        """
+        frame.context = function.generate_tail_context(frame.context, args)
+        frame.ip = 0
+        frame.stack.clear()
+        frame.blocks.clear()
+        frame.scopes.clear()
+
+    def make_class(self, body_code, node, context):
+        """
+        Pushes a new frame that runs the body of a class. When it is done, the class is stored and pushed.
+        :param body_code: Code of the class body
+        :param node: ClassNode
+        :param context: Context the class is defined in
+        :return: nothing
+        """
+        class_name = node.class_name_token.value
+        ctx = Context(class_name, context, node.pos_start)
+        ctx.symbol_table = SymbolTable(context.symbol_table)
+
+        def finish(_):
+            cls_ = (
+                Class(class_name, ctx.symbol_table)
+                .set_context(context)
+                .set_pos(node.pos_start, node.pos_end)
+            )
+            context.symbol_table.set(class_name, cls_)
+            return cls_
+
+        self.frames.append(Frame(body_code, ctx, finish))
+
+    def store_attribute(self, node, value, context):
+        """
+        Stores a value in an attribute of an instance or a class, like 'var this.name = name'.
+        :param node: VarAssignNode
+        :param value: Value to store
+        :param context: Context object
+        :return: Error or None
+        """
+        var_name = node.var_name_token.value
+        nd = context.symbol_table.get(var_name)
+        prev = None
+
+        if not nd:
+            return RTError(
+                node.pos_start, node.pos_end, f"'{var_name}' not defined", context
+            )
+
+        for index, name_token in enumerate(node.extra_names):
+            name = name_token.value
+
+            if not isinstance(nd, Class) and not isinstance(nd, Instance):
+                return RTError(
+                    node.pos_start,
+                    node.pos_end,
+                    "Value must be instance of class or class",
+                    context,
+                )
+
+            prev = nd
+            nd = nd.get_member(name, node.caches[index])
+
+            if not nd and index != len(node.extra_names) - 1:
+                return RTError(
+                    node.pos_start, node.pos_end, f"'{name}' not defined", context
+                )
+
+        prev.set_member(node.extra_names[-1].value, value, node.caches[-1])
+        return None
+
+    def push_result(self, res):
+        """
+        Pushes the value of a runtime result, or unwinds when it stopped the program.
+        :param res: Runtime result
+        :return: True if the current frame changed
+        """
+        if res.error:
+            return self.unwind_error(res.error)
+        if res.should_exit:
+            return self.unwind(UNWIND_EXIT)
+        if res.loop_should_break:
+            return self.unwind(UNWIND_BREAK)
+        if res.loop_should_continue:
+            return self.unwind(UNWIND_CONTINUE)
+        self.frames[-1].stack.append(res.value)
+        return False
+
+    def finish_frame(self, value, explicit_return=False):
+        """
+        Removes the current frame and gives its value to the caller.
+        :param value: Value of the frame
+        :param explicit_return: True if a return statement finished the frame
+        :return: True
+        """
+        frame = self.frames.pop()
+        if frame.finish:
+            value = frame.finish(value)
+
+        if self.frames:
+            self.frames[-1].stack.append(value)
+        else:
+            # Like the interpreter, a return statement in the program itself gives no value
+            self.result = RTResult().success(None if explicit_return else value)
+        return True
+
+    def unwind_error(self, error):
+        """
+        Unwinds because of an error.
+        :param error: Error
+        :return: True
+        """
+        return self.unwind(UNWIND_ERROR, error)
+
+    def unwind(self, reason, value=None):
+        """
+        Goes back through the blocks and frames until something handles the reason. Like in the interpreter, a try
+        block handles everything, loops handle break and continue and frames handle return.
+        :param reason: One of the UNWIND_ constants
+        :param value: Return value or error
+        :return: True
+        """
+        frames = self.frames
+
+        while frames:
+            frame = frames[-1]
+
+            while frame.blocks:
+                block = frame.blocks[-1]
+
+                if block.kind == BLOCK_TRY or reason in (
+                    UNWIND_BREAK,
+                    UNWIND_CONTINUE,
+                ):
+                    del frame.stack[block.stack_height :]
+                    frame.context = block.context
+                    del frame.scopes[block.scope_depth :]
+
+                    if block.kind == BLOCK_TRY or reason == UNWIND_BREAK:
+                        frame.blocks.pop()
+                        frame.ip = block.target
+                    else:
+                        frame.ip = block.continue_target
+                    return True
+
+                frame.blocks.pop()
+
+            if reason == UNWIND_RETURN:
+                return self.finish_frame(value, explicit_return=True)
+
+            frames.pop()
+
+        if reason == UNWIND_ERROR:
+            self.result = RTResult().failure(value)
+        elif reason == UNWIND_EXIT:
+            self.result = RTResult().success_exit(None)
+        else:
+            self.result = RTResult().success(None)
+        return True
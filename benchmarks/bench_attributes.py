@@ -0,0 +1,56 @@
+"""
+Benchmark for reading and setting members of instances.
+Runs a loop that reads a member of a member of an instance ('a.b.c') and sets a member of an instance on every
+iteration, and prints how long an iteration takes with each backend.
+Usage: python benchmarks/bench_attributes.py [iterations]
+"""
+import sys
+import os
+import time
+
+current_file = os.path.realpath(__file__)
+current_dir_benchmarks = os.path.dirname(current_file)
+parent_dir_parent_directory = os.path.dirname(current_dir_benchmarks)
+sys.path.insert(0, parent_dir_parent_directory)
+
+from TechZen.runner import Runner
+
+PROGRAM = """class Node
+    var value = 0
+    var next = 0
+    fun Node(value)
+        var this.value = value
+    endf
+endc
+var head = Node(1)
+var head.next = Node(2)
+var head.next.next = Node(3)
+var total = 0
+for i = 0 to {iterations} then
+    var total = total + head.next.next.value
+    var head.value = i
+end
+total
+"""
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    text = PROGRAM.format(iterations=iterations)
+
+    for backend in ("tree", "closure", "vm"):
+        elapsed = float("inf")
+        for _ in range(3):
+            start = time.process_time()
+            _, error, _ = Runner.run("<bench>", text, backend)
+            elapsed = min(elapsed, time.process_time() - start)
+            if error:
+                raise Exception(error.as_string())
+        print(
+            f"{backend:<7}  {iterations} iterations in {elapsed:.3f}s, "
+            f"{elapsed / iterations * 1e6:.2f} us/iteration"
+        )
+
+
+if __name__ == "__main__":
+    main()
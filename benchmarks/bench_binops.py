@@ -0,0 +1,51 @@
+"""
+Benchmark for binary operations.
+Runs a loop with arithmetic and comparisons on numbers and additions of strings on every iteration, and prints how
+long an iteration takes with each backend.
+Usage: python benchmarks/bench_binops.py [iterations]
+"""
+import sys
+import os
+import time
+
+current_file = os.path.realpath(__file__)
+current_dir_benchmarks = os.path.dirname(current_file)
+parent_dir_parent_directory = os.path.dirname(current_dir_benchmarks)
+sys.path.insert(0, parent_dir_parent_directory)
+
+from TechZen.runner import Runner
+
+PROGRAM = """var total = 0
+var count = 0
+var text = ''
+for i = 0 to {iterations} then
+    var total = total + i * 3 - i % 7 + i / 4
+    if i > 10 AND i <= total then
+        var count = count + 1
+    end
+    var text = 'ab' + 'cd'
+end
+total
+"""
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    text = PROGRAM.format(iterations=iterations)
+
+    for backend in ("tree", "closure", "vm"):
+        elapsed = float("inf")
+        for _ in range(3):
+            start = time.process_time()
+            _, error, _ = Runner.run("<bench>", text, backend)
+            elapsed = min(elapsed, time.process_time() - start)
+            if error:
+                raise Exception(error.as_string())
+        print(
+            f"{backend:<7}  {iterations} iterations in {elapsed:.3f}s, "
+            f"{elapsed / iterations * 1e6:.2f} us/iteration"
+        )
+
+
+if __name__ == "__main__":
+    main()
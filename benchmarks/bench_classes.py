@@ -0,0 +1,65 @@
+"""
+Benchmark for making instances of a class with many methods.
+Runs a loop that makes instances of a class with a few fields and many methods and calls one of them, and prints how
+long an instance takes to make and how much memory each one uses (from tracemalloc).
+Usage: python benchmarks/bench_classes.py [instances] [methods] [backend]
+"""
+import sys
+import os
+import time
+import tracemalloc
+
+current_file = os.path.realpath(__file__)
+current_dir_benchmarks = os.path.dirname(current_file)
+parent_dir_parent_directory = os.path.dirname(current_dir_benchmarks)
+sys.path.insert(0, parent_dir_parent_directory)
+
+from TechZen.runner import Runner
+
+
+def generate(instances, methods):
+    """
+    Makes a program with a class of 3 fields and the given number of methods, and a loop that makes its instances.
+    """
+    lines = ["class Point", "    var x = 0", "    var y = 0", "    var tag = 'p'"]
+    lines += ["    fun Point(x, y)", "        var this.x = x", "        var this.y = y"]
+    lines += ["    endf"]
+    lines += [f"    fun method_{i}() -> this.x + {i}" for i in range(methods)]
+    lines += ["endc"]
+    lines += [
+        "var points = []",
+        f"for i = 0 to {instances} then append(points, Point(i, 2))",
+        "var first = points / 0",
+        "first.method_0()",
+    ]
+    return "\n".join(lines)
+
+
+def main():
+    instances = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    methods = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    backend = sys.argv[3] if len(sys.argv) > 3 else "tree"
+    text = generate(instances, methods)
+
+    elapsed = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        _, error, _ = Runner.run("<bench>", text, backend)
+        elapsed = min(elapsed, time.perf_counter() - start)
+        if error:
+            raise Exception(error.as_string())
+
+    tracemalloc.start()
+    Runner.run("<bench>", text, backend)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    print(
+        f"{instances} instances of a class with {methods} methods in {elapsed:.3f}s: "
+        f"{elapsed / instances * 1e6:.1f} us/instance, "
+        f"{memory / instances:.0f} B/instance"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Benchmark for deep recursion that is not a tail call.
+Runs a recursive function at growing depths with each backend and prints how long it takes, or the error when the
+backend can not go that deep. The last depth is deeper than the VM allows, so it shows how long the error takes.
+Usage: python benchmarks/bench_deep_recursion.py [max_depth]
+"""
+import sys
+import os
+import time
+
+current_file = os.path.realpath(__file__)
+current_dir_benchmarks = os.path.dirname(current_file)
+parent_dir_parent_directory = os.path.dirname(current_dir_benchmarks)
+sys.path.insert(0, parent_dir_parent_directory)
+
+from TechZen import vm_
+from TechZen.runner import Runner
+
+PROGRAM = "fun depth(n) -> if n == 0 then 0 else 1 + depth(n - 1)\ndepth({depth})"
+
+
+def main():
+    vm_.max_depth = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+
+    for depth in (100, 1000, vm_.max_depth // 2, vm_.max_depth + 1):
+        for backend in ("tree", "closure", "vm"):
+            text = PROGRAM.format(depth=depth)
+            start = time.process_time()
+            try:
+                _, error, _ = Runner.run("<bench>", text, backend)
+                outcome = error.details if error else "ok"
+                if error:
+                    error.as_string()
+            except RecursionError:
+                outcome = "RecursionError"
+            elapsed = time.process_time() - start
+            print(f"depth {depth:<7} {backend:<7}  {elapsed:.3f}s  {outcome}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Micro-benchmark for Interpreter.evaluate.
+Runs for loops like the ones in tests/file_tests/for_test.techzen, once with the old getattr based dispatch and once
+with the dispatch table, and prints how many nodes are visited per second.
+Usage: python benchmarks/bench_dispatch.py [iterations]
+"""
+import sys
+import os
+import time
+
+current_file = os.path.realpath(__file__)
+current_dir_benchmarks = os.path.dirname(current_file)
+parent_dir_parent_directory = os.path.dirname(current_dir_benchmarks)
+sys.path.insert(0, parent_dir_parent_directory)
+
+from TechZen.lexer_ import Lexer
+from TechZen.parser_ import Parser
+from TechZen.interpreter_ import Interpreter
+from TechZen.context_ import Context
+from TechZen.symbol_table_ import SymbolTable
+from TechZen.global_symbol_table_ import global_symbol_table
+
+PROGRAM = """
+var total = 0
+for i = 0 to {n} then
+    var total = total + i * 2
+end
+
+for i = 0 to {n} step 2 then
+    var total = total - i
+end
+"""
+
+
+def legacy_visit(cls, node, context):
+    """
+    The dispatch Interpreter.evaluate used before the dispatch table: an f-string and a getattr per node.
+    """
+    method_name = f"visit_{type(node).__name__}"
+    method = getattr(cls, method_name, cls.no_visit_method)
+    return method(node, context)
+
+
+def run(ast):
+    """
+    Runs the AST in a fresh context and returns the time it took.
+    """
+    context = Context("<program>")
+    context.symbol_table = SymbolTable(global_symbol_table)
+    start = time.perf_counter()
+    result = Interpreter.visit(ast, context)
+    elapsed = time.perf_counter() - start
+    if result.error:
+        raise Exception(result.error.as_string())
+    return elapsed
+
+
+def count_visits(ast):
+    """
+    Counts how many nodes are visited while running the AST.
+    """
+    table_visit = Interpreter.__dict__["evaluate"]
+    count = 0
+
+    def counting_visit(cls, node, context):
+        nonlocal count
+        count += 1
+        return table_visit.__func__(cls, node, context)
+
+    Interpreter.evaluate = classmethod(counting_visit)
+    try:
+        run(ast)
+    finally:
+        Interpreter.evaluate = table_visit
+    return count
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    tokens, error = Lexer("<bench>", PROGRAM.format(n=n)).make_tokens()
+    ast = Parser(tokens).parse().node
+
+    visits = count_visits(ast)
+    table_visit = Interpreter.__dict__["evaluate"]
+
+    Interpreter.evaluate = classmethod(legacy_visit)
+    try:
+        before = min(run(ast) for _ in range(3))
+    finally:
+        Interpreter.evaluate = table_visit
+    after = min(run(ast) for _ in range(3))
+
+    print(f"nodes visited: {visits}")
+    print(f"getattr dispatch: {visits / before:,.0f} visits/s")
+    print(f"dispatch table:   {visits / after:,.0f} visits/s")
+    print(f"speedup: {before / after:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Benchmark for folding constants.
+Runs a loop with constant arithmetic, string concatenations and if statements with constant conditions in its body,
+once with the Optimizer disabled and once with it enabled, and prints how long an iteration takes and how many nodes
+were folded.
+Usage: python benchmarks/bench_folding.py [iterations] [backend]
+"""
+import sys
+import os
+import time
+
+current_file = os.path.realpath(__file__)
+current_dir_benchmarks = os.path.dirname(current_file)
+parent_dir_parent_directory = os.path.dirname(current_dir_benchmarks)
+sys.path.insert(0, parent_dir_parent_directory)
+
+from TechZen import optimizer_
+from TechZen.runner import Runner
+
+PROGRAM = """var total = 0
+var names = []
+for i = 0 to {iterations} then
+    var total = total + 2 * 60 * 60 + (24 - 1) * 60
+    if 1 == 1 then var name = "user" + "_" + "name" elif i == 1 then var name = "" else var name = "x"
+    if 0 then append(names, name)
+end
+total
+"""
+
+
+def run(text, backend, enabled):
+    """
+    Runs the program and returns how long it took (the best of 3 runs) and the number of nodes that were folded.
+    """
+    optimizer_.enabled = enabled
+    elapsed = float("inf")
+    for _ in range(3):
+        folded = optimizer_.folded
+        start = time.process_time()
+        _, error, _ = Runner.run("<bench>", text, backend)
+        elapsed = min(elapsed, time.process_time() - start)
+        if error:
+            raise Exception(error.as_string())
+    return elapsed, optimizer_.folded - folded
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    backend = sys.argv[2] if len(sys.argv) > 2 else "tree"
+    text = PROGRAM.format(iterations=iterations)
+
+    for name, enabled in (("unfolded", False), ("folded", True)):
+        elapsed, folded = run(text, backend, enabled)
+        print(
+            f"{name:<8}  {iterations} iterations in {elapsed:.3f}s, "
+            f"{elapsed / iterations * 1e6:.2f} us/iteration, {folded} nodes folded"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Benchmark for including a file many times.
+Writes a file with functions and classes to a temporary directory, then runs a loop that includes it on every
+iteration and prints how long an include takes.
+Usage: python benchmarks/bench_include.py [includes]
+"""
+import sys
+import os
+import time
+import tempfile
+
+current_file = os.path.realpath(__file__)
+current_dir_benchmarks = os.path.dirname(current_file)
+parent_dir_parent_directory = os.path.dirname(current_dir_benchmarks)
+sys.path.insert(0, parent_dir_parent_directory)
+
+from TechZen.runner import Runner
+
+LIBRARY = """fun add_{i}(a, b) -> a + b * {i}
+class Point{i}
+    fun Point{i}(x, y)
+        var this.x = x
+        var this.y = y
+    endf
+endc
+"""
+
+
+def main():
+    includes = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000
+
+    with tempfile.TemporaryDirectory() as directory:
+        fn = os.path.join(directory, "library.techzen")
+        with open(fn, "w") as f:
+            f.write("".join(LIBRARY.format(i=i) for i in range(50)))
+
+        start = time.perf_counter()
+        _, error, _ = Runner.run(
+            "<bench>", f'for i = 0 to {includes} then include "{fn}"\nadd_3(1, 2)'
+        )
+        elapsed = time.perf_counter() - start
+        if error:
+            raise Exception(error.as_string())
+
+    print(
+        f"{includes} includes in {elapsed:.3f}s, "
+        f"{elapsed / includes * 1e6:.1f} us/include"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Benchmark for the lexer on a multi-megabyte source.
+Generates a program of functions, loops, strings and arithmetic, lexes it and prints how many megabytes and tokens are
+lexed per second.
+Usage: python benchmarks/bench_lexer.py [megabytes]
+"""
+import sys
+import os
+import time
+
+current_file = os.path.realpath(__file__)
+current_dir_benchmarks = os.path.dirname(current_file)
+parent_dir_parent_directory = os.path.dirname(current_dir_benchmarks)
+sys.path.insert(0, parent_dir_parent_directory)
+
+from TechZen.lexer_ import Lexer
+
+LINES = [
+    "fun add_{i}(a, b) -> a + b * {i}",
+    "var total_{i} = add_{i}(12.5, 3) // 2 - {i} % 7",
+    'var name_{i} = "item {i}\\t" + \'value\'',
+    "for i = 0 to {i} step 2 then print([i, i ^ 2, {{\"k\": i}}])",
+    "if total_{i} >= 10 AND name_{i} != \"\" then var x = 1; var y = 2",
+    "while x <= {i} then var x = x + 1",
+]
+
+
+def generate(megabytes):
+    """
+    Makes a program of (about) the given size.
+    """
+    lines = []
+    size = 0
+    i = 0
+    while size < megabytes * 1_000_000:
+        line = LINES[i % len(LINES)].format(i=i)
+        lines.append(line)
+        size += len(line) + 1
+        i += 1
+    return "\n".join(lines)
+
+
+def main():
+    megabytes = float(sys.argv[1]) if len(sys.argv) > 1 else 4
+    text = generate(megabytes)
+
+    elapsed = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        tokens, error = Lexer("<bench>", text).make_tokens()
+        elapsed = min(elapsed, time.perf_counter() - start)
+        if error:
+            raise Exception(error.as_string())
+
+    print(
+        f"{len(text) / 1e6:.1f} MB, {len(tokens)} tokens in {elapsed:.3f}s: "
+        f"{len(text) / 1e6 / elapsed:.2f} MB/s, {len(tokens) / elapsed:,.0f} tokens/s"
+    )
+
+
+if __name__ == "__main__":
+    main()
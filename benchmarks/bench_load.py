@@ -0,0 +1,75 @@
+"""
+Benchmark for loading and lexing a big file.
+Writes a generated program of (about) the given size to a temporary file, then lexes it from a string read from the
+file and from cache_.load_source (a memory map), and prints how long each one takes and the peak memory used to load
+it for the lexer (from tracemalloc, the pages of a memory map are not counted because they are not Python objects).
+Usage: python benchmarks/bench_load.py [megabytes]
+"""
+import sys
+import os
+import time
+import tempfile
+import tracemalloc
+
+current_file = os.path.realpath(__file__)
+current_dir_benchmarks = os.path.dirname(current_file)
+parent_dir_parent_directory = os.path.dirname(current_dir_benchmarks)
+sys.path.insert(0, parent_dir_parent_directory)
+
+from TechZen.cache_ import load_source
+from TechZen.lexer_ import Lexer
+from bench_lexer import generate
+
+
+def read_text(fn):
+    """
+    Loads the file like before it was memory mapped.
+    """
+    with open(fn, "r") as f:
+        return f.read()
+
+
+def load_peak(fn, load):
+    """
+    Loads the file for the lexer and returns the peak memory it used.
+    """
+    tracemalloc.start()
+    lexer = Lexer(fn, load(fn))
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def lex(fn, load):
+    """
+    Loads the file and counts its tokens, without keeping them.
+    """
+    lexer = Lexer(fn, load(fn))
+    count = sum(1 for _ in lexer.iter_tokens())
+    if lexer.error:
+        raise Exception(lexer.error.as_string())
+    return count
+
+
+def main():
+    megabytes = float(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+    with tempfile.TemporaryDirectory() as directory:
+        fn = os.path.join(directory, "big.techzen")
+        with open(fn, "w") as f:
+            f.write(generate(megabytes))
+        size = os.path.getsize(fn)
+
+        for name, load in (("read", read_text), ("mmap", load_source)):
+            start = time.perf_counter()
+            tokens = lex(fn, load)
+            elapsed = time.perf_counter() - start
+            peak = load_peak(fn, load)
+            print(
+                f"{name:<4}  {size / 1e6:.1f} MB, {tokens} tokens in {elapsed:.2f}s, "
+                f"peak {peak / 1e6:.2f} MB to load"
+            )
+
+
+if __name__ == "__main__":
+    main()
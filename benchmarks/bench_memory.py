@@ -0,0 +1,99 @@
+"""
+Memory benchmark for tokens, AST nodes and runtime values.
+Generates a program of numbers, strings, lists and functions, then lexes, parses and runs it with tracemalloc and
+prints how many bytes each token (with its positions), each node and each value the program returns keeps alive.
+Usage: python benchmarks/bench_memory.py [lines]
+"""
+import sys
+import os
+import tracemalloc
+
+current_file = os.path.realpath(__file__)
+current_dir_benchmarks = os.path.dirname(current_file)
+parent_dir_parent_directory = os.path.dirname(current_dir_benchmarks)
+sys.path.insert(0, parent_dir_parent_directory)
+
+from TechZen.lexer_ import Lexer
+from TechZen.parser_ import Parser
+from TechZen.interpreter_ import Interpreter
+from TechZen.resolver_ import Resolver
+from TechZen.types.list_ import List
+from TechZen.context_ import Context
+from TechZen.global_symbol_table_ import global_symbol_table
+
+LINES = [
+    "{i}.5 * 2",
+    '"item " + "{i}"',
+    "[{i}.25, {i}.75]",
+    "fun f{i}(a) -> a + {i}",
+]
+
+
+def generate(lines):
+    """
+    Makes a program with the given number of lines.
+    """
+    return "\n".join(LINES[i % len(LINES)].format(i=i) for i in range(lines))
+
+
+def count_nodes(node):
+    """
+    Counts the nodes of an AST, including members ('a.b').
+    """
+    count = 0
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        count += 1
+        stack.extend(Resolver.child_nodes(node))
+        if node.child:
+            stack.append(node.child)
+    return count
+
+
+def count_values(value):
+    """
+    Counts a value and the values inside of it.
+    """
+    if isinstance(value, List):
+        return 1 + sum(count_values(element) for element in value.elements)
+    return 1
+
+
+def measure(function):
+    """
+    Calls a function and returns what it returns with the bytes it kept alive.
+    """
+    start, _ = tracemalloc.get_traced_memory()
+    result = function()
+    end, _ = tracemalloc.get_traced_memory()
+    return result, end - start
+
+
+def main():
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    text = generate(lines)
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 10_000))
+
+    context = Context("<program>")
+    context.symbol_table = global_symbol_table
+
+    tracemalloc.start()
+    tokens, size = measure(lambda: Lexer("<bench>", text).make_tokens()[0])
+    print(f"tokens: {len(tokens):>9}  {size / len(tokens):7.1f} bytes each")
+
+    node, size = measure(lambda: Parser(tokens).parse().node)
+    nodes = count_nodes(node)
+    print(f"nodes:  {nodes:>9}  {size / nodes:7.1f} bytes each")
+
+    result, size = measure(lambda: Interpreter.visit(node, context))
+    if result.error:
+        raise Exception(result.error.as_string())
+    # The list of all results is not a value of the program
+    values = count_values(result.value) - 1
+    print(f"values: {values:>9}  {size / values:7.1f} bytes each")
+    tracemalloc.stop()
+
+
+if __name__ == "__main__":
+    main()
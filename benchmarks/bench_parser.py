@@ -0,0 +1,53 @@
+"""
+Benchmark for the parser on arithmetic-heavy code.
+Generates a program of assignments with long arithmetic, comparison and logic expressions, lexes it once and prints
+how long parsing takes and how many tokens are parsed per second.
+Usage: python benchmarks/bench_parser.py [lines]
+"""
+import sys
+import os
+import time
+
+current_file = os.path.realpath(__file__)
+current_dir_benchmarks = os.path.dirname(current_file)
+parent_dir_parent_directory = os.path.dirname(current_dir_benchmarks)
+sys.path.insert(0, parent_dir_parent_directory)
+
+from TechZen.lexer_ import Lexer
+from TechZen.parser_ import Parser
+
+LINES = [
+    "var a{i} = {i} + 2 * 3 - 4 / 5 + 6 % 7 - 8 // 9",
+    "var b{i} = (a{i} + {i}) * (a{i} - 1) ^ 2 - 3 * -a{i}",
+    "var c{i} = a{i} < {i} AND b{i} >= 2 OR NOT a{i} == b{i} + 1",
+    "f(a{i} * 2, b{i} + 3.5, [1, 2 + 3, 4 * 5])",
+]
+
+
+def generate(lines):
+    """
+    Makes a program with the given number of lines.
+    """
+    return "\n".join(LINES[i % len(LINES)].format(i=i) for i in range(lines))
+
+
+def main():
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    tokens, error = Lexer("<bench>", generate(lines)).make_tokens()
+
+    elapsed = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        result = Parser(tokens).parse()
+        elapsed = min(elapsed, time.perf_counter() - start)
+        if result.error:
+            raise Exception(result.error.as_string())
+
+    print(
+        f"{len(tokens)} tokens in {elapsed:.3f}s, "
+        f"{len(tokens) / elapsed:,.0f} tokens/s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Benchmark for how parsing time grows with the size of a file.
+Generates programs of 1k, 10k and 100k lines with functions, classes, loops and if blocks, prints how long parsing each
+one takes per line, and fails if the time per line of the largest file is more than MAX_RATIO times that of the
+smallest one (parsing should be linear in the number of tokens).
+Usage: python benchmarks/bench_parser_scaling.py [sizes...]
+"""
+import sys
+import os
+import time
+
+current_file = os.path.realpath(__file__)
+current_dir_benchmarks = os.path.dirname(current_file)
+parent_dir_parent_directory = os.path.dirname(current_dir_benchmarks)
+sys.path.insert(0, parent_dir_parent_directory)
+
+from TechZen.lexer_ import Lexer
+from TechZen.parser_ import Parser
+
+SIZES = [1_000, 10_000, 100_000]
+MAX_RATIO = 2.0
+
+# Every block is 10 lines long
+BLOCKS = [
+    """fun f{i}(a, b)
+    var c = a * b + {i}
+    if c > 10 then
+        return c - 1
+    elif c < 0 then
+        return 0
+    end
+    print(c)
+    return c
+endf""",
+    """class C{i}
+    var x = {i}
+    fun get(self)
+        return self.x
+    endf
+endc
+for i = 0 to {i} step 2 then
+    var total = total + i
+    if i == 3 then continue
+end""",
+    """var n = {i}
+while n > 0 then
+    var n = n - 1
+    if n % 2 == 0 then break
+end
+try
+    var d = {{"a": n, "b": [1, 2, n]}}
+except
+    print("error")
+end""",
+]
+
+
+def generate(lines):
+    """
+    Makes a program with (about) the given number of lines.
+    """
+    blocks = max(lines // 10, 1)
+    return "\n".join(BLOCKS[i % len(BLOCKS)].format(i=i) for i in range(blocks))
+
+
+def time_parse(lines):
+    """
+    Parses a generated program of the given size and returns the time it took, the best of 3.
+    """
+    tokens, error = Lexer("<bench>", generate(lines)).make_tokens()
+    elapsed = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        result = Parser(tokens).parse()
+        elapsed = min(elapsed, time.perf_counter() - start)
+        if result.error:
+            raise Exception(result.error.as_string())
+    return elapsed
+
+
+def main():
+    sizes = [int(size) for size in sys.argv[1:]] or SIZES
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 10_000))
+
+    per_line = []
+    for lines in sizes:
+        elapsed = time_parse(lines)
+        per_line.append(elapsed / lines)
+        print(f"{lines:>7} lines  {elapsed:.3f}s  {elapsed / lines * 1e6:.1f} us/line")
+
+    ratio = per_line[-1] / per_line[0]
+    print(f"time per line grows {ratio:.2f}x from {sizes[0]} to {sizes[-1]} lines")
+    assert ratio <= MAX_RATIO, f"parsing is not linear ({ratio:.2f}x > {MAX_RATIO}x)"
+
+
+if __name__ == "__main__":
+    main()
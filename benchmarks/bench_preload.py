@@ -0,0 +1,61 @@
+"""
+Benchmark for the cold start of a program that includes many files.
+Writes a program that includes generated files to a temporary directory, then runs it without .tzc caches, once with
+the included files parsed by include and once with them preloaded in a pool of worker processes, and prints how long
+each run takes.
+Usage: python benchmarks/bench_preload.py [files] [lines] [workers]
+"""
+import sys
+import os
+import time
+import tempfile
+
+current_file = os.path.realpath(__file__)
+current_dir_benchmarks = os.path.dirname(current_file)
+parent_dir_parent_directory = os.path.dirname(current_dir_benchmarks)
+sys.path.insert(0, parent_dir_parent_directory)
+
+from TechZen import cache_
+from TechZen.runner import Runner
+from TechZen.types.module_ import Module
+from bench_parser_scaling import generate
+
+
+def run(text, workers):
+    """
+    Runs the program with nothing loaded and returns how long it took.
+    """
+    Module.modules.clear()
+    cache_.preloaded.clear()
+    cache_.preload_workers = workers
+
+    start = time.perf_counter()
+    _, error, _ = Runner.run("<bench>", text)
+    elapsed = time.perf_counter() - start
+    if error:
+        raise Exception(error.as_string())
+    return elapsed
+
+
+def main():
+    files = int(sys.argv[1]) if len(sys.argv) > 1 else 24
+    lines = int(sys.argv[2]) if len(sys.argv) > 2 else 2_000
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else os.cpu_count() or 1
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 10_000))
+    cache_.enabled = False
+
+    with tempfile.TemporaryDirectory() as directory:
+        includes = []
+        for i in range(files):
+            fn = os.path.join(directory, f"module_{i}.techzen")
+            with open(fn, "w") as f:
+                f.write(generate(lines))
+            includes.append(f'include "{fn}"')
+        text = "\n".join(includes)
+
+        for name, count in (("include", 0), (f"{workers} workers", workers)):
+            print(f"{name:<10}  {files} files of {lines} lines in {run(text, count):.2f}s")
+
+
+if __name__ == "__main__":
+    main()
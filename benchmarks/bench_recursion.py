@@ -0,0 +1,100 @@
+"""
+Benchmark for recursive function calls in the tree interpreter.
+Runs recursive functions and prints the time for each, with the number of nodes that were visited and the time per
+node, which is the overhead of running a node and passing its value (or return, break, ...) back.
+Usage: python benchmarks/bench_recursion.py [n]
+"""
+import sys
+import os
+import time
+
+current_file = os.path.realpath(__file__)
+current_dir_benchmarks = os.path.dirname(current_file)
+parent_dir_parent_directory = os.path.dirname(current_dir_benchmarks)
+sys.path.insert(0, parent_dir_parent_directory)
+
+from TechZen.lexer_ import Lexer
+from TechZen.parser_ import Parser
+from TechZen.interpreter_ import Interpreter
+from TechZen.resolver_ import Resolver
+from TechZen.context_ import Context
+from TechZen.global_symbol_table_ import global_symbol_table
+
+PROGRAMS = {
+    "fib": "fun fib(n) -> if n < 2 then n else fib(n - 1) + fib(n - 2)\nfib({n})",
+    "sum": """
+fun sum_to(n)
+    if n == 0 then return 0
+    return n + sum_to(n - 1)
+endf
+var total = 0
+for i = 0 to {n} then
+    var total = total + sum_to(200)
+end
+""",
+}
+
+
+def parse(program, n):
+    """
+    Parses and resolves a benchmark program.
+    """
+    tokens, error = Lexer("<bench>", program.format(n=n)).make_tokens()
+    return Resolver.resolve(Parser(tokens).parse().node)
+
+
+def run(ast):
+    """
+    Runs the AST and returns the time it took.
+    """
+    context = Context("<program>")
+    context.symbol_table = global_symbol_table
+    start = time.perf_counter()
+    result = Interpreter.visit(ast, context)
+    elapsed = time.perf_counter() - start
+    if result.error:
+        raise Exception(result.error.as_string())
+    return elapsed
+
+
+def count_visits(ast):
+    """
+    Counts how many nodes are visited while running the AST.
+    """
+    table = Interpreter.dispatch_table
+    count = 0
+
+    def counting(method):
+        def visit(node, context):
+            nonlocal count
+            count += 1
+            return method(node, context)
+
+        return visit
+
+    Interpreter.dispatch_table = {
+        node_class: counting(method) for node_class, method in table.items()
+    }
+    try:
+        run(ast)
+    finally:
+        Interpreter.dispatch_table = table
+    return count
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 10_000))
+
+    for name, program in PROGRAMS.items():
+        ast = parse(program, n)
+        visits = count_visits(ast)
+        elapsed = min(run(ast) for _ in range(3))
+        print(
+            f"{name:<4} {elapsed:.3f}s  nodes visited: {visits}  "
+            f"{elapsed / visits * 1e9:.0f} ns/node"
+        )
+
+
+if __name__ == "__main__":
+    main()
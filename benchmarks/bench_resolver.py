@@ -0,0 +1,83 @@
+"""
+Micro-benchmark for the Resolver.
+Runs recursive functions that read their arguments, locals and global functions, once with the plain parsed AST
+(every variable is looked up by name through the chain of symbol tables) and once with the resolved AST (local slots
+and direct global reads), and prints the time for each backend.
+Usage: python benchmarks/bench_resolver.py [n]
+"""
+import sys
+import os
+import time
+
+current_file = os.path.realpath(__file__)
+current_dir_benchmarks = os.path.dirname(current_file)
+parent_dir_parent_directory = os.path.dirname(current_dir_benchmarks)
+sys.path.insert(0, parent_dir_parent_directory)
+
+from TechZen.lexer_ import Lexer
+from TechZen.parser_ import Parser
+from TechZen.interpreter_ import Interpreter
+from TechZen.compiler_ import Compiler
+from TechZen.bytecode_ import BytecodeCompiler
+from TechZen.vm_ import VM
+from TechZen.resolver_ import Resolver
+from TechZen.context_ import Context
+from TechZen.global_symbol_table_ import global_symbol_table
+
+PROGRAM = """
+fun inc(x) -> x + 1
+fun count(n)
+    var total = 0
+    for i = 0 to 20 then
+        var total = inc(total)
+    end
+    if n == 0 then return total
+    return total + count(n - 1)
+endf
+count({n})
+"""
+
+BACKENDS = {
+    "tree": lambda ast, context: Interpreter.visit(ast, context),
+    "closure": lambda ast, context: Compiler.compile(ast)(context),
+    "vm": lambda ast, context: VM.run(BytecodeCompiler.compile_program(ast), context),
+}
+
+
+def parse(n):
+    """
+    Parses the benchmark program.
+    """
+    tokens, error = Lexer("<bench>", PROGRAM.format(n=n)).make_tokens()
+    return Parser(tokens).parse().node
+
+
+def run(ast, backend):
+    """
+    Runs the AST with a backend and returns the time it took.
+    """
+    context = Context("<program>")
+    context.symbol_table = global_symbol_table
+    start = time.perf_counter()
+    result = BACKENDS[backend](ast, context)
+    elapsed = time.perf_counter() - start
+    if result.error:
+        raise Exception(result.error.as_string())
+    return elapsed
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), n * 40))
+
+    for backend in BACKENDS:
+        before = min(run(parse(n), backend) for _ in range(3))
+        after = min(run(Resolver.resolve(parse(n)), backend) for _ in range(3))
+        print(
+            f"{backend:<8} by name: {before:.3f}s  resolved: {after:.3f}s  "
+            f"speedup: {before / after:.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Benchmark for the memory used to parse big generated files.
+Generates programs of 10k and 100k lines and prints the peak memory (from tracemalloc, without the code itself) used
+to lex and parse them: into a list of tokens and a node of the whole program, and one statement at a time with
+Lexer.iter_tokens and Parser.iter_parse. Fails if streaming uses more than MAX_RATIO times more memory for the
+largest file than for the smallest one (it should only depend on how deep the code is nested).
+Usage: python benchmarks/bench_streaming.py [sizes...]
+"""
+import sys
+import os
+import time
+import tracemalloc
+
+current_file = os.path.realpath(__file__)
+current_dir_benchmarks = os.path.dirname(current_file)
+parent_dir_parent_directory = os.path.dirname(current_dir_benchmarks)
+sys.path.insert(0, parent_dir_parent_directory)
+
+from TechZen.lexer_ import Lexer
+from TechZen.parser_ import Parser
+
+SIZES = [10_000, 100_000]
+MAX_RATIO = 1.5
+
+# Every block is 5 lines long
+BLOCKS = [
+    """fun f{i}(a, b)
+    var c = a * b + {i}
+    if c > 10 then return c - 1
+    return [c, "text {i}", {{"k": c}}]
+endf""",
+    """for i = 0 to {i} step 2 then
+    while i > 0 then
+        var i = i - 1
+    end
+end""",
+]
+
+
+def generate(lines):
+    """
+    Makes a program with (about) the given number of lines.
+    """
+    blocks = max(lines // 5, 1)
+    return "\n".join(BLOCKS[i % len(BLOCKS)].format(i=i) for i in range(blocks))
+
+
+def parse_whole(text):
+    """
+    Makes all the tokens, then the node of the whole program.
+    """
+    tokens, error = Lexer("<bench>", text).make_tokens()
+    result = Parser(tokens).parse()
+    if error or result.error:
+        raise Exception((error or result.error).as_string())
+    return len(result.node.element_nodes)
+
+
+def parse_streaming(text):
+    """
+    Parses the program one statement at a time, each statement is dropped after it's parsed.
+    """
+    count = 0
+    for result in Parser(Lexer("<bench>", text).iter_tokens()).iter_parse():
+        if result.error:
+            raise Exception(result.error.as_string())
+        count += 1
+    return count
+
+
+def measure(function, text):
+    """
+    Runs the function and returns the peak memory it used and the time it took.
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    statements = function(text)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return statements, peak, elapsed
+
+
+def main():
+    sizes = [int(size) for size in sys.argv[1:]] or SIZES
+
+    peaks = []
+    for lines in sizes:
+        text = generate(lines)
+        for name, function in (("whole", parse_whole), ("streaming", parse_streaming)):
+            statements, peak, elapsed = measure(function, text)
+            print(
+                f"{lines:>7} lines  {name:<9}  {statements} statements  "
+                f"peak {peak / 1e6:7.2f} MB  {elapsed:.2f}s"
+            )
+        peaks.append(peak)
+
+    ratio = peaks[-1] / peaks[0]
+    print(f"streaming peak grows {ratio:.2f}x from {sizes[0]} to {sizes[-1]} lines")
+    assert ratio <= MAX_RATIO, f"streaming memory grows ({ratio:.2f}x > {MAX_RATIO}x)"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmark for tail calls, functions that call themselves as the last thing they do.
+Runs a tail recursive function many times and prints how long a call takes with each backend, and whether the
+function can go deeper than the Python recursion limit.
+Usage: python benchmarks/bench_tail_calls.py [depth]
+"""
+import sys
+import os
+import time
+
+current_file = os.path.realpath(__file__)
+current_dir_benchmarks = os.path.dirname(current_file)
+parent_dir_parent_directory = os.path.dirname(current_dir_benchmarks)
+sys.path.insert(0, parent_dir_parent_directory)
+
+from TechZen.runner import Runner
+
+PROGRAM = """fun count(n, acc) -> if n == 0 then acc else count(n - 1, acc + 1)
+fun down(n)
+    if n == 0 then return 0
+    return down(n - 1)
+endf
+var total = 0
+for i = 0 to {repeat} then
+    var total = total + count({depth}, 0) + down({depth})
+end
+total
+"""
+
+
+def main():
+    depth = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    repeat = 1000
+    text = PROGRAM.format(depth=depth, repeat=repeat)
+    deep_text = PROGRAM.format(depth=sys.getrecursionlimit() * 10, repeat=1)
+
+    for backend in ("tree", "closure", "vm"):
+        elapsed = float("inf")
+        for _ in range(3):
+            start = time.process_time()
+            _, error, _ = Runner.run("<bench>", text, backend)
+            elapsed = min(elapsed, time.process_time() - start)
+            if error:
+                raise Exception(error.as_string())
+        try:
+            _, error, _ = Runner.run("<bench>", deep_text, backend)
+            deep = "fails" if error else "runs"
+        except RecursionError:
+            deep = "RecursionError"
+        calls = 2 * (depth + 1) * repeat
+        print(
+            f"{backend:<7}  {calls} calls in {elapsed:.3f}s, "
+            f"{elapsed / calls * 1e6:.2f} us/call, 10x recursion limit: {deep}"
+        )
+
+
+if __name__ == "__main__":
+    main()
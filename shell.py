@@ -1,18 +1,22 @@
 from TechZen.runner import Runner
+from TechZen import cache_
 
-while True:
-    text = input("TechZen > ")
-    if text.strip() == "":
-        continue
-    result, error, should_exit = Runner.run("<stdin>", text)
+# Worker processes that parse included files can import this file, so the shell only starts when it's run
+if __name__ == "__main__":
+    cache_.preload_workers = cache_.pool_workers()
+    while True:
+        text = input("TechZen > ")
+        if text.strip() == "":
+            continue
+        result, error, should_exit = Runner.run("<stdin>", text)
 
-    if error:
-        print(error.as_string())
-    elif result:
-        if len(result.elements) == 1:
-            print(repr(result.elements[0]))
-        else:
-            print(repr(result))
+        if error:
+            print(error.as_string())
+        elif result:
+            if len(result.elements) == 1:
+                print(repr(result.elements[0]))
+            else:
+                print(repr(result))
 
-    if should_exit:
-        break
+        if should_exit:
+            break
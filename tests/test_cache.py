@@ -0,0 +1,263 @@
+import unittest
+from unittest import mock
+
+import sys
+import os
+import io
+import contextlib
+import tempfile
+import mmap
+import shutil
+import types
+
+current_file = os.path.realpath(__file__)
+current_dir_tests = os.path.dirname(current_file)
+parent_dir_parent_directory = os.path.dirname(current_dir_tests)
+sys.path.insert(0, parent_dir_parent_directory)
+
+import TechZen
+from TechZen import cache_, optimizer_
+from TechZen.lexer_ import Lexer
+from TechZen.runner import Runner
+from TechZen.types.module_ import Module
+from tests.test_compiler import FILE_TESTS
+
+
+class TestCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.fn = os.path.join(self.directory.name, "script.techzen")
+        self.write("var a = 1 + 2\nprint(a)")
+        # The nodes are compared as they were parsed
+        optimizer_.enabled = False
+
+    def tearDown(self):
+        self.directory.cleanup()
+        optimizer_.enabled = True
+
+    def write(self, text):
+        with open(self.fn, "w") as f:
+            f.write(text)
+        return text
+
+    def test_second_load_skips_lexer(self):
+        text = "var a = 1 + 2\nprint(a)"
+        node, error = cache_.load_ast(self.fn, text)
+        self.assertIsNone(error)
+        self.assertTrue(os.path.isfile(cache_.cache_path(self.fn)))
+
+        with mock.patch.object(Lexer, "iter_tokens", side_effect=AssertionError):
+            cached_node, error = cache_.load_ast(self.fn, text)
+        self.assertIsNone(error)
+        self.assertEqual(
+            str(cached_node.element_nodes[0].value_node),
+            str(node.element_nodes[0].value_node),
+        )
+
+    def test_changed_source_is_parsed_again(self):
+        cache_.load_ast(self.fn, "var a = 1 + 2")
+        node, error = cache_.load_ast(self.fn, "var a = 1 * 2")
+        self.assertIsNone(error)
+        self.assertEqual(str(node.element_nodes[0].value_node), "(INT:1, MUL, INT:2)")
+
+    def test_changed_version_is_parsed_again(self):
+        cache_.load_ast(self.fn, "var a = 1 + 2")
+        with mock.patch.object(TechZen, "__version__", "0.0.0"):
+            self.assertIsNone(cache_.read(self.fn, "var a = 1 + 2"))
+
+    def test_changed_nodes_are_parsed_again(self):
+        cache_.load_ast(self.fn, "var a = 1 + 2")
+        package = os.path.dirname(cache_.__file__)
+        directory = os.path.join(self.directory.name, "TechZen")
+        for name in cache_.NODE_MODULES:
+            os.makedirs(os.path.dirname(os.path.join(directory, name)), exist_ok=True)
+            shutil.copy(os.path.join(package, name), os.path.join(directory, name))
+        self.assertEqual(cache_.node_code_hash(directory), cache_.NODE_CODE_HASH)
+
+        # Other slots of a node change the key, without a new MAGIC
+        with open(os.path.join(directory, "nodes_.py"), "r+") as f:
+            code = f.read().replace('("token", ', '("token", "extra", ', 1)
+            f.seek(0)
+            f.write(code)
+        changed_hash = cache_.node_code_hash(directory)
+        self.assertNotEqual(changed_hash, cache_.NODE_CODE_HASH)
+        with mock.patch.object(cache_, "NODE_CODE_HASH", changed_hash):
+            self.assertIsNone(cache_.read(self.fn, "var a = 1 + 2"))
+
+    def test_node_modules_cover_cached_objects(self):
+        # Everything a cache file stores must be defined in NODE_MODULES, so changing it changes the key
+        package = os.path.dirname(cache_.__file__)
+        modules = set()
+        for file_name in os.listdir(FILE_TESTS):
+            if not file_name.endswith(".techzen"):
+                continue
+            with open(os.path.join(FILE_TESTS, file_name), "r") as f:
+                node, error = cache_.parse(file_name, f.read())
+            self.assertIsNone(error)
+
+            seen = set()
+            objects = [node]
+            while objects:
+                obj = objects.pop()
+                if id(obj) in seen:
+                    continue
+                seen.add(id(obj))
+                if isinstance(obj, (list, tuple)):
+                    objects.extend(obj)
+                elif isinstance(obj, types.FunctionType):
+                    modules.add(sys.modules[obj.__module__].__file__)
+                elif type(obj).__module__.startswith("TechZen"):
+                    for cls in type(obj).__mro__:
+                        if not cls.__module__.startswith("TechZen"):
+                            continue
+                        modules.add(sys.modules[cls.__module__].__file__)
+                        for slot in getattr(cls, "__slots__", ()):
+                            objects.append(getattr(obj, slot, None))
+        self.assertEqual(
+            {os.path.relpath(module, package) for module in modules}
+            - set(cache_.NODE_MODULES),
+            set(),
+        )
+
+    def test_errors_are_not_cached(self):
+        node, error = cache_.load_ast(self.fn, "var = 1")
+        self.assertIsNone(node)
+        self.assertIsNotNone(error)
+        self.assertFalse(os.path.exists(cache_.cache_path(self.fn)))
+
+    def test_code_without_file_is_not_cached(self):
+        node, error = cache_.load_ast("<stdin>", "1 + 2")
+        self.assertIsNone(error)
+        self.assertFalse(os.path.exists(cache_.cache_path("<stdin>")))
+
+    def test_include_runs_only_definitions(self):
+        self.write(
+            "print('not included')\nfun triple(x) -> x * 3\n"
+            "class Box\n    fun Box(x)\n        var this.x = x\n    endf\nendc"
+        )
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            value, error, _ = Runner.run(
+                "<stdin>",
+                f'include "{self.fn}"\nvar b = Box(triple(2))\nb.x',
+            )
+        self.assertIsNone(error)
+        self.assertEqual(output.getvalue(), "")
+        self.assertEqual(repr(value.elements[-1]), "6")
+
+    def test_load_source(self):
+        text = self.write("var s = 'héllo'\nprint(s)")
+        source = cache_.load_source(self.fn)
+        self.assertIsInstance(source, mmap.mmap)
+        self.assertEqual(source[:], text.encode())
+
+        # The cache of mapped code stores bytes, a memory map can't be pickled
+        node, error = cache_.load_ast(self.fn, source)
+        self.assertIsNone(error)
+        cached_node = cache_.read(self.fn, source)
+        self.assertEqual(cached_node.element_nodes[0].value_node.token.value, "héllo")
+        self.assertEqual(cached_node.pos_start.source.buffer, text.encode())
+
+        # Newlines are changed like when the file is opened in text mode
+        with open(self.fn, "wb") as f:
+            f.write(b"print(1)\r\nprint(2)\r")
+        self.assertEqual(cache_.load_source(self.fn), b"print(1)\nprint(2)\n")
+
+    def test_include_loads_module_once(self):
+        self.write("fun triple(x) -> x * 3")
+        with mock.patch.object(cache_, "load_ast", wraps=cache_.load_ast) as load_ast:
+            value, error, _ = Runner.run(
+                "<stdin>",
+                f'for i = 0 to 3 then include "{self.fn}"\n'
+                f'fun triple(x) -> 0\ninclude "{self.fn}"\ntriple(2)',
+            )
+        self.assertIsNone(error)
+        # Loaded once for the included file, and once for the code that includes it
+        self.assertEqual(load_ast.call_count, 2)
+        # Including the file again sets its functions again
+        self.assertEqual(repr(value.elements[-1]), "6")
+        self.assertEqual(repr(Module.modules[self.fn]), f"<module {self.fn}>")
+
+    def test_included_file_changes(self):
+        cache_.enabled = False
+        self.addCleanup(setattr, cache_, "enabled", True)
+        self.write("# " + "x" * 5000 + "\nfun fails() -> 1 / 0")
+        _, error, _ = Runner.run("<stdin>", f'include "{self.fn}"')
+        self.assertIsNone(error)
+
+        # The memory map of the file is closed, the nodes keep a copy of the code they were made from
+        source = Module.modules[self.fn].symbol_table.get("fails").body_node.pos_start.source
+        self.assertIsInstance(source.buffer, bytes)
+        self.write("fun fails() -> 0")
+        _, error, _ = Runner.run("<stdin>", "fails()")
+        self.assertIn("Division by zero", error.as_string())
+        self.assertIn("line 2", error.as_string())
+        self.assertIn("fun fails() -> 1 / 0", error.as_string())
+
+    def test_preload_includes(self):
+        directory = self.directory.name
+        paths = {name: os.path.join(directory, name) for name in ("a", "b", "c")}
+        with open(paths["a"], "w") as f:
+            f.write(f'fun f()\n    include "{paths["b"]}"\n    return g()\nendf')
+        with open(paths["b"], "w") as f:
+            f.write("fun g() -> 2")
+        with open(paths["c"], "w") as f:
+            f.write("var = 1")
+        text = f'include "{paths["a"]}"\nf()\ninclude "{paths["c"]}"'
+
+        # The files are parsed in worker processes, the one with an error is left for include
+        with mock.patch.multiple(cache_, preload_workers=2, PRELOAD_POOL_FILES=1):
+            cache_.preload(cache_.load_ast("<stdin>", text)[0])
+        self.assertEqual(sorted(cache_.preloaded), [paths["a"], paths["b"]])
+        self.assertTrue(os.path.isfile(cache_.cache_path(paths["b"])))
+
+        with mock.patch.object(cache_, "parse", wraps=cache_.parse) as parse:
+            value, error, _ = Runner.run("<stdin>", f'include "{paths["a"]}"\nf()')
+        self.assertEqual([call.args[0] for call in parse.call_args_list], ["<stdin>"])
+        self.assertIsNone(error)
+        self.assertEqual(repr(value.elements[-1]), "2")
+        self.assertEqual(cache_.preloaded, {})
+
+        value, error, _ = Runner.run("<stdin>", text)
+        self.assertEqual(error.error_name, "Invalid Syntax")
+
+    def test_preload_pool(self):
+        paths = [os.path.join(self.directory.name, name) for name in ("a", "b")]
+        for path in paths:
+            with open(path, "w") as f:
+                f.write("fun f() -> 1")
+        text = "".join(f'if 0 then include "{p}"\n' for p in paths)
+        node = cache_.load_ast("<stdin>", text)[0]
+
+        # Files are only preloaded when a process pool is asked for and there are enough of them
+        self.assertEqual(cache_.preload_workers, 0)
+        self.assertLessEqual(cache_.pool_workers(), cache_.MAX_PRELOAD_WORKERS)
+        with mock.patch("concurrent.futures.ProcessPoolExecutor") as executor:
+            self.assertEqual(cache_.preload(node), [])
+            with mock.patch.object(cache_, "preload_workers", 2):
+                self.assertEqual(cache_.preload(node), [])
+        executor.assert_not_called()
+        self.assertEqual(cache_.preloaded, {})
+
+        # The files in branches that did not run are not kept after the run
+        with mock.patch.multiple(cache_, preload_workers=2, PRELOAD_POOL_FILES=2):
+            _, error, _ = Runner.run("<stdin>", text)
+        self.assertIsNone(error)
+        # Preloaded, so the worker processes wrote their caches
+        self.assertTrue(all(os.path.isfile(cache_.cache_path(p)) for p in paths))
+        self.assertEqual(cache_.preloaded, {})
+        self.assertFalse(set(paths) & set(Module.modules))
+
+    def test_preload_errors(self):
+        path = os.path.join(self.directory.name, "a")
+        with open(path, "w") as f:
+            f.write("fun f() -> 1")
+        node = cache_.load_ast("<stdin>", f'include "{path}"')[0]
+
+        # Files that can not be read are left for include, bugs are not hidden
+        with mock.patch.multiple(cache_, preload_workers=2, PRELOAD_POOL_FILES=1):
+            with mock.patch.object(cache_, "load_source", side_effect=OSError):
+                self.assertEqual(cache_.preload(node), [])
+            self.assertEqual(cache_.preloaded, {})
+            with mock.patch.object(cache_, "unpickle", side_effect=ValueError):
+                self.assertRaises(ValueError, cache_.preload, node)
@@ -0,0 +1,134 @@
+import unittest
+
+import sys
+import os
+import io
+import contextlib
+import tempfile
+
+current_file = os.path.realpath(__file__)
+current_dir_tests = os.path.dirname(current_file)
+parent_dir_parent_directory = os.path.dirname(current_dir_tests)
+sys.path.insert(0, parent_dir_parent_directory)
+
+from TechZen.runner import Runner
+from TechZen.global_symbol_table_ import global_symbol_table
+from TechZen.types.module_ import Module
+
+FILE_TESTS = os.path.join(current_dir_tests, "file_tests")
+
+PROGRAMS = [
+    "27 + (43 / 36 - 48) * 51",
+    "7 // 2",
+    "1 == 1 AND 2 < 1",
+    "0 OR 1",
+    "NOT 0",
+    "- (4 * 2) // 3",
+    "[1, 2, 3] + 4",
+    "{'a': 51.2}",
+    "var d = {'a': 1, 2: 'b', 1.0: 3}\nset_key(d, 'c', d / 'a')\n"
+    "[d / 1, has_key(d, 'c')]",
+    "var d = {'a': 1, 'b': 2}\n[keys(d), values(d), d - 'a']",
+    "{'a': 1} / 'b'",
+    "var a = for i = 0 to 10 step 3 then i * i",
+    "var a = for i = 10 to 0 step 0 - 3 then i",
+    "var a = for i = 0.5 to 3 then i",
+    "for i = 0 to 2000 then\n    if i < 1998 then continue\n    print(i)\nend",
+    "var i = 0\nvar b = while i < 5 then var i = i + 1",
+    "fun fib(n) -> if n < 2 then n else fib(n - 1) + fib(n - 2)\nfib(15)",
+    "fun f(a, b)\n    var total = 0\n    for i = a to b then\n        if i == 3 then continue\n"
+    "        if i == 7 then break\n        var total = total + i\n    end\n    return total\nendf\nf(0, 10)",
+    "class A\n    fun A(x)\n        var this.x = x\n    endf\n    fun get() -> this.x\nendc\nvar a = A(5)\na.get()",
+    "try\nvar a = undefined_name\nexcept\nvar a = 3\nend\na",
+    "print(1 / 0)",
+    "undefined_name + 1",
+]
+
+
+def run(fn, text, backend):
+    """
+    Runs the code with the given backend and returns everything that was printed and the result.
+    """
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        value, error, should_exit = Runner.run(fn, text, backend)
+    return (
+        output.getvalue(),
+        repr(value),
+        error.as_string() if error else None,
+        should_exit,
+    )
+
+
+class TestCompiler(unittest.TestCase):
+    def test_programs(self):
+        for program in PROGRAMS:
+            with self.subTest(program=program):
+                self.assertEqual(
+                    run("<stdin>", program, "closure"), run("<stdin>", program, "tree")
+                )
+
+    def test_file_tests(self):
+        for file_name in sorted(os.listdir(FILE_TESTS)):
+            if not file_name.endswith(".techzen"):
+                continue
+            with self.subTest(file_name=file_name):
+                with open(os.path.join(FILE_TESTS, file_name), "r") as f:
+                    script = f.read()
+                self.assertEqual(
+                    run(file_name, script, "closure"), run(file_name, script, "tree")
+                )
+
+    def test_function_reuses_closure(self):
+        from TechZen.types.function_ import Function
+
+        value, error, _ = Runner.run("<stdin>", "fun add(a, b) -> a + b", "closure")
+        self.assertIsNone(error)
+        function = value.elements[0]
+        self.assertIsInstance(function, Function)
+        self.assertIsNotNone(function.body_closure)
+
+    def test_included_function_reuses_closure(self):
+        with tempfile.TemporaryDirectory() as directory:
+            fn = os.path.join(directory, "add.techzen")
+            with open(fn, "w") as f:
+                f.write("fun add(a, b) -> a + b")
+            for backend in ("tree", "closure"):
+                with self.subTest(backend=backend):
+                    value, error, _ = Runner.run(
+                        "<stdin>", f'include "{fn}"\nadd(1, 2)', backend
+                    )
+                    self.assertIsNone(error)
+                    self.assertEqual(repr(value.elements[-1]), "3")
+                    function = Module.modules[fn].symbol_table.get("add")
+                    self.assertEqual(
+                        function.body_closure is not None, backend == "closure"
+                    )
+
+    def test_recursion_error(self):
+        depth = sys.getrecursionlimit() * 2
+        text = f"fun f(n) -> if n == 0 then 0 else 1 + f(n - 1)\nf({depth})"
+        for backend in ("tree", "closure"):
+            with self.subTest(backend=backend):
+                _, value, error, _ = run("<stdin>", text, backend)
+                self.assertEqual(value, "None")
+                self.assertIn("Maximum recursion depth exceeded", error)
+                self.assertIn("[Previous line repeated", error)
+
+    def test_calls_do_not_move_callee(self):
+        text = (
+            "class Node\n    fun Node(n)\n"
+            "        if n > 0 then var this.child = Node(n - 1)\n    endf\nendc\n"
+            "fun f() -> 1\nvar node = Node(2)\nf()\nnode"
+        )
+        for backend in ("tree", "closure", "vm"):
+            with self.subTest(backend=backend):
+                value, error, _ = Runner.run("<stdin>", text, backend)
+                self.assertIsNone(error)
+                # The instance is at the outer call, the nested calls did not move the shared class
+                self.assertEqual(value.elements[-1].pos_start.ln, 6)
+                self.assertEqual(global_symbol_table.get("Node").pos_start.ln, 0)
+                self.assertEqual(global_symbol_table.get("f").pos_start.ln, 5)
+
+    def test_unknown_backend(self):
+        self.assertRaises(ValueError, Runner.run, "<stdin>", "1", "unknown")
@@ -11,6 +11,7 @@ sys.path.insert(0, parent_dir_parent_directory)
 from TechZen.lexer_ import Lexer
 from TechZen.parser_ import Parser
 from TechZen.interpreter_ import Interpreter
+from TechZen.runtime_ import ErrorSignal
 
 from TechZen.global_symbol_table_ import global_symbol_table
 from TechZen.context_ import Context
@@ -64,6 +65,33 @@ class TestInterpreter(unittest.TestCase):
         )
         self.assertEqual(str(value), "{a: 51.2}")
 
+    def test_dict_keys(self):
+        text = "var d = {'a': 1, 2: 'b'}\nset_key(d, 'c', 3)\n[d / 'a', d / 2, d / 'c']"
+        value = (
+            Interpreter()
+            .visit(
+                Parser(Lexer("<stdin>", text).make_tokens()[0]).parse().node, context
+            )
+            .value
+        )
+        self.assertEqual(repr(value.elements[-1]), "[1, b, 3]")
+        self.assertEqual(repr(global_symbol_table.get("d")), "{a: 1, 2: b, c: 3}")
+
+    def test_dict_keys_by_value(self):
+        text = (
+            "var d = {1: 'a', 1.0: 'b', TRUE: 'c', '1': 'd'}\n"
+            "[len(keys(d)), d / 1, d / 1.0, d / TRUE, d / '1', has_key(d, 2 - 1)]"
+        )
+        value = (
+            Interpreter()
+            .visit(
+                Parser(Lexer("<stdin>", text).make_tokens()[0]).parse().node, context
+            )
+            .value
+        )
+        # Equal numbers are one key, the last value is kept. The string is another key
+        self.assertEqual(repr(value.elements[-1]), "[2, c, c, c, d, 1]")
+
     def test_single_operations(self):
         result = (
             Interpreter()
@@ -240,3 +268,156 @@ class TestInterpreter(unittest.TestCase):
         )
 
         self.assertEqual(str(result), "0")
+
+    def test_dispatch_table(self):
+        from TechZen import nodes_
+
+        node_classes = [
+            node_class
+            for name, node_class in vars(nodes_).items()
+            if isinstance(node_class, type) and name.endswith("Node")
+        ]
+        for node_class in node_classes:
+            self.assertIn(node_class, Interpreter.dispatch_table)
+
+    def test_read_does_not_copy(self):
+        result = (
+            Interpreter()
+            .visit(
+                Parser(
+                    Lexer("<stdin>", "var s = 'text'\ns\ns\nprint").make_tokens()[0]
+                )
+                .parse()
+                .node,
+                context,
+            )
+            .value
+        )
+        self.assertIs(result.elements[1], result.elements[0])
+        self.assertIs(result.elements[2], result.elements[0])
+        self.assertIs(result.elements[3], global_symbol_table.get("print"))
+
+    def test_error_position(self):
+        result = Interpreter().visit(
+            Parser(Lexer("<stdin>", "var s = 'a'\nvar n = 1\ns - n").make_tokens()[0])
+            .parse()
+            .node,
+            context,
+        )
+        self.assertEqual(result.error.pos_start.ln, 2)
+        self.assertEqual(result.error.pos_start.col, 0)
+        self.assertEqual(result.error.pos_end.col, 5)
+        self.assertEqual(global_symbol_table.get("s").pos_start.ln, 0)
+
+    def test_small_ints_are_shared(self):
+        result = (
+            Interpreter()
+            .visit(
+                Parser(
+                    Lexer(
+                        "<stdin>", "1000\n500 + 500\n2000\n1000 * 2\n1.0\n1"
+                    ).make_tokens()[0]
+                )
+                .parse()
+                .node,
+                context,
+            )
+            .value
+        )
+        self.assertIs(result.elements[1], result.elements[0])
+        self.assertIsNot(result.elements[3], result.elements[2])
+        self.assertEqual(repr(result.elements[3]), "2000")
+        self.assertIsNot(result.elements[4], result.elements[5])
+        self.assertEqual(repr(result.elements[4]), "1.0")
+
+    def test_values_have_no_dict(self):
+        text = "1.5\n'a'\n[1]\n{'a': 1}\nfun f() -> 1\nprint"
+        result = Interpreter().visit(
+            Parser(Lexer("<stdin>", text).make_tokens()[0]).parse().node, context
+        )
+        self.assertFalse(hasattr(result, "__dict__"))
+        for value in result.value.elements:
+            with self.subTest(value=value):
+                self.assertFalse(hasattr(value, "__dict__"))
+
+    def test_signals(self):
+        node = Parser(Lexer("<stdin>", "1 + 2").make_tokens()[0]).parse().node
+        self.assertEqual(repr(Interpreter.evaluate(node, context)), "[3]")
+
+        node = Parser(Lexer("<stdin>", "1 + 'a'").make_tokens()[0]).parse().node
+        self.assertRaises(ErrorSignal, Interpreter.evaluate, node, context)
+        self.assertEqual(
+            Interpreter.visit(node, context).error.details, "Illegal operation"
+        )
+
+        text = (
+            "fun f(n)\n    for i = 0 to n then\n        if i == 2 then continue\n"
+            "        if i == 4 then return i * 10\n    end\nendf\n"
+            "var b = while 1 then break\n"
+            "try\n    return 1\nexcept\n    var c = 5\nend\n[f(9), f(3), c]"
+        )
+        node = Parser(Lexer("<stdin>", text).make_tokens()[0]).parse().node
+        result = Interpreter.evaluate(node, context)
+        self.assertEqual(repr(result.elements[-1]), "[40, 0, 5]")
+
+    def test_instances_share_methods(self):
+        text = (
+            "class Shared\n    var count = 0\n    fun Shared(n)\n"
+            "        var this.count = n\n    endf\n"
+            "    fun get() -> this.count\nendc\n"
+            "var first = Shared(1)\nvar second = Shared(2)\n"
+            "var Shared.twice = 5\n[first.get(), second.get(), first.twice]"
+        )
+        node = Parser(Lexer("<stdin>", text).make_tokens()[0]).parse().node
+        result = Interpreter.evaluate(node, context)
+        self.assertEqual(repr(result.elements[-1]), "[1, 2, 5]")
+
+        first = global_symbol_table.get("first")
+        self.assertEqual(
+            set(first.symbol_table.slot_index), {"count", "this", "self"}
+        )
+        self.assertIs(
+            first.get_member("get"), global_symbol_table.get("Shared").get_member("get")
+        )
+
+    def test_instance_shapes(self):
+        text = (
+            "class Cell\n    var value = 0\n    var next = 0\n    fun Cell(v)\n"
+            "        var this.value = v\n    endf\nendc\n"
+            "var head = Cell(1)\nvar head.next = Cell(2)\nvar total = 0\n"
+            "for i = 0 to 3 then var total = total + head.next.value\n"
+            "var head.next.value = 5\nvar head.extra = 7\n"
+            "[total, head.next.value, head.extra, head.value]"
+        )
+        node = Parser(Lexer("<stdin>", text).make_tokens()[0]).parse().node
+        result = Interpreter.evaluate(node, context)
+        self.assertEqual(repr(result.elements[-1]), "[6, 5, 7, 1]")
+
+        head = global_symbol_table.get("head")
+        shape = head.symbol_table.slot_index
+        self.assertIs(head.get_member("next").symbol_table.slot_index, shape)
+        self.assertEqual(head.symbol_table.symbols, {"extra": head.get_member("extra")})
+
+        access = node.element_nodes[4].body_node.value_node.right_node
+        self.assertIs(access.child.cache.shape, shape)
+        self.assertEqual(access.child.child.cache.slot, 0)
+
+    def test_binary_operations(self):
+        text = "7 // 2 + 1\n'ab' + 'cd'\n3 > 2 AND 1 <= 0\n[1] + 2\n'a' * 2"
+        node = Parser(Lexer("<stdin>", text).make_tokens()[0]).parse().node
+        first = node.element_nodes[0]
+        self.assertEqual(first.operation, "added_to")
+        self.assertEqual(first.left_node.operation, "floor_of")
+        self.assertEqual(first.number_operation(7, 2), 9)
+        self.assertIsNone(first.left_node.number_operation(7, 0))
+
+        result = Interpreter.evaluate(node, context)
+        self.assertEqual(repr(result), "[4, abcd, 0, 1, 2, aa]")
+
+        # The errors point at the operand that is wrong
+        for text, col in (("1 / 0", 4), ("'a' - 1", 0), ("1 + 'a'", 0)):
+            with self.subTest(text=text):
+                node = Parser(Lexer("<stdin>", text).make_tokens()[0]).parse().node
+                with self.assertRaises(ErrorSignal) as signal:
+                    Interpreter.evaluate(node, context)
+                self.assertEqual(signal.exception.error.pos_start.col, col)
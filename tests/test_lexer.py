@@ -44,3 +44,48 @@ class TestLexer(unittest.TestCase):
             "[[INT:27, PLUS, LPAREN, INT:43, DIV, INT:36, MINUS, INT:48, RPAREN, MUL, INT:51, "
             "EOF], None]",
         )
+
+    def test_strings(self):
+        tokens, error = Lexer("<stdin>", "'a\\tb' \"c\nd\" e").make_tokens()
+        self.assertEqual(str(tokens), "[STRING:a\tb, STRING:c\nd, IDENTIFIER:e, EOF]")
+        self.assertEqual(tokens[0].pos_end.col, 6)
+        self.assertEqual((tokens[2].pos_start.ln, tokens[2].pos_start.col), (1, 3))
+
+    def test_positions(self):
+        tokens, error = Lexer("<stdin>", "var a = 1\n  a >= 2.5").make_tokens()
+        self.assertEqual(
+            [(token.pos_start.ln, token.pos_start.col) for token in tokens],
+            [(0, 0), (0, 4), (0, 6), (0, 8), (0, 9), (1, 2), (1, 4), (1, 7), (1, 10)],
+        )
+        self.assertEqual(
+            [token.pos_end.col for token in tokens], [3, 5, 7, 9, 10, 3, 6, 10, 11]
+        )
+
+    def test_lazy_positions(self):
+        tokens, error = Lexer("<stdin>", "a\nb").make_tokens()
+        source = tokens[0].source
+        self.assertTrue(all(token.source is source for token in tokens))
+        # Lines are only found when a position is shown
+        self.assertIsNone(source.line_starts)
+        self.assertEqual((tokens[1].pos_end.ln, tokens[1].pos_end.col), (0, 2))
+        self.assertEqual((tokens[2].pos_start.ln, tokens[2].pos_start.col), (1, 0))
+        self.assertEqual(source.line_starts, [0, 2])
+
+    def test_iter_tokens(self):
+        lexer = Lexer("<stdin>", "a + 1 $ b")
+        tokens = lexer.iter_tokens()
+        self.assertEqual(str(next(tokens)), "IDENTIFIER:a")
+        # Tokens are only made when they are needed
+        self.assertEqual(lexer.idx, 0)
+        # After an error, the tokens end with EOF
+        self.assertEqual(str(list(tokens)), "[PLUS, INT:1, EOF]")
+        self.assertEqual(lexer.error.error_name, "Illegal Character")
+
+    def test_bytes(self):
+        # Mapped files are lexed as UTF-8 bytes, columns still count characters
+        tokens, error = Lexer("<stdin>", "'日本' + \"é\\té\"".encode()).make_tokens()
+        self.assertEqual(str(tokens), "[STRING:日本, PLUS, STRING:é\té, EOF]")
+        self.assertEqual([token.pos_start.col for token in tokens], [0, 5, 7, 13])
+        tokens, error = Lexer("<stdin>", "a é").make_tokens()
+        self.assertEqual(error.details, "'é'")
+        self.assertEqual((error.pos_start.col, error.pos_end.col), (2, 3))
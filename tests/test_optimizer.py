@@ -0,0 +1,127 @@
+import unittest
+import tempfile
+
+import sys
+import os
+
+current_file = os.path.realpath(__file__)
+current_dir_tests = os.path.dirname(current_file)
+parent_dir_parent_directory = os.path.dirname(current_dir_tests)
+sys.path.insert(0, parent_dir_parent_directory)
+
+from TechZen import nodes_, optimizer_
+from TechZen.lexer_ import Lexer
+from TechZen.parser_ import Parser
+from TechZen.optimizer_ import Optimizer
+from TechZen.runner import BACKENDS
+from TechZen.global_symbol_table_ import global_symbol_table
+from TechZen.types.number_ import Number
+from tests.test_compiler import run
+
+# Programs with constants, with the output they print
+FOLDED_PROGRAMS = [
+    "print(2 * 60 * 60 + (24 - 1) * 60)\nprint(7 // 2)\nprint(1 / 4)",
+    "print('ab' + 'cd')\nprint('ab' * 3)\nprint(['x' == 'x', 1 < 2 AND 3 > 4, NOT 0])",
+    "if FALSE then print(1) elif 1 == 1 then print(2) else print(3)",
+    "var a = if 0 then 1 elif TRUE then 2\nprint(a)\nprint(if 1 then\n    5\nend)",
+    "fun f(n) -> n * (3 + 4)\nprint(f(2))\nprint(2 ^ 100)\nprint(2 ^ 0.5)",
+]
+
+
+def optimize(text):
+    node = Parser(Lexer("<stdin>", text).make_tokens()[0]).parse().node
+    return Optimizer.optimize(node)
+
+
+class TestOptimizer(unittest.TestCase):
+    def test_fold(self):
+        folded = optimizer_.folded
+        program = optimize("2 * 60 * 60\n'a' + 'b'\n1 / 0\nx * 2\n'a' - 1\n- (2 + 3)")
+        statements = program.element_nodes
+        self.assertEqual(optimizer_.folded - folded, 5)
+
+        self.assertIsInstance(statements[0], nodes_.NumberNode)
+        self.assertEqual(statements[0].constant.value, 7200)
+        self.assertEqual(statements[0].pos_start.idx, 0)
+        self.assertEqual(statements[0].pos_end.idx, 11)
+        self.assertIsInstance(statements[1], nodes_.StringNode)
+        self.assertEqual(statements[1].token.value, "ab")
+        self.assertIsInstance(statements[5], nodes_.NumberNode)
+        self.assertEqual(statements[5].constant.value, -5)
+
+        # Errors are raised when they run
+        self.assertIsInstance(statements[2], nodes_.BinOpNode)
+        self.assertIsInstance(statements[3], nodes_.BinOpNode)
+        self.assertIsInstance(statements[4], nodes_.BinOpNode)
+
+    def test_too_big(self):
+        statements = optimize("2 ^ 100000\n'ab' * 100000\n2 ^ 10").element_nodes
+        self.assertIsInstance(statements[0], nodes_.BinOpNode)
+        self.assertIsInstance(statements[1], nodes_.BinOpNode)
+        self.assertEqual(statements[2].constant.value, 1024)
+
+    def test_dead_cases(self):
+        folded = optimizer_.folded
+        node = optimize(
+            "if 0 then 1 elif x then 2 elif 2 > 1 then 3 elif y then 4 else 5"
+        ).element_nodes[0]
+        self.assertEqual(len(node.cases), 1)
+        self.assertEqual(node.cases[0][0].var_name_token.value, "x")
+        self.assertEqual(node.else_case[0].constant.value, 3)
+        # 2 > 1, the case of 0, the case of 2 > 1, the case after it and the else case
+        self.assertEqual(optimizer_.folded - folded, 5)
+
+    def test_disabled(self):
+        optimizer_.enabled = False
+        try:
+            statement = optimize("1 + 2").element_nodes[0]
+        finally:
+            optimizer_.enabled = True
+        self.assertIsInstance(statement, nodes_.BinOpNode)
+
+    def test_names_are_not_folded(self):
+        statements = optimize("TRUE\nFALSE + 1\nif NULL then 1").element_nodes
+        self.assertIsInstance(statements[0], nodes_.VarAccessNode)
+        self.assertIsInstance(statements[1], nodes_.BinOpNode)
+        self.assertEqual(len(statements[2].cases), 1)
+
+    def test_names_set_by_other_files(self):
+        # Files that are run or included set TRUE while the program runs
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.addCleanup(global_symbol_table.set, "TRUE", Number.true)
+        run_file = os.path.join(directory.name, "b.techzen")
+        with open(run_file, "w") as f:
+            f.write("var TRUE = 5")
+        include_file = os.path.join(directory.name, "inc.techzen")
+        with open(include_file, "w") as f:
+            f.write("fun TRUE() -> 7")
+
+        for backend in BACKENDS:
+            with self.subTest(backend=backend):
+                global_symbol_table.set("TRUE", Number.true)
+                output, _, error, _ = run(
+                    "<stdin>",
+                    f'run("{run_file}")\nprint(TRUE)\nvar x = TRUE + 1\nprint(x)',
+                    backend,
+                )
+                self.assertIsNone(error)
+                self.assertEqual(output, "5\n6\n")
+
+                output, _, error, _ = run(
+                    "<stdin>", f'include "{include_file}"\nprint(TRUE)', backend
+                )
+                self.assertIsNone(error)
+                self.assertEqual(output, "<function TRUE>\n")
+
+    def test_same_output(self):
+        for program in FOLDED_PROGRAMS:
+            for backend in BACKENDS:
+                with self.subTest(program=program, backend=backend):
+                    optimizer_.enabled = False
+                    try:
+                        expected = run("<stdin>", program, backend)
+                    finally:
+                        optimizer_.enabled = True
+                    self.assertIsNone(expected[2])
+                    self.assertEqual(run("<stdin>", program, backend), expected)
@@ -10,6 +10,7 @@ sys.path.insert(0, parent_dir_parent_directory)
 
 from TechZen.lexer_ import Lexer
 from TechZen.parser_ import Parser
+from TechZen import nodes_
 
 
 class TestParser(unittest.TestCase):
@@ -171,3 +172,72 @@ class TestParser(unittest.TestCase):
         self.assertEqual(
             str(node.element_nodes[0])[:35], "<TechZen.nodes_.CallNode object at "
         )
+
+    def test_nodes_have_no_dict(self):
+        node = (
+            Parser(Lexer("<stdin>", "fun f(a) -> a.b + 1").make_tokens()[0])
+            .parse()
+            .node
+        )
+        self.assertFalse(hasattr(node, "__dict__"))
+        self.assertFalse(hasattr(node.element_nodes[0].body_node, "__dict__"))
+        self.assertFalse(hasattr(node.pos_start, "__dict__"))
+        for name, node_class in vars(nodes_).items():
+            if name.endswith("Node"):
+                with self.subTest(node_class=name):
+                    self.assertNotIn("__dict__", dir(node_class))
+
+    def test_precedence(self):
+        node = (
+            Parser(Lexer("<stdin>", "1 + 2 * 3 ^ 2 ^ 2 - 4 % 5").make_tokens()[0])
+            .parse()
+            .node
+        )
+        self.assertEqual(
+            str(node.element_nodes),
+            "[((INT:1, PLUS, (INT:2, MUL, (INT:3, POW, (INT:2, POW, INT:2)))), MINUS, "
+            "(INT:4, MOD, INT:5))]",
+        )
+
+        node = Parser(Lexer("<stdin>", "- 2 ^ 2 * 3").make_tokens()[0]).parse().node
+        self.assertEqual(
+            str(node.element_nodes), "[((MINUS, (INT:2, POW, INT:2)), MUL, INT:3)]"
+        )
+
+        node = (
+            Parser(Lexer("<stdin>", "NOT 1 == 2 AND 3 < 4 OR 5").make_tokens()[0])
+            .parse()
+            .node
+        )
+        self.assertEqual(
+            str(node.element_nodes),
+            "[(((KEYWORD:NOT, (INT:1, EE, INT:2)), KEYWORD:AND, (INT:3, LT, INT:4)), "
+            "KEYWORD:OR, INT:5)]",
+        )
+
+    def test_operand_errors(self):
+        error = Parser(Lexer("<stdin>", "1 AND )").make_tokens()[0]).parse().error
+        self.assertEqual(
+            error.details,
+            "Expected int, float, identifier, '+', '-', '[', '(', or 'NOT'",
+        )
+        error = Parser(Lexer("<stdin>", "1 < NOT 2").make_tokens()[0]).parse().error
+        self.assertEqual(error.pos_start.col, 4)
+
+    def test_statement_errors(self):
+        # The error of a later statement is reported where it is, not at the start of the statement
+        error = Parser(Lexer("<stdin>", "1\n2 +").make_tokens()[0]).parse().error
+        self.assertEqual((error.pos_start.ln, error.pos_start.col), (1, 3))
+
+        # 'TRY' without 'EXCEPT' ends at the end of the file instead of skipping tokens forever
+        error = Parser(Lexer("<stdin>", "try\nprint(1)").make_tokens()[0]).parse().error
+        self.assertEqual(error.details, "Expected 'EXCEPT'")
+        self.assertEqual((error.pos_start.ln, error.pos_start.col), (1, 8))
+
+    def test_iter_parse(self):
+        tokens = Lexer("<stdin>", "var a = 1\n\nprint(a)\n2 +").iter_tokens()
+        results = list(Parser(tokens).iter_parse())
+        self.assertEqual(len(results), 3)
+        self.assertEqual(str(results[0].node.value_node), "INT:1")
+        self.assertIsNone(results[1].error)
+        self.assertEqual(results[2].error.details[:8], "Expected")
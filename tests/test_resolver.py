@@ -0,0 +1,139 @@
+import unittest
+
+import sys
+import os
+
+current_file = os.path.realpath(__file__)
+current_dir_tests = os.path.dirname(current_file)
+parent_dir_parent_directory = os.path.dirname(current_dir_tests)
+sys.path.insert(0, parent_dir_parent_directory)
+
+from TechZen.lexer_ import Lexer
+from TechZen.parser_ import Parser
+from TechZen.resolver_ import Resolver
+from TechZen.runner import BACKENDS
+from TechZen.symbol_table_ import SymbolTable
+from tests.test_compiler import run
+
+# Programs whose variables are found through the caller's table, with their last value
+SCOPE_PROGRAMS = [
+    ("fun g() -> y\nfun f(y) -> g()\nf(5)", "5"),
+    (
+        "var x = 1\nfun f()\n    var a = x\n    var x = 2\n    return a + x\nendf\nf()",
+        "3",
+    ),
+    (
+        "fun outer(n)\n    fun inner(m) -> m + n\n    return inner(1)\nendf\nouter(4)",
+        "5",
+    ),
+    (
+        "fun total(n)\n    var t = 0\n    for i = 0 to n then\n        var t = t + i\n"
+        "    end\n    return t\nendf\ntotal(5)",
+        "10",
+    ),
+    (
+        "class C\n    fun C(v)\n        var this.v = v\n    endf\n"
+        "    fun get() -> v\nendc\nfun f(c) -> c.get()\nf(C(3))",
+        "3",
+    ),
+]
+
+
+def resolve(text):
+    node = Parser(Lexer("<stdin>", text).make_tokens()[0]).parse().node
+    return Resolver.resolve(node)
+
+
+class TestResolver(unittest.TestCase):
+    def test_slots(self):
+        func_def = resolve("fun f(a)\n    var b = a + c\n    b\nendf").element_nodes[0]
+        statements = func_def.body_node.element_nodes
+        self.assertEqual(func_def.slot_index, {"a": 0, "b": 1})
+        self.assertEqual(statements[0].slot, 1)
+        self.assertEqual(statements[0].value_node.left_node.slot, 0)
+        self.assertTrue(statements[0].value_node.right_node.is_global)
+        self.assertEqual(statements[1].slot, 1)
+        self.assertIn("b", SymbolTable.nested_names)
+
+    def test_names_outside_functions(self):
+        program = resolve("var a = 1\na\nfun f(p) -> p.a")
+        self.assertIsNone(program.element_nodes[0].slot)
+        self.assertIsNone(program.element_nodes[1].slot)
+        self.assertFalse(program.element_nodes[1].is_global)
+
+        member = program.element_nodes[2].body_node.child
+        self.assertIsNone(member.slot)
+        self.assertFalse(member.is_global)
+
+    def test_scopes(self):
+        for program, value in SCOPE_PROGRAMS:
+            for backend in BACKENDS:
+                with self.subTest(program=program, backend=backend):
+                    _, result, error, _ = run("<stdin>", program, backend)
+                    self.assertIsNone(error)
+                    self.assertEqual(result.rsplit(", ", 1)[-1], value + "]")
+
+    def test_global_shadowed_later(self):
+        for backend in BACKENDS:
+            with self.subTest(backend=backend):
+                _, result, _, _ = run(
+                    "<stdin>",
+                    "var resolver_value = 1\nfun read_value() -> resolver_value\n"
+                    "read_value()",
+                    backend,
+                )
+                self.assertEqual(result.rsplit(", ", 1)[-1], "1]")
+
+                # A function resolved later gives the name a slot, so it is no longer read from the global table
+                _, result, _, _ = run(
+                    "<stdin>",
+                    "fun shadow(resolver_value) -> read_value()\nshadow(7)",
+                    backend,
+                )
+                self.assertEqual(result.rsplit(", ", 1)[-1], "7]")
+
+    def test_tail_calls(self):
+        text = (
+            "fun f(n) -> if n == 0 then f else f(n - 1)\n"
+            "fun g(n)\n    if n == 0 then return g(1) + 1\n"
+            "    try\n        return g(n - 1)\n    except\n        return 0\n    end\n"
+            "    return g(n - 1)\nendf\n"
+            "fun h(n) -> f(n)"
+        )
+        f, g, h = resolve(text).element_nodes
+        self.assertIs(f.body_node.else_case[0].tail_body, f.body_node)
+
+        statements = g.body_node.element_nodes
+        self.assertIsNone(statements[0].cases[0][1].node_to_return.left_node.tail_body)
+        try_return = statements[1].try_statements.element_nodes[0]
+        self.assertIsNone(try_return.node_to_return.tail_body)
+        self.assertIs(statements[2].node_to_return.tail_body, g.body_node)
+
+        # Only calls of the function to itself
+        self.assertIsNone(h.body_node.tail_body)
+
+    def test_deep_tail_calls(self):
+        depth = sys.getrecursionlimit() * 2
+        text = (
+            "fun count(n, acc) -> if n == 0 then acc else count(n - 1, acc + 1)\n"
+            "fun down(n)\n    var m = n - 1\n    if n == 0 then return m\n"
+            f"    return down(m)\nendf\n[count({depth}, 0), down({depth})]"
+        )
+        for backend in BACKENDS:
+            with self.subTest(backend=backend):
+                _, result, error, _ = run("<stdin>", text, backend)
+                self.assertIsNone(error)
+                self.assertEqual(
+                    result, f"[<function count>, <function down>, {depth}, -1]"
+                )
+
+    def test_tail_call_rebound(self):
+        text = (
+            "fun f(n) -> if n == 0 then 0 else f(n - 1)\nvar g = f\n"
+            "fun f(n) -> n + 100\ng(3)"
+        )
+        for backend in BACKENDS:
+            with self.subTest(backend=backend):
+                _, result, error, _ = run("<stdin>", text, backend)
+                self.assertIsNone(error)
+                self.assertEqual(result.rsplit(", ", 1)[-1], "102]")
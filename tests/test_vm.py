@@ -0,0 +1,122 @@
+import unittest
+
+import sys
+import os
+import tempfile
+
+current_file = os.path.realpath(__file__)
+current_dir_tests = os.path.dirname(current_file)
+parent_dir_parent_directory = os.path.dirname(current_dir_tests)
+sys.path.insert(0, parent_dir_parent_directory)
+
+from TechZen.lexer_ import Lexer
+from TechZen.parser_ import Parser
+from TechZen import vm_
+from TechZen.bytecode_ import BytecodeCompiler
+from tests.test_compiler import PROGRAMS, FILE_TESTS, run
+
+CONTROL_FLOW_PROGRAMS = [
+    "for i = 0 to 5 then\n    try\n        break\n    except\n        print(i)\n    end\nend",
+    "try\nexit()\nexcept\nprint('caught')\nend\nprint('after')",
+    "exit()\nprint('never')",
+    "fun g()\n    break\nendf\nfor i = 0 to 5 then\n    print(i)\n    g()\nend",
+    "fun h(x) -> x + 'a'\nfun k() -> h(1)\nk()",
+    "return 5",
+    "class P\n    fun P(a)\n        var this.a = a\n    endf\n    fun get() -> this.a\n"
+    "    fun twice() -> this.get() * 2\nendc\nvar p = P(4)\np.twice()",
+    "5()",
+    "fun a(x) -> x\na(1, 2)",
+    "var x = 1\nx.y",
+]
+
+
+class TestVM(unittest.TestCase):
+    def test_programs(self):
+        for program in PROGRAMS + CONTROL_FLOW_PROGRAMS:
+            with self.subTest(program=program):
+                self.assertEqual(
+                    run("<stdin>", program, "vm"), run("<stdin>", program, "tree")
+                )
+
+    def test_file_tests(self):
+        for file_name in sorted(os.listdir(FILE_TESTS)):
+            if not file_name.endswith(".techzen"):
+                continue
+            with self.subTest(file_name=file_name):
+                with open(os.path.join(FILE_TESTS, file_name), "r") as f:
+                    script = f.read()
+                self.assertEqual(
+                    run(file_name, script, "vm"), run(file_name, script, "tree")
+                )
+
+    def test_deep_recursion(self):
+        depth = sys.getrecursionlimit() * 2
+        _, value, error, _ = run(
+            "<stdin>",
+            f"fun f(n) -> if n == 0 then 0 else 1 + f(n - 1)\nf({depth})",
+            "vm",
+        )
+        self.assertIsNone(error)
+        self.assertEqual(value, f"[<function f>, {depth}]")
+
+    def test_deep_recursion_in_included_file(self):
+        depth = sys.getrecursionlimit() * 2
+        with tempfile.TemporaryDirectory() as directory:
+            fn = os.path.join(directory, "deep.techzen")
+            with open(fn, "w") as f:
+                f.write("fun deep(n) -> if n == 0 then 0 else 1 + deep(n - 1)")
+            # Included by the tree interpreter first, the VM loads the file again
+            self.assertIsNone(run("<stdin>", f'include "{fn}"', "tree")[2])
+            _, value, error, _ = run("<stdin>", f'include "{fn}"\ndeep({depth})', "vm")
+        self.assertIsNone(error)
+        self.assertEqual(value, f"[0, {depth}]")
+
+    def test_deep_recursion_in_function_of_other_backend(self):
+        depth = sys.getrecursionlimit() * 2
+        with tempfile.TemporaryDirectory() as directory:
+            fn = os.path.join(directory, "deep.techzen")
+            with open(fn, "w") as f:
+                f.write(
+                    "fun deep(n) -> if n == 0 then 0 else 1 + deep(n - 1)\n"
+                    "class Deep\n    fun Deep(n)\n        var this.n = deep(n)\n"
+                    "    endf\nendc"
+                )
+            # run() runs the file with the tree interpreter, the VM compiles its functions when they are called
+            _, value, error, _ = run(
+                "<stdin>",
+                f'run("{fn}")\ndeep({depth})\nvar d = Deep({depth})\nd.n',
+                "vm",
+            )
+        self.assertIsNone(error)
+        self.assertEqual(value, f"[0, {depth}, <instance of class Deep>, {depth}]")
+
+    def test_max_depth(self):
+        text = "fun f(n) -> if n == 0 then 0 else 1 + f(n - 1)\nf(100)"
+        max_depth = vm_.max_depth
+        vm_.max_depth = 50
+        try:
+            _, value, error, _ = run("<stdin>", text, "vm")
+        finally:
+            vm_.max_depth = max_depth
+        self.assertEqual(value, "None")
+        self.assertIn("Runtime Error: Maximum recursion depth exceeded", error)
+        # The program frame and 49 frames of f, the line of f is only shown three times
+        self.assertIn("in f\n  [Previous line repeated 46 more times]\n", error)
+
+        _, value, error, _ = run("<stdin>", text, "vm")
+        self.assertIsNone(error)
+
+    def test_disassemble(self):
+        node = Parser(Lexer("<stdin>", "var a = 1 + 2").make_tokens()[0]).parse().node
+        listing = BytecodeCompiler.compile_program(node).disassemble()
+        self.assertEqual(
+            [line.split()[1] for line in listing.splitlines()],
+            [
+                "LOAD_CONST",
+                "LOAD_CONST",
+                "BINARY_ADD",
+                "STORE_NAME",
+                "BUILD_LIST",
+                "END",
+            ],
+        )